@@ -34,6 +34,7 @@ from .automod import *
 from .bot import *
 from .channel import *
 from .client import *
+from .cluster import *
 from .cog import *
 from .colour import *
 from .commands import *
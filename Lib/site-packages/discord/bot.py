@@ -29,8 +29,11 @@ import asyncio
 import collections
 import collections.abc
 import copy
+import hashlib
 import inspect
+import json
 import logging
+import os
 import sys
 import traceback
 from abc import ABC, abstractmethod
@@ -85,6 +88,7 @@ class ApplicationCommandMixin(ABC):
         super().__init__(*args, **kwargs)
         self._pending_application_commands = []
         self._application_commands = {}
+        self._command_sync_cache: dict[str, dict[str, Any]] | None = None
 
     @property
     def all_commands(self):
@@ -220,6 +224,47 @@ class ApplicationCommandMixin(ABC):
                     return
                 return command
 
+    @staticmethod
+    def _hash_command_payloads(payloads: list[dict[str, Any]]) -> str:
+        # Canonical form: commands ordered by (type, name), keys sorted, no whitespace.
+        ordered = sorted(payloads, key=lambda p: (p.get("type", 1), p["name"]))
+        encoded = json.dumps(
+            ordered, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _get_command_sync_cache(self) -> dict[str, Any] | None:
+        path = self._bot.command_sync_cache
+        if path is None or self._bot.user is None:
+            return None
+
+        if self._command_sync_cache is None:
+            try:
+                with open(path, encoding="utf-8") as fp:
+                    self._command_sync_cache = json.load(fp)
+            except FileNotFoundError:
+                self._command_sync_cache = {}
+            except (OSError, ValueError):
+                _log.warning(
+                    "Ignoring unreadable command sync cache %s", path, exc_info=True
+                )
+                self._command_sync_cache = {}
+
+        return self._command_sync_cache.setdefault(str(self._bot.user.id), {})
+
+    def _save_command_sync_cache(self) -> None:
+        path = self._bot.command_sync_cache
+        if path is None or self._command_sync_cache is None:
+            return
+
+        tmp = f"{os.fspath(path)}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fp:
+                json.dump(self._command_sync_cache, fp, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError:
+            _log.warning("Failed to write command sync cache %s", path, exc_info=True)
+
     async def get_desynced_commands(
         self,
         guild_id: int | None = None,
@@ -520,7 +565,30 @@ class ApplicationCommandMixin(ABC):
 
         pending_actions = []
 
-        if not force:
+        cache = self._get_command_sync_cache()
+        cache_key = "global" if is_global else str(guild_id)
+        payload_hash = None
+        if cache is not None:
+            payload_hash = self._hash_command_payloads(
+                [cmd.to_dict() for cmd in pending]
+            )
+
+        if (
+            not force
+            and pending
+            and cache is not None
+            and cache.get(cache_key, {}).get("hash") == payload_hash
+        ):
+            # Nothing changed since the last successful sync of this scope,
+            # so there is no need to ask Discord for its copy of the commands.
+            # Scopes without commands are only synced to find commands to
+            # unregister, which the hash cannot tell, so they are never skipped.
+            _log.debug(
+                "Skipping command sync for %s: payload hash unchanged",
+                "global commands" if is_global else f"guild {guild_id}",
+            )
+            registered = cache[cache_key]["commands"]
+        elif not force:
             prefetched_commands: list[interactions.ApplicationCommand] = []
             if self._bot.user:
                 if guild_id is None:
@@ -660,6 +728,20 @@ class ApplicationCommandMixin(ABC):
             cmd.id = i["id"]
             self._application_commands[cmd.id] = cmd
 
+        if cache is not None:
+            cache[cache_key] = {
+                "hash": payload_hash,
+                "commands": [
+                    {
+                        key: i[key]
+                        for key in ("id", "name", "type", "guild_id")
+                        if i.get(key) is not None
+                    }
+                    for i in registered
+                ],
+            }
+            self._save_command_sync_cache()
+
         return registered
 
     async def sync_commands(
@@ -1155,6 +1237,7 @@ class BotBase(ApplicationCommandMixin, CogMixin, ABC):
         self.owner_id = options.get("owner_id")
         self.owner_ids = options.get("owner_ids", set())
         self.auto_sync_commands = options.get("auto_sync_commands", True)
+        self.command_sync_cache = options.get("command_sync_cache")
 
         self.debug_guilds = options.pop("debug_guilds", None)
 
@@ -1447,6 +1530,14 @@ class Bot(BotBase, Client):
         :attr:`.process_application_commands` if the command is not found. Defaults to ``True``.
 
         .. versionadded:: 2.0
+    command_sync_cache: Optional[Union[:class:`str`, :class:`os.PathLike`]]
+        Path to a JSON file holding a hash of the command payloads from the last successful sync
+        of each scope (global or per guild). When the hash of the pending commands matches, the
+        sync of that scope is skipped without any API calls. Commands edited outside of this bot
+        are not detected while the cache is valid; pass ``force=True`` to :meth:`~.Bot.sync_commands`
+        or delete the file to resync. Defaults to ``None`` (no cache).
+
+        .. versionadded:: 2.6
     """
 
     @property
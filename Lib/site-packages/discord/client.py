@@ -80,6 +80,59 @@ Coro = TypeVar("Coro", bound=Callable[..., Coroutine[Any, Any, Any]])
 _log = logging.getLogger(__name__)
 
 
+def _message_keys(message: Message, *_: Any) -> dict[str, Any]:
+    return {"channel_id": message.channel.id, "message_id": message.id}
+
+
+def _message_edit_keys(before: Message, after: Message) -> dict[str, Any]:
+    return _message_keys(after)
+
+
+def _reaction_keys(reaction: Any, *_: Any) -> dict[str, Any]:
+    return _message_keys(reaction.message)
+
+
+def _raw_reaction_keys(payload: Any) -> dict[str, Any]:
+    return {"channel_id": payload.channel_id, "message_id": payload.message_id}
+
+
+def _interaction_keys(interaction: Any) -> dict[str, Any]:
+    return {
+        "channel_id": interaction.channel_id,
+        "message_id": interaction.message_id,
+        "custom_id": interaction.custom_id,
+    }
+
+
+def _typing_keys(channel: Any, *_: Any) -> dict[str, Any]:
+    return {"channel_id": channel.id}
+
+
+_MESSAGE_KEYS = frozenset(("channel_id", "message_id"))
+
+# Events that :meth:`Client.wait_for` can index waiters for, mapped to a function
+# that extracts the lookup keys from the event arguments and the keys it provides.
+_WAIT_FOR_KEYS: dict[str, tuple[Callable[..., dict[str, Any]], frozenset[str]]] = {
+    "message": (_message_keys, _MESSAGE_KEYS),
+    "message_delete": (_message_keys, _MESSAGE_KEYS),
+    "message_edit": (_message_edit_keys, _MESSAGE_KEYS),
+    "reaction_add": (_reaction_keys, _MESSAGE_KEYS),
+    "reaction_remove": (_reaction_keys, _MESSAGE_KEYS),
+    "raw_reaction_add": (_raw_reaction_keys, _MESSAGE_KEYS),
+    "raw_reaction_remove": (_raw_reaction_keys, _MESSAGE_KEYS),
+    "interaction": (_interaction_keys, _MESSAGE_KEYS | {"custom_id"}),
+    "typing": (_typing_keys, frozenset(("channel_id",))),
+}
+
+# the most selective key a waiter is indexed by wins
+_WAIT_FOR_KEY_ORDER = ("custom_id", "message_id", "channel_id")
+
+# event name: handler method name, shared by all clients
+_event_methods: dict[str, str] = {}
+# bots dispatching custom events with generated names must not grow it without bound
+_EVENT_METHODS_LIMIT: int = 1024
+
+
 def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
     tasks = {t for t in asyncio.all_tasks(loop=loop) if not t.done()}
 
@@ -129,6 +182,13 @@ class Client:
 
         .. versionchanged:: 1.3
             Allow disabling the message cache and change the default size to ``1000``.
+    max_messages_bytes: Optional[:class:`int`]
+        An approximate memory budget in bytes for the internal message cache. When set,
+        the oldest messages are evicted once the estimated size of the cache exceeds it,
+        instead of once it holds ``max_messages`` messages. Has no effect if the message
+        cache is disabled. Defaults to ``None``.
+
+        .. versionadded:: 2.6
     loop: Optional[:class:`asyncio.AbstractEventLoop`]
         The :class:`asyncio.AbstractEventLoop` to use for asynchronous operations.
         Defaults to ``None``, in which case the default event loop is used via
@@ -157,6 +217,13 @@ class Client:
         currently selected intents.
 
         .. versionadded:: 1.5
+    member_cache_limit: Optional[:class:`int`]
+        The maximum number of :class:`Member` objects to keep per guild. Once a guild
+        holds more, the least recently used members are kept in a compact form
+        without their activities and are rebuilt when next accessed through
+        :meth:`Guild.get_member` or :attr:`Guild.members`. Defaults to ``None`` (no limit).
+
+        .. versionadded:: 2.6
     chunk_guilds_at_startup: :class:`bool`
         Indicates if :func:`.on_ready` should be delayed to chunk all guilds
         at start-up if necessary. This operation is incredibly slow for large
@@ -164,6 +231,12 @@ class Client:
         is ``True``.
 
         .. versionadded:: 1.5
+    chunk_concurrency: Optional[:class:`int`]
+        The maximum number of guilds whose members are requested at the same time while
+        chunking at start-up. Guilds with interactions or member joins are chunked first.
+        Defaults to two per shard.
+
+        .. versionadded:: 2.6
     status: Optional[:class:`.Status`]
         A status to start your presence with upon logging on to Discord.
     activity: Optional[:class:`.BaseActivity`]
@@ -198,6 +271,13 @@ class Client:
         To enable these events, this must be set to ``True``. Defaults to ``False``.
 
         .. versionadded:: 2.0
+    skip_unobserved_events: :class:`bool`
+        Whether to skip parsing gateway events that do not update the internal cache
+        (such as typing, invites, bans, integrations and audit log entries) when no event
+        handler, listener or :meth:`wait_for` is registered for any event they dispatch.
+        Defaults to ``True``.
+
+        .. versionadded:: 2.6
 
     Attributes
     -----------
@@ -221,6 +301,13 @@ class Client:
         self._listeners: dict[str, list[tuple[asyncio.Future, Callable[..., bool]]]] = (
             {}
         )
+        self._keyed_listeners: dict[
+            str,
+            dict[
+                tuple[str, Any],
+                list[tuple[asyncio.Future, Callable[..., bool], dict[str, Any]]],
+            ],
+        ] = {}
         self.shard_id: int | None = options.get("shard_id")
         self.shard_count: int | None = options.get("shard_count")
 
@@ -342,9 +429,14 @@ class Client:
     def cached_messages(self) -> Sequence[Message]:
         """Read-only list of messages the connected client has cached.
 
+        This is a view of the cache rather than a copy, so it is cheap to get and
+        reflects messages cached afterwards. Iterating over it is fast, but
+        indexing takes time proportional to the position.
+
         .. versionadded:: 1.1
         """
-        return utils.SequenceProxy(self._connection._messages or [])
+        messages = self._connection._messages
+        return utils.SequenceProxy(messages if messages is not None else [])
 
     @property
     def private_channels(self) -> list[PrivateChannel]:
@@ -417,9 +509,80 @@ class Client:
         # Schedules the task
         return asyncio.create_task(wrapped, name=f"pycord: {event_name}")
 
+    def _has_listeners(self, event: str) -> bool:
+        if type(self).dispatch is not Client.dispatch:
+            # a custom dispatch may consume any event
+            return True
+
+        method = f"on_{event}"
+        return (
+            event in self._listeners
+            or event in self._keyed_listeners
+            or bool(self._event_handlers.get(method))
+            or hasattr(self, method)
+        )
+
+    @staticmethod
+    def _resolve_waiter(
+        future: asyncio.Future, condition: Callable[..., bool], args: tuple[Any, ...]
+    ) -> bool:
+        try:
+            result = condition(*args)
+        except Exception as exc:
+            future.set_exception(exc)
+            return True
+
+        if not result:
+            return False
+        if len(args) == 0:
+            future.set_result(None)
+        elif len(args) == 1:
+            future.set_result(args[0])
+        else:
+            future.set_result(args)
+        return True
+
+    def _dispatch_keyed(self, event: str, args: tuple[Any, ...]) -> None:
+        keyed = self._keyed_listeners[event]
+        keys = _WAIT_FOR_KEYS[event][0](*args)
+        for kind, value in keys.items():
+            waiters = keyed.get((kind, value))
+            if not waiters:
+                continue
+            # resolving a waiter removes it from the list through its done callback
+            for future, condition, filters in waiters.copy():
+                if future.done():
+                    continue
+                if any(keys.get(k) != v for k, v in filters.items()):
+                    continue
+                self._resolve_waiter(future, condition, args)
+
+    def _remove_keyed_waiter(
+        self, event: str, key: tuple[str, Any], future: asyncio.Future
+    ) -> None:
+        keyed = self._keyed_listeners.get(event)
+        waiters = keyed and keyed.get(key)
+        if not waiters:
+            return
+        for i, entry in enumerate(waiters):
+            if entry[0] is future:
+                del waiters[i]
+                break
+        if not waiters:
+            del keyed[key]
+            if not keyed:
+                del self._keyed_listeners[event]
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug("Dispatching event %s", event)
-        method = f"on_{event}"
+        method = _event_methods.get(event)
+        if method is None:
+            if len(_event_methods) >= _EVENT_METHODS_LIMIT:
+                _event_methods.clear()
+            method = _event_methods[event] = f"on_{event}"
+
+        if event in self._keyed_listeners:
+            self._dispatch_keyed(event, args)
 
         listeners = self._listeners.get(event)
         if listeners:
@@ -429,20 +592,8 @@ class Client:
                     removed.append(i)
                     continue
 
-                try:
-                    result = condition(*args)
-                except Exception as exc:
-                    future.set_exception(exc)
+                if self._resolve_waiter(future, condition, args):
                     removed.append(i)
-                else:
-                    if result:
-                        if len(args) == 0:
-                            future.set_result(None)
-                        elif len(args) == 1:
-                            future.set_result(args[0])
-                        else:
-                            future.set_result(args)
-                        removed.append(i)
 
             if len(removed) == len(listeners):
                 self._listeners.pop(event)
@@ -1084,6 +1235,9 @@ class Client:
         *,
         check: Callable[..., bool] | None = None,
         timeout: float | None = None,
+        channel_id: int | None = None,
+        message_id: int | None = None,
+        custom_id: str | None = None,
     ) -> Any:
         """|coro|
 
@@ -1116,6 +1270,25 @@ class Client:
         timeout: Optional[:class:`float`]
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        channel_id: Optional[:class:`int`]
+            Only wait for events from the channel with this ID.
+
+            Unlike filtering in ``check``, the waiter is indexed by this key
+            so dispatching does not have to evaluate every pending waiter.
+            Supported by the ``message``, ``message_edit``, ``message_delete``,
+            ``reaction_add``, ``reaction_remove``, ``raw_reaction_add``,
+            ``raw_reaction_remove``, ``interaction`` and ``typing`` events.
+
+            .. versionadded:: 2.6
+        message_id: Optional[:class:`int`]
+            Only wait for events concerning the message with this ID. Supported
+            by the same events as ``channel_id`` except ``typing``.
+
+            .. versionadded:: 2.6
+        custom_id: Optional[:class:`str`]
+            Only wait for ``interaction`` events with this custom ID.
+
+            .. versionadded:: 2.6
 
         Returns
         -------
@@ -1128,6 +1301,8 @@ class Client:
         ------
         asyncio.TimeoutError
             Raised if a timeout is provided and reached.
+        ValueError
+            A key was given for an event that does not support it.
 
         Examples
         --------
@@ -1174,6 +1349,30 @@ class Client:
             check = _check
 
         ev = event.lower()
+        filters = {
+            k: v
+            for k, v in (
+                ("channel_id", channel_id),
+                ("message_id", message_id),
+                ("custom_id", custom_id),
+            )
+            if v is not None
+        }
+        if filters:
+            supported = _WAIT_FOR_KEYS.get(ev, (None, frozenset()))[1]
+            if unsupported := filters.keys() - supported:
+                raise ValueError(
+                    f"the {ev!r} event cannot be waited for by {', '.join(sorted(unsupported))}"
+                )
+            kind = next(k for k in _WAIT_FOR_KEY_ORDER if k in filters)
+            key = (kind, filters.pop(kind))
+            waiters = self._keyed_listeners.setdefault(ev, {}).setdefault(key, [])
+            waiters.append((future, check, filters))
+            future.add_done_callback(
+                lambda f: self._remove_keyed_waiter(ev, key, f)
+            )
+            return asyncio.wait_for(future, timeout)
+
         try:
             listeners = self._listeners[ev]
         except KeyError:
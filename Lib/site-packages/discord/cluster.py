@@ -0,0 +1,539 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
+
+from .backoff import ExponentialBackoff
+from .http import HTTPClient
+from .shard import AutoShardedClient, _IdentifyRatelimiter
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from .types.gateway import GatewayBot
+
+__all__ = (
+    "ShardCluster",
+    "ClusterLink",
+)
+
+_log = logging.getLogger(__name__)
+
+IPCHandler = Callable[[str, Any], Coroutine[Any, Any, Any]]
+
+
+class _IPCChannel:
+    """A request/reply channel over one end of a :func:`multiprocessing.Pipe`.
+
+    Messages are ``(kind, nonce, op, payload)`` tuples. A dedicated thread
+    blocks on the pipe and hands messages over to the event loop.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        handler: IPCHandler,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.conn: Connection = conn
+        self.loop: asyncio.AbstractEventLoop = loop
+        self._handler: IPCHandler = handler
+        self._nonce = itertools.count()
+        self._pending: dict[int, asyncio.Future] = {}
+        self._send_lock = threading.Lock()
+        self.closed: asyncio.Event = asyncio.Event()
+
+    def start(self, name: str) -> None:
+        threading.Thread(target=self._read, name=name, daemon=True).start()
+
+    def _read(self) -> None:
+        while True:
+            try:
+                message = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            self.loop.call_soon_threadsafe(self._received, message)
+        try:
+            self.loop.call_soon_threadsafe(self._disconnected)
+        except RuntimeError:
+            # the loop is already closed
+            pass
+
+    def _disconnected(self) -> None:
+        self.closed.set()
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("IPC channel closed"))
+        self._pending.clear()
+
+    def _received(self, message: tuple[str, int, str | None, Any]) -> None:
+        kind, nonce, op, payload = message
+        if kind == "request":
+            self.loop.create_task(self._respond(nonce, op, payload))
+            return
+
+        future = self._pending.pop(nonce, None)
+        if future is None or future.done():
+            return
+        if kind == "error":
+            future.set_exception(RuntimeError(payload))
+        else:
+            future.set_result(payload)
+
+    async def _respond(self, nonce: int, op: str, payload: Any) -> None:
+        try:
+            result = await self._handler(op, payload)
+        except Exception as exc:
+            _log.exception("Failed to handle cluster IPC request %r", op)
+            self.send(("error", nonce, op, f"{exc.__class__.__name__}: {exc}"))
+        else:
+            self.send(("reply", nonce, op, result))
+
+    def send(self, message: tuple[str, int, str | None, Any]) -> None:
+        if self.closed.is_set():
+            return
+        with self._send_lock:
+            try:
+                self.conn.send(message)
+            except (OSError, ValueError):
+                pass
+
+    async def request(self, op: str, payload: Any = None) -> Any:
+        if self.closed.is_set():
+            raise ConnectionError("IPC channel closed")
+        nonce = next(self._nonce)
+        future = self._pending[nonce] = self.loop.create_future()
+        self.send(("request", nonce, op, payload))
+        return await future
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+
+
+class _ClusterIdentifyRatelimiter(_IdentifyRatelimiter):
+    # IDENTIFYs of every process share the bot's max_concurrency buckets,
+    # so they are coordinated by the supervisor, which also counts them
+    # against the session start limit.
+    counts_session_starts = False
+
+    def __init__(self, link: ClusterLink) -> None:
+        super().__init__(1)
+        self._link: ClusterLink = link
+
+    async def acquire(self, shard_id: int) -> None:
+        await self._link._channel.request("identify", shard_id)
+
+
+class ClusterLink:
+    """The connection of a cluster worker process to its :class:`ShardCluster`.
+
+    This is available as ``client.cluster`` on clients created by a
+    :class:`ShardCluster`.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    ----------
+    cluster_id: :class:`int`
+        The index of the worker process this client runs in.
+    client: :class:`AutoShardedClient`
+        The client of this worker process.
+    """
+
+    def __init__(
+        self, cluster_id: int, client: AutoShardedClient, conn: Connection
+    ) -> None:
+        self.cluster_id: int = cluster_id
+        self.client: AutoShardedClient = client
+        self._handlers: dict[str, Callable[[Any], Any]] = {
+            "guild_count": lambda _: len(self.client.guilds),
+            "user_count": lambda _: len(self.client.users),
+            "latencies": lambda _: self.client.latencies,
+            "shard_ids": lambda _: list(self.client.shard_ids or ()),
+        }
+        self._channel = _IPCChannel(conn, self._handle, client.loop)
+
+    def add_handler(self, op: str, func: Callable[[Any], Any]) -> None:
+        """Registers a handler answering the cross-cluster query ``op``.
+
+        The handler receives the query payload and may be a coroutine function.
+        Its return value must be picklable.
+
+        Parameters
+        ----------
+        op: :class:`str`
+            The name of the query.
+        func: Callable[[Any], Any]
+            The handler.
+        """
+        self._handlers[op] = func
+
+    async def _handle(self, op: str, payload: Any) -> Any:
+        if op == "close":
+            self.client.loop.create_task(self.client.close())
+            return None
+
+        result = self._handlers[op](payload)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    async def query(self, op: str, payload: Any = None) -> list[Any]:
+        """|coro|
+
+        Runs the query ``op`` on every worker process of the cluster,
+        including this one.
+
+        Parameters
+        ----------
+        op: :class:`str`
+            The name of the query, such as ``"guild_count"``.
+        payload: Any
+            A picklable argument passed to the handlers.
+
+        Returns
+        -------
+        List[Any]
+            The result of every worker, ordered by cluster ID.
+        """
+        return await self._channel.request("query", (op, payload))
+
+
+def _run_worker(
+    factory: Callable[..., AutoShardedClient],
+    token: str,
+    cluster_id: int,
+    shard_ids: list[int],
+    shard_count: int,
+    gateway: GatewayBot,
+    gateway_expires_at: float,
+    conn: Connection,
+) -> None:
+    # only the supervisor reacts to ^C, it closes the workers through IPC
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    async def runner() -> None:
+        client = factory(shard_ids=shard_ids, shard_count=shard_count)
+        if not isinstance(client, AutoShardedClient):
+            raise TypeError(
+                f"cluster client factory must return an AutoShardedClient, not {client.__class__!r}"
+            )
+
+        client.cluster = link = ClusterLink(cluster_id, client, conn)
+        client._identify_ratelimiter = _ClusterIdentifyRatelimiter(link)
+        client.http.set_bot_gateway_info(gateway, gateway_expires_at - time.time())
+        link._channel.start(f"pycord-cluster-{cluster_id}-ipc")
+        async with client:
+            await client.start(token)
+
+    asyncio.run(runner())
+
+
+class _Worker:
+    __slots__ = ("cluster_id", "shard_ids", "process", "channel", "backoff")
+
+    def __init__(self, cluster_id: int, shard_ids: list[int]) -> None:
+        self.cluster_id: int = cluster_id
+        self.shard_ids: list[int] = shard_ids
+        self.process: BaseProcess | None = None
+        self.channel: _IPCChannel | None = None
+        self.backoff: ExponentialBackoff = ExponentialBackoff()
+
+
+class ShardCluster:
+    """Runs the shards of a bot across several worker processes.
+
+    Every worker process owns a contiguous range of shard IDs and runs its own
+    :class:`AutoShardedClient`, so nothing but IPC messages is shared between
+    processes. The supervisor, which runs in the calling process, coordinates
+    IDENTIFYs across all workers according to the bot's ``max_concurrency``,
+    restarts workers that exit unexpectedly and relays cross-cluster queries
+    made through :meth:`ClusterLink.query`.
+
+    Worker processes are started with the ``spawn`` method, so ``factory``
+    must be importable from the module it is defined in and the supervisor
+    must be started from an ``if __name__ == "__main__":`` block.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ----------
+    factory: Callable[..., :class:`AutoShardedClient`]
+        A module level callable that creates the client of a worker process.
+        It is called with the ``shard_ids`` and ``shard_count`` keyword arguments,
+        which must be passed on to the client.
+    token: :class:`str`
+        The bot token.
+    cluster_count: Optional[:class:`int`]
+        The number of worker processes. Defaults to the CPU count, but never
+        more than there are shards.
+    shard_count: Optional[:class:`int`]
+        The total number of shards. Defaults to the count recommended by Discord.
+    restart: :class:`bool`
+        Whether to restart worker processes that exit unexpectedly.
+        Defaults to ``True``.
+    """
+
+    # seconds between two checks of the worker processes
+    MONITOR_INTERVAL: float = 1.0
+
+    def __init__(
+        self,
+        factory: Callable[..., AutoShardedClient],
+        *,
+        token: str,
+        cluster_count: int | None = None,
+        shard_count: int | None = None,
+        restart: bool = True,
+    ) -> None:
+        self.factory: Callable[..., AutoShardedClient] = factory
+        self.token: str = token
+        self.cluster_count: int | None = cluster_count
+        self.shard_count: int | None = shard_count
+        self.restart: bool = restart
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: list[_Worker] = []
+        self._gateway: GatewayBot | None = None
+        self._gateway_expires_at: float = 0.0
+        self._identify_ratelimiter: _IdentifyRatelimiter = _IdentifyRatelimiter(1)
+        self._closing: bool = False
+        self._pending_restarts: int = 0
+
+    async def _fetch_gateway(self) -> GatewayBot:
+        if self._gateway is not None and time.time() < self._gateway_expires_at:
+            return self._gateway
+
+        http = HTTPClient(loop=asyncio.get_running_loop())
+        try:
+            await http.static_login(self.token)
+            self._gateway = data = await http.get_bot_gateway_info()
+        finally:
+            await http.close()
+
+        limit = data["session_start_limit"]
+        self._gateway_expires_at = time.time() + limit["reset_after"] / 1000
+        self._identify_ratelimiter.max_concurrency = limit["max_concurrency"]
+        return data
+
+    async def _handle(self, op: str, payload: Any) -> Any:
+        if op == "identify":
+            gateway = await self._fetch_gateway()
+            limit = gateway["session_start_limit"]
+            if limit["remaining"] <= 0:
+                delay = max(self._gateway_expires_at - time.time(), 0)
+                _log.warning(
+                    "Session start limit exhausted, shard ID %s waits %.2fs to identify.",
+                    payload,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                gateway = await self._fetch_gateway()
+                limit = gateway["session_start_limit"]
+            limit["remaining"] -= 1
+            await self._identify_ratelimiter.acquire(payload)
+            return None
+
+        if op == "query":
+            return await self.query(*payload)
+
+        raise ValueError(f"unknown cluster request {op!r}")
+
+    def _spawn(self, worker: _Worker) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        assert self._gateway is not None
+        process = self._context.Process(
+            target=_run_worker,
+            args=(
+                self.factory,
+                self.token,
+                worker.cluster_id,
+                worker.shard_ids,
+                self.shard_count,
+                self._gateway,
+                self._gateway_expires_at,
+                child_conn,
+            ),
+            name=f"pycord-cluster-{worker.cluster_id}",
+        )
+        process.start()
+        child_conn.close()
+
+        worker.process = process
+        worker.channel = channel = _IPCChannel(
+            parent_conn, self._handle, asyncio.get_running_loop()
+        )
+        channel.start(f"pycord-cluster-{worker.cluster_id}-supervisor-ipc")
+        _log.info(
+            "Started cluster %s (pid %s) with shard IDs %s.",
+            worker.cluster_id,
+            process.pid,
+            worker.shard_ids,
+        )
+
+    async def _monitor(self) -> None:
+        while not self._closing:
+            await asyncio.sleep(self.MONITOR_INTERVAL)
+            for worker in self._workers:
+                process = worker.process
+                if process is None or process.exitcode is None or self._closing:
+                    continue
+
+                worker.channel.close()
+                if not self.restart or process.exitcode == 0:
+                    _log.info(
+                        "Cluster %s exited with code %s.",
+                        worker.cluster_id,
+                        process.exitcode,
+                    )
+                    worker.process = None
+                    continue
+
+                delay = worker.backoff.delay()
+                _log.error(
+                    "Cluster %s exited with code %s, restarting in %.2fs.",
+                    worker.cluster_id,
+                    process.exitcode,
+                    delay,
+                )
+                worker.process = None
+                self._schedule_restart(delay, worker)
+
+            if not self._pending_restarts and all(
+                worker.process is None for worker in self._workers
+            ):
+                return
+
+    def _schedule_restart(self, delay: float, worker: _Worker) -> None:
+        self._pending_restarts += 1
+
+        def respawn() -> None:
+            self._pending_restarts -= 1
+            if not self._closing:
+                self._spawn(worker)
+
+        asyncio.get_running_loop().call_later(delay, respawn)
+
+    async def start(self) -> None:
+        """|coro|
+
+        Starts the worker processes and supervises them until every worker has
+        exited or :meth:`close` is called.
+        """
+        gateway = await self._fetch_gateway()
+        if self.shard_count is None:
+            self.shard_count = gateway["shards"]
+
+        cluster_count = min(self.cluster_count or os.cpu_count() or 1, self.shard_count)
+        per_cluster, extra = divmod(self.shard_count, cluster_count)
+        start = 0
+        for cluster_id in range(cluster_count):
+            end = start + per_cluster + (cluster_id < extra)
+            self._workers.append(_Worker(cluster_id, list(range(start, end))))
+            start = end
+
+        for worker in self._workers:
+            self._spawn(worker)
+
+        await self._monitor()
+
+    async def query(self, op: str, payload: Any = None) -> list[Any]:
+        """|coro|
+
+        Runs the query ``op`` on every running worker process.
+
+        Parameters
+        ----------
+        op: :class:`str`
+            The name of the query, such as ``"guild_count"``.
+        payload: Any
+            A picklable argument passed to the handlers.
+
+        Returns
+        -------
+        List[Any]
+            The result of every running worker, ordered by cluster ID.
+        """
+        channels = [
+            worker.channel
+            for worker in self._workers
+            if worker.process is not None and worker.channel is not None
+        ]
+        return await asyncio.gather(
+            *(channel.request(op, payload) for channel in channels)
+        )
+
+    async def close(self, timeout: float = 30.0) -> None:
+        """|coro|
+
+        Closes the clients of all worker processes and waits for them to exit.
+        Workers still running after ``timeout`` seconds are terminated.
+        """
+        self._closing = True
+        running = [worker for worker in self._workers if worker.process is not None]
+        for worker in running:
+            try:
+                await asyncio.wait_for(worker.channel.request("close"), 5.0)
+            except (asyncio.TimeoutError, ConnectionError, RuntimeError):
+                pass
+
+        deadline = time.monotonic() + timeout
+        for worker in running:
+            process = worker.process
+            while process.is_alive() and time.monotonic() < deadline:
+                await asyncio.sleep(0.1)
+            if process.is_alive():
+                _log.warning("Terminating cluster %s.", worker.cluster_id)
+                process.terminate()
+            process.join()
+            worker.channel.close()
+            worker.process = None
+
+    def run(self) -> None:
+        """A blocking call that runs the cluster until it exits or is interrupted."""
+
+        async def runner() -> None:
+            try:
+                await self.start()
+            finally:
+                await self.close()
+
+        try:
+            asyncio.run(runner())
+        except KeyboardInterrupt:
+            _log.info("Received signal to terminate the cluster.")
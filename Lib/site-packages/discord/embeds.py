@@ -26,6 +26,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import datetime
+from json.encoder import encode_basestring_ascii as _encode_string
 from typing import TYPE_CHECKING, Any, Mapping, TypeVar
 
 from . import utils
@@ -33,6 +34,7 @@ from .colour import Colour
 
 __all__ = (
     "Embed",
+    "CachedEmbed",
     "EmbedField",
     "EmbedAuthor",
     "EmbedFooter",
@@ -1040,7 +1042,7 @@ class Embed:
         # add in the raw data into the dict
         result = {
             key[1:]: getattr(self, key)
-            for key in self.__slots__
+            for key in Embed.__slots__
             if key != "_fields" and key[0] == "_" and hasattr(self, key)
         }
 
@@ -1086,3 +1088,256 @@ class Embed:
             result["title"] = self.title
 
         return result  # type: ignore
+
+
+# Discord's limits on the text of an embed
+_LIMITS = {
+    "title": ("title", 256),
+    "description": ("description", 4096),
+    "_footer": ("footer text", 2048),
+    "_author": ("author name", 256),
+}
+_MAX_FIELDS = 25
+_MAX_FIELD_NAME = 256
+_MAX_FIELD_VALUE = 1024
+_MAX_TOTAL = 6000
+_LITERALS = {True: "true", False: "false", None: "null"}
+
+
+def _text(name: str, value: Any) -> str:
+    if not value:
+        return ""
+    if name == "_footer":
+        return value.get("text") or ""
+    if name == "_author":
+        return value.get("name") or ""
+    return str(value)
+
+
+def _field_length(name: Any, value: Any) -> int:
+    name, value = str(name), str(value)
+    if len(name) > _MAX_FIELD_NAME:
+        raise ValueError(
+            f"field name must be {_MAX_FIELD_NAME} characters or fewer"
+        )
+    if len(value) > _MAX_FIELD_VALUE:
+        raise ValueError(
+            f"field value must be {_MAX_FIELD_VALUE} characters or fewer"
+        )
+    return len(name) + len(value)
+
+
+class _EncodedField(EmbedField):
+    # the fields of a CachedEmbed are private and replaced instead of being
+    # modified, so each one is encoded once
+    def to_dict(self) -> dict[str, str | bool | None]:
+        try:
+            return self._encoded
+        except AttributeError:
+            pass
+
+        self._encoded = encoded = utils._EncodedDict(super().to_dict())
+        name, value = _encode_string(self.name), _encode_string(self.value)
+        inline = _LITERALS.get(self.inline) or utils._to_json(self.inline)
+        encoded.json = f'{{"name":{name},"value":{value},"inline":{inline}}}'
+        return encoded
+
+
+class CachedEmbed(Embed):
+    """An :class:`Embed` that keeps its serialized payload until it is modified.
+
+    Useful for embeds that are sent or edited over and over with few or no
+    changes in between. :meth:`to_dict` returns the same payload, along with
+    its JSON encoding, until the embed is modified, and requests copy that
+    JSON into their body as is.
+
+    The character count is kept up to date on every modification, so
+    ``len(embed)`` is constant time, and modifications that exceed one of
+    Discord's limits raise :exc:`ValueError` instead of failing once sent.
+
+    .. versionadded:: 2.6
+
+    .. note::
+
+        Only modifications through the embed's attributes and methods are
+        tracked. :attr:`fields` returns copies of the fields, use
+        :meth:`set_field_at` and the other field methods to modify them. The
+        dict returned by :meth:`to_dict` must not be modified.
+    """
+
+    __slots__ = ("_cache", "_head", "_length")
+
+    def __init__(self, **kwargs: Any):
+        object.__setattr__(self, "_length", 0)
+        super().__init__(**kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "_fields":
+            value = [_EncodedField(str(f.name), str(f.value), f.inline) for f in value]
+            self._resize(
+                sum(_field_length(f.name, f.value) for f in value)
+                - sum(len(f.name) + len(f.value) for f in getattr(self, name, ())),
+                fields=len(value),
+            )
+        elif name in _LIMITS:
+            text = _text(name, value)
+            label, limit = _LIMITS[name]
+            if len(text) > limit:
+                raise ValueError(f"{label} must be {limit} characters or fewer")
+            self._resize(len(text) - len(_text(name, getattr(self, name, None))))
+        super().__setattr__(name, value)
+        object.__setattr__(self, "_cache", None)
+        if name != "_fields":
+            object.__setattr__(self, "_head", None)
+
+    def __delattr__(self, name: str) -> None:
+        if name in _LIMITS:
+            self._resize(-len(_text(name, getattr(self, name, None))))
+        super().__delattr__(name)
+        object.__setattr__(self, "_cache", None)
+        object.__setattr__(self, "_head", None)
+
+    def _resize(self, delta: int, *, fields: int = 0) -> None:
+        if fields > _MAX_FIELDS:
+            raise ValueError(f"embeds can have {_MAX_FIELDS} fields or fewer")
+        length = getattr(self, "_length", 0) + delta
+        if length > _MAX_TOTAL:
+            raise ValueError(
+                f"embeds must be {_MAX_TOTAL} characters or fewer in total"
+            )
+        object.__setattr__(self, "_length", length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def set_footer(
+        self: E,
+        *,
+        text: Any | None = None,
+        icon_url: Any | None = None,
+    ) -> E:
+        footer = {}
+        if text:
+            footer["text"] = str(text)
+        if icon_url:
+            footer["icon_url"] = str(icon_url)
+        self._footer = footer
+        return self
+
+    def set_author(
+        self: E,
+        *,
+        name: Any,
+        url: Any | None = None,
+        icon_url: Any | None = None,
+    ) -> E:
+        author = {"name": str(name)}
+        if url:
+            author["url"] = str(url)
+        if icon_url:
+            author["icon_url"] = str(icon_url)
+        self._author = author
+        return self
+
+    @property
+    def fields(self) -> list[EmbedField]:
+        """Returns a :class:`list` of copies of the :class:`EmbedField` objects
+        denoting the field contents.
+        """
+        return [EmbedField(f.name, f.value, f.inline) for f in self._fields]
+
+    @fields.setter
+    def fields(self, value: list[EmbedField]) -> None:
+        if not all(isinstance(x, EmbedField) for x in value):
+            raise TypeError("Expected a list of EmbedField objects.")
+
+        self._fields = value
+
+    def _insert_field(self, index: int, field: EmbedField) -> None:
+        self._resize(
+            _field_length(field.name, field.value), fields=len(self._fields) + 1
+        )
+        self._fields.insert(index, field)
+        object.__setattr__(self, "_cache", None)
+
+    def append_field(self, field: EmbedField) -> None:
+        if not isinstance(field, EmbedField):
+            raise TypeError("Expected an EmbedField object.")
+
+        field = _EncodedField(str(field.name), str(field.value), field.inline)
+        self._insert_field(len(self._fields), field)
+
+    def add_field(self: E, *, name: str, value: str, inline: bool = True) -> E:
+        field = _EncodedField(name=str(name), value=str(value), inline=inline)
+        self._insert_field(len(self._fields), field)
+        return self
+
+    def insert_field_at(
+        self: E, index: int, *, name: Any, value: Any, inline: bool = True
+    ) -> E:
+        field = _EncodedField(name=str(name), value=str(value), inline=inline)
+        self._insert_field(index, field)
+        return self
+
+    def clear_fields(self) -> None:
+        self._fields = []
+
+    def remove_field(self, index: int) -> None:
+        try:
+            field = self._fields.pop(index)
+        except IndexError:
+            pass
+        else:
+            self._resize(-len(field.name) - len(field.value))
+            object.__setattr__(self, "_cache", None)
+
+    def set_field_at(
+        self: E, index: int, *, name: Any, value: Any, inline: bool = True
+    ) -> E:
+        try:
+            field = self._fields[index]
+        except (TypeError, IndexError):
+            raise IndexError("field index out of range")
+
+        name, value = str(name), str(value)
+        self._resize(
+            _field_length(name, value) - len(field.name) - len(field.value)
+        )
+        self._fields[index] = _EncodedField(name, value, inline)
+        object.__setattr__(self, "_cache", None)
+        return self
+
+    def to_dict(self) -> EmbedData:
+        """Converts this embed object into a dict.
+
+        The same dict is returned until the embed is modified, it must not be
+        modified itself.
+
+        Returns
+        -------
+        Dict[:class:`str`, Union[:class:`str`, :class:`int`, :class:`bool`]]
+            A dictionary of :class:`str` embed keys bound to the respective value.
+        """
+        cache = self._cache
+        if cache is not None:
+            return cache  # type: ignore
+
+        # everything but the fields is encoded once until it is modified,
+        # fields only when they are added or replaced
+        if self._head is None:
+            data = super().to_dict()
+            del data["fields"]
+            # the JSON object is left open for the fields
+            encoded = utils._to_json(data)[:-1]
+            if data:
+                encoded += ","
+            object.__setattr__(self, "_head", (data, encoded))
+        data, encoded = self._head
+
+        fields = [field.to_dict() for field in self._fields]
+        cache = utils._EncodedDict(data)
+        cache["fields"] = fields
+        parts = ",".join([field.json for field in fields])
+        cache.json = f'{encoded}"fields":[{parts}]}}'
+        object.__setattr__(self, "_cache", cache)
+        return cache  # type: ignore
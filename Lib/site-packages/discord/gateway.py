@@ -26,13 +26,14 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
+import heapq
+import itertools
 import logging
 import struct
 import sys
 import threading
 import time
-import traceback
+import weakref
 import zlib
 from collections import deque, namedtuple
 
@@ -43,8 +44,17 @@ from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed, InvalidArgument
 
+try:
+    import zstandard
+except ModuleNotFoundError:
+    HAS_ZSTD = False
+else:
+    HAS_ZSTD = True
+
 _log = logging.getLogger(__name__)
 
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
 __all__ = (
     "DiscordWebSocket",
     "KeepAliveHandler",
@@ -116,85 +126,159 @@ class GatewayRatelimiter:
                 await asyncio.sleep(delta)
 
 
-class KeepAliveHandler(threading.Thread):
-    def __init__(self, *args, **kwargs):
-        ws = kwargs.pop("ws", None)
-        interval = kwargs.pop("interval", None)
-        shard_id = kwargs.pop("shard_id", None)
-        threading.Thread.__init__(self, *args, **kwargs)
+class HeartbeatScheduler:
+    """Sends the heartbeats of every websocket running on an event loop from a
+    single task, waking up at the earliest heartbeat deadline.
+
+    How late the task wakes up is the event loop lag, which is recorded as
+    heartbeat jitter and used to warn about a blocked event loop.
+    """
+
+    _schedulers: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, HeartbeatScheduler
+    ] = weakref.WeakKeyDictionary()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._heap: list[tuple[float, int, KeepAliveHandler]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def for_loop(cls, loop: asyncio.AbstractEventLoop) -> HeartbeatScheduler:
+        try:
+            return cls._schedulers[loop]
+        except KeyError:
+            scheduler = cls._schedulers[loop] = cls(loop)
+            return scheduler
+
+    def add(self, handler: KeepAliveHandler, deadline: float) -> None:
+        heapq.heappush(self._heap, (deadline, next(self._counter), handler))
+        if self._task is None or self._task.done():
+            self._task = self.loop.create_task(
+                self._run(), name="pycord-heartbeat-scheduler"
+            )
+        else:
+            # the new deadline may be earlier than the one we're sleeping on
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        heap = self._heap
+        while heap:
+            deadline, _, handler = heap[0]
+            if handler._stopped:
+                heapq.heappop(heap)
+                continue
+
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(heap)
+            try:
+                handler._beat(-delay)
+            except Exception:
+                # only this connection is given up on, the others keep beating
+                _log.exception(
+                    "Sending a heartbeat for shard ID %s failed. Closing and restarting.",
+                    handler.shard_id,
+                )
+                handler.stop()
+                handler._spawn(handler._close())
+                continue
+            if not handler._stopped:
+                # keep the schedule drift free unless we fell a whole beat behind
+                deadline += handler.interval
+                now = time.monotonic()
+                if deadline <= now:
+                    deadline = now + handler.interval
+                heapq.heappush(heap, (deadline, next(self._counter), handler))
+
+
+class KeepAliveHandler:
+    # seconds the event loop may lag behind a heartbeat before warning
+    BLOCK_THRESHOLD: float = 10.0
+
+    def __init__(self, *, ws, interval=None, shard_id=None):
         self.ws = ws
-        self._main_thread_id = ws.thread_id
         self.interval = interval
-        self.daemon = True
         self.shard_id = shard_id
         self.msg = "Keeping shard ID %s websocket alive with sequence %s."
-        self.block_msg = "Shard ID %s heartbeat blocked for more than %s seconds."
+        self.block_msg = "Shard ID %s heartbeat blocked for more than %.1f seconds."
         self.behind_msg = "Can't keep up, shard ID %s websocket is %.1fs behind."
-        self._stop_ev = threading.Event()
+        self._stopped = False
         self._last_ack = time.perf_counter()
         self._last_send = time.perf_counter()
         self._last_recv = time.perf_counter()
         self.latency = float("inf")
+        self.recent_jitters = deque(maxlen=20)
         self.heartbeat_timeout = ws._max_heartbeat_timeout
+        # the event loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
 
-    def run(self):
-        while not self._stop_ev.wait(self.interval):
-            if self._last_recv + self.heartbeat_timeout < time.perf_counter():
-                _log.warning(
-                    (
-                        "Shard ID %s has stopped responding to the gateway. Closing and"
-                        " restarting."
-                    ),
-                    self.shard_id,
-                )
-                coro = self.ws.close(4000)
-                f = asyncio.run_coroutine_threadsafe(coro, loop=self.ws.loop)
+    @property
+    def jitter(self) -> float:
+        """The average delay of the last 20 heartbeats behind their schedule, in seconds."""
+        if not self.recent_jitters:
+            return 0.0
+        return sum(self.recent_jitters) / len(self.recent_jitters)
+
+    def start(self):
+        HeartbeatScheduler.for_loop(self.ws.loop).add(
+            self, time.monotonic() + self.interval
+        )
 
-                try:
-                    f.result()
-                except Exception:
-                    _log.exception(
-                        "An error occurred while stopping the gateway. Ignoring."
-                    )
-                finally:
-                    self.stop()
-                    return
-
-            data = self.get_payload()
-            _log.debug(self.msg, self.shard_id, data["d"])
-            coro = self.ws.send_heartbeat(data)
-            f = asyncio.run_coroutine_threadsafe(coro, loop=self.ws.loop)
-            try:
-                # block until sending is complete
-                total = 0
-                while True:
-                    try:
-                        f.result(10)
-                        break
-                    except concurrent.futures.TimeoutError:
-                        total += 10
-                        try:
-                            frame = sys._current_frames()[self._main_thread_id]
-                        except KeyError:
-                            msg = self.block_msg
-                        else:
-                            stack = "".join(traceback.format_stack(frame))
-                            msg = (
-                                f"{self.block_msg}\nLoop thread traceback (most recent"
-                                f" call last):\n{stack}"
-                            )
-                        _log.warning(msg, self.shard_id, total)
+    def _beat(self, lag: float) -> None:
+        self.recent_jitters.append(lag)
+        if lag > self.BLOCK_THRESHOLD:
+            _log.warning(self.block_msg, self.shard_id, lag)
+
+        if self._last_recv + self.heartbeat_timeout < time.perf_counter():
+            _log.warning(
+                (
+                    "Shard ID %s has stopped responding to the gateway. Closing and"
+                    " restarting."
+                ),
+                self.shard_id,
+            )
+            self.stop()
+            self._spawn(self._close())
+            return
 
-            except Exception:
-                self.stop()
-            else:
-                self._last_send = time.perf_counter()
+        data = self.get_payload()
+        _log.debug(self.msg, self.shard_id, data["d"])
+        self._spawn(self._send(data))
+
+    def _spawn(self, coro) -> None:
+        task = self.ws.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _close(self):
+        try:
+            await self.ws.close(4000)
+        except Exception:
+            _log.exception("An error occurred while stopping the gateway. Ignoring.")
+
+    async def _send(self, data):
+        try:
+            await self.ws.send_heartbeat(data)
+        except Exception:
+            self.stop()
+        else:
+            self._last_send = time.perf_counter()
 
     def get_payload(self):
         return {"op": self.ws.HEARTBEAT, "d": self.ws.sequence}
 
     def stop(self):
-        self._stop_ev.set()
+        self._stopped = True
 
     def tick(self):
         self._last_recv = time.perf_counter()
@@ -212,7 +296,9 @@ class VoiceKeepAliveHandler(KeepAliveHandler):
         super().__init__(*args, **kwargs)
         self.recent_ack_latencies = deque(maxlen=20)
         self.msg = "Keeping shard ID %s voice websocket alive with timestamp %s."
-        self.block_msg = "Shard ID %s voice heartbeat blocked for more than %s seconds"
+        self.block_msg = (
+            "Shard ID %s voice heartbeat blocked for more than %.1f seconds"
+        )
         self.behind_msg = "High socket latency, shard ID %s heartbeat is %.1fs behind"
 
     def get_payload(self):
@@ -302,6 +388,7 @@ class DiscordWebSocket:
         self.sequence = None
         self.resume_gateway_url = None
         self._zlib = zlib.decompressobj()
+        self._zstd = None
         self._buffer = bytearray()
         self._close_code = None
         self._rate_limiter = GatewayRatelimiter()
@@ -314,6 +401,8 @@ class DiscordWebSocket:
         return self._rate_limiter.is_ratelimited()
 
     def debug_log_receive(self, data, /):
+        if type(data) is bytes:
+            data = data.decode("utf-8")
         self._dispatch("socket_raw_receive", data)
 
     def log_receive(self, _, /):
@@ -338,6 +427,8 @@ class DiscordWebSocket:
         gateway = gateway or await client.http.get_gateway()
         socket = await client.http.ws_connect(gateway)
         ws = cls(socket, loop=client.loop)
+        if "compress=zstd-stream" in gateway:
+            ws._zstd = zstandard.ZstdDecompressor().decompressobj()
 
         # dynamically add attributes needed
         ws.token = client.http.token
@@ -453,14 +544,21 @@ class DiscordWebSocket:
 
     async def received_message(self, msg, /):
         if type(msg) is bytes:
-            self._buffer.extend(msg)
-
-            if len(msg) < 4 or msg[-4:] != b"\x00\x00\xff\xff":
+            if self._zstd is not None:
+                # zstd-stream flushes every message, no framing needed
+                msg = self._zstd.decompress(msg)
+            elif msg[-4:] != ZLIB_SUFFIX:
+                self._buffer.extend(msg)
                 return
-            msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode("utf-8")
-            self._buffer = bytearray()
+            elif self._buffer:
+                self._buffer.extend(msg)
+                msg = self._zlib.decompress(self._buffer)
+                self._buffer.clear()
+            else:
+                # the whole message arrived in one frame, skip the buffer copy
+                msg = self._zlib.decompress(msg)
 
+        # the JSON decoder takes the UTF-8 bytes as they are
         self.log_receive(msg)
         msg = utils._from_json(msg)
 
@@ -585,6 +683,12 @@ class DiscordWebSocket:
         heartbeat = self._keep_alive
         return float("inf") if heartbeat is None else heartbeat.latency
 
+    @property
+    def heartbeat_jitter(self) -> float:
+        """The average delay of recent heartbeats behind their schedule in seconds."""
+        heartbeat = self._keep_alive
+        return 0.0 if heartbeat is None else heartbeat.jitter
+
     def _can_handle_close(self):
         code = self._close_code or self.socket.close_code
         return code not in (1000, 4004, 4010, 4011, 4012, 4013, 4014)
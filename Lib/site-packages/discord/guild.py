@@ -27,9 +27,12 @@ from __future__ import annotations
 
 import copy
 import unicodedata
+import weakref
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     List,
     Literal,
@@ -70,7 +73,7 @@ from .flags import SystemChannelFlags
 from .integrations import Integration, _integration_factory
 from .invite import Invite
 from .iterators import AuditLogIterator, BanIterator, MemberIterator
-from .member import Member, VoiceState
+from .member import Member, VoiceState, _MemberRecord
 from .mixins import Hashable
 from .monetization import Entitlement
 from .onboarding import Onboarding
@@ -264,6 +267,8 @@ class Guild(Hashable):
         "nsfw_level",
         "_scheduled_events",
         "_members",
+        "_member_records",
+        "_member_views",
         "_channels",
         "_icon",
         "_banner",
@@ -299,7 +304,16 @@ class Guild(Hashable):
         # of the attr in __slots__
 
         self._channels: dict[int, GuildChannel] = {}
-        self._members: dict[int, Member] = {}
+        self._members: dict[int, Member] = (
+            {} if state.member_cache_limit is None else OrderedDict()
+        )
+        # members evicted from a bounded member cache, kept in compact form
+        self._member_records: dict[int, _MemberRecord] = {}
+        # the Member objects of records still referenced elsewhere, so a member
+        # is always the same object while it is in use
+        self._member_views: weakref.WeakValueDictionary[int, Member] = (
+            weakref.WeakValueDictionary()
+        )
         self._scheduled_events: dict[int, ScheduledEvent] = {}
         self._voice_states: dict[int, VoiceState] = {}
         self._threads: dict[int, Thread] = {}
@@ -317,14 +331,30 @@ class Guild(Hashable):
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        limit = self._state.member_cache_limit
+        if limit is not None:
+            # least recently used members are evicted to compact records
+            self._member_records.pop(member.id, None)
+            self._members.move_to_end(member.id)  # type: ignore
+            while len(self._members) > limit:
+                _, evicted = self._members.popitem(last=False)  # type: ignore
+                self._member_records[evicted.id] = _MemberRecord(evicted)
+                self._member_views[evicted.id] = evicted
+
+    def _materialize_member(self, record: _MemberRecord, /) -> Member:
+        member = self._member_views.get(record.user.id)
+        if member is None:
+            member = Member._from_record(record, guild=self, state=self._state)
+            self._member_views[member.id] = member
+        return member
 
     def _get_and_update_member(
         self, payload: MemberPayload, user_id: int, cache_flag: bool, /
     ) -> Member:
         # we always get the member, and we only update if the cache_flag (this cache
         # flag should always be MemberCacheFlag.interaction) is set to True
-        if user_id in self._members:
-            member = self.get_member(user_id)
+        member = self.get_member(user_id)
+        if member is not None:
             member._update(payload) if cache_flag else None
         else:
             # NOTE:
@@ -333,7 +363,7 @@ class Guild(Hashable):
             # class will be incorrect such as status and activities.
             member = Member(guild=self, state=self._state, data=payload)  # type: ignore
             if cache_flag:
-                self._members[user_id] = member
+                self._add_member(member)
         return member
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
@@ -343,6 +373,8 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        self._member_records.pop(member.id, None)
+        self._member_views.pop(member.id, None)
 
     def _add_scheduled_event(self, event: ScheduledEvent, /) -> None:
         self._scheduled_events[event.id] = event
@@ -601,7 +633,9 @@ class Guild(Hashable):
         members, which for this library is set to the maximum of 250.
         """
         if self._large is None:
-            return (self._member_count or len(self._members)) >= 250
+            return (
+                self._member_count or len(self._members) + len(self._member_records)
+            ) >= 250
         return self._large
 
     @property
@@ -840,7 +874,12 @@ class Guild(Hashable):
     @property
     def members(self) -> list[Member]:
         """A list of members that belong to this guild."""
-        return list(self._members.values())
+        members = list(self._members.values())
+        if self._member_records:
+            # evicted members stay evicted, but are the same objects get_member
+            # returns for as long as they are referenced
+            members.extend(map(self._materialize_member, self._member_records.values()))
+        return members
 
     def get_member(self, user_id: int, /) -> Member | None:
         """Returns a member with the given ID.
@@ -855,7 +894,21 @@ class Guild(Hashable):
         Optional[:class:`Member`]
             The member or ``None`` if not found.
         """
-        return self._members.get(user_id)
+        if self._state.member_cache_limit is None:
+            return self._members.get(user_id)
+
+        member = self._members.get(user_id)
+        if member is not None:
+            self._members.move_to_end(user_id)  # type: ignore
+            return member
+
+        record = self._member_records.get(user_id)
+        if record is None:
+            return None
+
+        member = self._materialize_member(record)
+        self._add_member(member)
+        return member
 
     @property
     def premium_subscribers(self) -> list[Member]:
@@ -1004,7 +1057,7 @@ class Guild(Hashable):
         """
         if self._member_count is None:
             return False
-        return self._member_count == len(self._members)
+        return self._member_count == len(self._members) + len(self._member_records)
 
     @property
     def shard_id(self) -> int:
@@ -3298,7 +3351,12 @@ class Guild(Hashable):
 
         await self._state.http.edit_widget(self.id, payload=payload)
 
-    async def chunk(self, *, cache: bool = True) -> None:
+    async def chunk(
+        self,
+        *,
+        cache: bool = True,
+        on_chunk: Callable[[list[Member]], Any] | None = None,
+    ) -> None:
         """|coro|
 
         Requests all members that belong to this guild. In order to use this,
@@ -3312,6 +3370,12 @@ class Guild(Hashable):
         ----------
         cache: :class:`bool`
             Whether to cache the members as well.
+        on_chunk: Optional[Callable[[List[:class:`Member`]], Any]]
+            Called with the members of every chunk as it arrives, before the
+            request completes. If the members of this guild are already being
+            requested, chunks received before this call are not passed to it.
+
+            .. versionadded:: 2.6
 
         Raises
         ------
@@ -3323,7 +3387,7 @@ class Guild(Hashable):
             raise ClientException("Intents.members must be enabled to use this.")
 
         if not self._state.is_guild_evicted(self):
-            return await self._state.chunk_guild(self, cache=cache)
+            return await self._state.chunk_guild(self, cache=cache, on_chunk=on_chunk)
 
     async def query_members(
         self,
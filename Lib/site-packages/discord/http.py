@@ -26,9 +26,12 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
+import math
+import os
 import sys
-import weakref
+import time
 from typing import TYPE_CHECKING, Any, Coroutine, Iterable, Sequence, TypeVar
 from urllib.parse import quote as _uriquote
 
@@ -44,14 +47,12 @@ from .errors import (
     LoginFailure,
     NotFound,
 )
-from .gateway import DiscordClientWebSocketResponse
+from .gateway import HAS_ZSTD, DiscordClientWebSocketResponse
 from .utils import MISSING, warn_deprecated
 
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from types import TracebackType
-
     from .enums import AuditLogAction, InteractionResponseType
     from .file import File
     from .types import (
@@ -81,14 +82,15 @@ if TYPE_CHECKING:
         welcome_screen,
         widget,
     )
+    from .types.gateway import GatewayBot
     from .types.snowflake import Snowflake, SnowflakeList
 
     T = TypeVar("T")
-    BE = TypeVar("BE", bound=BaseException)
-    MU = TypeVar("MU", bound="MaybeUnlock")
     Response = Coroutine[Any, Any, T]
 
 API_VERSION: int = 10
+# prefer zstd transport compression when the optional dependency is installed
+_GATEWAY_COMPRESSION: str = "zstd-stream" if HAS_ZSTD else "zlib-stream"
 
 
 async def json_or_text(response: aiohttp.ClientResponse) -> dict[str, Any] | str:
@@ -103,6 +105,62 @@ async def json_or_text(response: aiohttp.ClientResponse) -> dict[str, Any] | str
     return text
 
 
+class _FilePayload(aiohttp.payload.Payload):
+    """Streams an open file into a multipart form in large chunks.
+
+    Every write starts over at the position the file had when the payload was
+    created, so a form can be sent again on retries without being rebuilt or
+    the file being read into memory.
+    """
+
+    CHUNK_SIZE: int = 256 * 1024
+
+    def __init__(self, value: io.IOBase, **kwargs: Any) -> None:
+        super().__init__(value, **kwargs)
+        self._start: int = value.tell()
+        try:
+            self._size = os.fstat(value.fileno()).st_size - self._start
+        except (AttributeError, OSError):
+            if isinstance(value, io.BytesIO):
+                with value.getbuffer() as view:
+                    self._size = view.nbytes - self._start
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("File payloads cannot be decoded.")
+
+    async def write(self, writer: Any) -> None:
+        fp = self._value
+        fp.seek(self._start)
+        size = self.CHUNK_SIZE
+        if isinstance(fp, io.BytesIO):
+            # already in memory, reading never blocks
+            while chunk := fp.read(size):
+                await writer.write(chunk)
+            return
+
+        loop = asyncio.get_running_loop()
+        while chunk := await loop.run_in_executor(None, fp.read, size):
+            await writer.write(chunk)
+
+
+def _build_form(form: Iterable[dict[str, Any]]) -> aiohttp.MultipartWriter:
+    # built once per request, the file parts rewind themselves on every attempt
+    form_data = aiohttp.FormData(quote_fields=False)
+    for params in form:
+        value = params["value"]
+        if isinstance(value, io.IOBase):
+            params = dict(
+                params,
+                value=_FilePayload(
+                    value,
+                    filename=params.get("filename"),
+                    content_type=params.get("content_type"),
+                ),
+            )
+        form_data.add_field(**params)
+    return form_data()
+
+
 class Route:
     def __init__(self, method: str, path: str, **parameters: Any) -> None:
         self.path: str = path
@@ -128,30 +186,124 @@ class Route:
         return f"https://discord.com/api/v{API_VERSION}"
 
     @property
-    def bucket(self) -> str:
-        # the bucket is just method + path w/ major parameters
-        return f"{self.channel_id}:{self.guild_id}:{self.path}"
+    def key(self) -> str:
+        # routes are mapped to Discord's bucket hashes by method + path template
+        return f"{self.method} {self.path}"
 
+    @property
+    def major_parameters(self) -> str:
+        return f"{self.channel_id}:{self.guild_id}:{self.webhook_id}:{self.webhook_token}"
+
+
+class Ratelimit:
+    """Tracks the state of a single rate limit bucket as reported by the
+    ``X-RateLimit-*`` headers.
+
+    Up to ``remaining`` requests are admitted concurrently. Until the bucket's
+    limits are known only one request is in flight at a time, and once it has
+    been depleted requests wait for it to reset.
+    """
+
+    __slots__ = (
+        "limit",
+        "remaining",
+        "reset",
+        "reset_at",
+        "last_used",
+        "in_flight",
+        "_waiters",
+    )
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock: asyncio.Lock = lock
-        self._unlock: bool = True
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset: str | None = None
+        self.reset_at: float = 0.0
+        self.last_used: float = time.monotonic()
+        self.in_flight: int = 0
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    def is_idle(self, now: float) -> bool:
+        return (
+            not self.in_flight
+            and not self._waiters
+            and now >= self.reset_at
+            and now - self.last_used >= HTTPClient.BUCKET_IDLE_TIMEOUT
+        )
+
+    def _wake(self) -> None:
+        for future in self._waiters:
+            if not future.done():
+                future.set_result(None)
+
+    async def _wait(self, timeout: float | None = None) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.add(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._waiters.discard(future)
 
-    def __enter__(self: MU) -> MU:
-        return self
+    def update(self, response: aiohttp.ClientResponse, *, use_clock: bool) -> None:
+        headers = response.headers
+        remaining = headers.get("X-Ratelimit-Remaining")
+        if remaining is None:
+            return
 
-    def defer(self) -> None:
-        self._unlock = False
+        limit = headers.get("X-Ratelimit-Limit")
+        if limit is not None:
+            self.limit = int(limit)
 
-    def __exit__(
-        self,
-        exc_type: type[BE] | None,
-        exc: BE | None,
-        traceback: TracebackType | None,
-    ) -> None:
-        if self._unlock:
-            self.lock.release()
+        reset = headers.get("X-Ratelimit-Reset")
+        if self.remaining is not None and reset is not None and reset == self.reset:
+            # same window: responses may arrive out of order, so only ever
+            # lower what we have reserved locally
+            self.remaining = min(self.remaining, int(remaining))
+        else:
+            # new window: requests still in flight are not accounted for yet
+            self.remaining = max(0, int(remaining) - (self.in_flight - 1))
+            self.reset = reset
+            self.reset_at = time.monotonic() + utils._parse_ratelimit_header(
+                response, use_clock=use_clock
+            )
+        self._wake()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            if self.remaining is not None and now >= self.reset_at:
+                # the window has passed, so the bucket has been refilled; the
+                # new reset is unknown until one of these requests returns
+                self.remaining = self.limit
+                self.reset_at = math.inf
+
+            if self.remaining is None:
+                if not self.in_flight:
+                    break
+                await self._wait()
+            elif self.remaining > 0:
+                self.remaining -= 1
+                break
+            else:
+                delta = self.reset_at - now
+                _log.debug(
+                    "A rate limit bucket is exhausted, waiting %.2f seconds.", delta
+                )
+                await self._wait(delta)
+
+        self.in_flight += 1
+        self.last_used = time.monotonic()
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self.last_used = time.monotonic()
+        if not self.in_flight and self.reset_at == math.inf:
+            # no response told us about the new window, start over
+            self.remaining = None
+            self.reset_at = 0.0
+        self._wake()
 
 
 # For some reason, the Discord voice websocket expects this header to be
@@ -162,6 +314,11 @@ aiohttp.hdrs.WEBSOCKET = "websocket"  # type: ignore
 class HTTPClient:
     """Represents an HTTP client sending HTTP requests to the Discord API."""
 
+    # seconds a bucket must be unused (and past its reset) before it is evicted
+    BUCKET_IDLE_TIMEOUT: float = 300.0
+    # minimum number of seconds between two sweeps for idle buckets
+    BUCKET_SWEEP_INTERVAL: float = 60.0
+
     def __init__(
         self,
         connector: aiohttp.BaseConnector | None = None,
@@ -176,9 +333,15 @@ class HTTPClient:
         )
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
-        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # route key: X-RateLimit-Bucket hash returned by Discord
+        self._bucket_hashes: dict[str, str] = {}
+        # bucket hash (or route key until discovered) + major parameters: Ratelimit
+        self._buckets: dict[str, Ratelimit] = {}
+        self._last_bucket_sweep: float = time.monotonic()
         self._global_over: asyncio.Event = asyncio.Event()
         self._global_over.set()
+        self._bot_gateway: GatewayBot | None = None
+        self._bot_gateway_expires: float = 0.0
         self.token: str | None = None
         self.bot_token: bool = False
         self.proxy: str | None = proxy
@@ -214,6 +377,57 @@ class HTTPClient:
 
         return await self.__session.ws_connect(url, **kwargs)
 
+    def _get_bucket_key(self, route: Route) -> str:
+        bucket_hash = self._bucket_hashes.get(route.key, route.key)
+        return f"{bucket_hash}:{route.major_parameters}"
+
+    def _get_ratelimit(self, route: Route) -> Ratelimit:
+        now = time.monotonic()
+        if now - self._last_bucket_sweep >= self.BUCKET_SWEEP_INTERVAL:
+            self._last_bucket_sweep = now
+            idle = [key for key, rl in self._buckets.items() if rl.is_idle(now)]
+            for key in idle:
+                del self._buckets[key]
+            if idle:
+                _log.debug("Evicted %d idle rate limit buckets.", len(idle))
+
+        key = self._get_bucket_key(route)
+        ratelimit = self._buckets.get(key)
+        if ratelimit is None:
+            ratelimit = self._buckets[key] = Ratelimit()
+        return ratelimit
+
+    async def _acquire_ratelimit(self, route: Route) -> Ratelimit:
+        ratelimit = self._get_ratelimit(route)
+        while True:
+            await ratelimit.acquire()
+            current = self._get_ratelimit(route)
+            if current is ratelimit:
+                return ratelimit
+
+            # the route was mapped to a discovered bucket while we were waiting
+            ratelimit.release()
+            ratelimit = current
+
+    def _discover_bucket(
+        self, route: Route, ratelimit: Ratelimit, bucket_hash: str
+    ) -> Ratelimit:
+        if self._bucket_hashes.get(route.key) != bucket_hash:
+            self._bucket_hashes[route.key] = bucket_hash
+            _log.debug(
+                "Route %s has been mapped to bucket %s.", route.key, bucket_hash
+            )
+
+        # routes sharing a bucket hash share one Ratelimit
+        shared = self._buckets.setdefault(self._get_bucket_key(route), ratelimit)
+        if shared is not ratelimit:
+            # move this request's slot over, so its response updates the
+            # Ratelimit the other requests of the bucket are waiting on
+            ratelimit.release()
+            shared.in_flight += 1
+            shared.last_used = time.monotonic()
+        return shared
+
     async def request(
         self,
         route: Route,
@@ -222,16 +436,12 @@ class HTTPClient:
         form: Iterable[dict[str, Any]] | None = None,
         **kwargs: Any,
     ) -> Any:
-        bucket = route.bucket
+        # `files` is no longer read, the form rewinds and streams the files itself.
+        # It is kept for the callers and subclasses that still pass it.
+        bucket = self._get_bucket_key(route)
         method = route.method
         url = route.url
 
-        lock = self._locks.get(bucket)
-        if lock is None:
-            lock = asyncio.Lock()
-            if bucket is not None:
-                self._locks[bucket] = lock
-
         # header creation
         headers: dict[str, str] = {
             "User-Agent": self.user_agent,
@@ -242,7 +452,7 @@ class HTTPClient:
         # some checking if it's a JSON request
         if "json" in kwargs:
             headers["Content-Type"] = "application/json"
-            kwargs["data"] = utils._to_json(kwargs.pop("json"))
+            kwargs["data"] = utils._to_json_payload(kwargs.pop("json"))
 
         try:
             reason = kwargs.pop("reason")
@@ -262,24 +472,17 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs["proxy_auth"] = self.proxy_auth
 
-        if not self._global_over.is_set():
-            # wait until the global lock is complete
-            await self._global_over.wait()
+        if form:
+            kwargs["data"] = _build_form(form)
 
         response: aiohttp.ClientResponse | None = None
         data: dict[str, Any] | str | None = None
-        await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
+        ratelimit: Ratelimit | None = await self._acquire_ratelimit(route)
+        try:
             for tries in range(5):
-                if files:
-                    for f in files:
-                        f.reset(seek=tries)
-
-                if form:
-                    form_data = aiohttp.FormData(quote_fields=False)
-                    for params in form:
-                        form_data.add_field(**params)
-                    kwargs["data"] = form_data
+                if not self._global_over.is_set():
+                    # wait until the global lock is complete
+                    await self._global_over.wait()
 
                 try:
                     async with self.__session.request(
@@ -297,22 +500,24 @@ class HTTPClient:
                         data = await json_or_text(response)
 
                         # check if we have rate limit header information
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
-                            # we've depleted our current bucket
-                            delta = utils._parse_ratelimit_header(
-                                response, use_clock=self.use_clock
+                        bucket_hash = response.headers.get("X-Ratelimit-Bucket")
+                        if bucket_hash is not None:
+                            ratelimit = self._discover_bucket(
+                                route, ratelimit, bucket_hash
                             )
+                            bucket = self._get_bucket_key(route)
+                        ratelimit.update(response, use_clock=self.use_clock)
+                        if ratelimit.remaining == 0 and response.status != 429:
+                            # we've depleted our current bucket, the next
+                            # request waits for it to reset before being sent
                             _log.debug(
                                 (
                                     "A rate limit bucket has been exhausted (bucket:"
                                     " %s, retry: %s)."
                                 ),
                                 bucket,
-                                delta,
+                                ratelimit.reset_at - time.monotonic(),
                             )
-                            maybe_lock.defer()
-                            self.loop.call_later(delta, lock.release)
 
                         # the request was successful so just return the text/json
                         if 300 > response.status >= 200:
@@ -346,6 +551,10 @@ class HTTPClient:
                                 )
                                 self._global_over.clear()
 
+                            # give up our slot so the retry is admitted again
+                            # alongside the other requests for this bucket
+                            ratelimit.release()
+                            ratelimit = None
                             await asyncio.sleep(retry_after)
                             _log.debug("Done sleeping for the rate limit. Retrying...")
 
@@ -355,6 +564,7 @@ class HTTPClient:
                                 self._global_over.set()
                                 _log.debug("Global rate limit is now over.")
 
+                            ratelimit = await self._acquire_ratelimit(route)
                             continue
 
                         # we've received a 500, 502, or 504, unconditional retry
@@ -388,6 +598,9 @@ class HTTPClient:
                 raise HTTPException(response, data)
 
             raise RuntimeError("Unreachable code in HTTP handling")
+        finally:
+            if ratelimit is not None:
+                ratelimit.release()
 
     async def get_from_cdn(self, url: str) -> bytes:
         async with self.__session.get(url) as resp:
@@ -575,7 +788,7 @@ class HTTPClient:
                 }
             )
         payload["attachments"] = attachments
-        form[0]["value"] = utils._to_json(payload)
+        form[0]["value"] = utils._to_json_payload(payload)
         return self.request(route, form=form, files=files)
 
     def send_files(
@@ -642,7 +855,7 @@ class HTTPClient:
             payload["attachments"] = attachments
         else:
             payload["attachments"].extend(attachments)
-        form[0]["value"] = utils._to_json(payload)
+        form[0]["value"] = utils._to_json_payload(payload)
 
         return self.request(route, form=form, files=files)
 
@@ -1263,7 +1476,7 @@ class HTTPClient:
                 )
 
             payload["attachments"] = attachments
-            form[0]["value"] = utils._to_json(payload)
+            form[0]["value"] = utils._to_json_payload(payload)
             return self.request(route, form=form, reason=reason)
         return self.request(route, json=payload, reason=reason)
 
@@ -2675,7 +2888,7 @@ class HTTPClient:
         form: list[dict[str, Any]] = [
             {
                 "name": "payload_json",
-                "value": utils._to_json(payload),
+                "value": utils._to_json_payload(payload),
             }
         ]
 
@@ -3000,21 +3213,42 @@ class HTTPClient:
         except HTTPException as exc:
             raise GatewayNotFound() from exc
         if zlib:
-            value = "{0}?encoding={1}&v={2}&compress=zlib-stream"
+            value = "{0}?encoding={1}&v={2}&compress=" + _GATEWAY_COMPRESSION
         else:
             value = "{0}?encoding={1}&v={2}"
         return value.format(data["url"], encoding, API_VERSION)
 
-    async def get_bot_gateway(
-        self, *, encoding: str = "json", zlib: bool = True
-    ) -> tuple[int, str]:
+    async def get_bot_gateway_info(self, *, refresh: bool = False) -> GatewayBot:
+        # The response is cached until its session start limit resets, callers
+        # identifying with it are expected to decrement ``remaining`` themselves.
+        if (
+            not refresh
+            and self._bot_gateway is not None
+            and time.monotonic() < self._bot_gateway_expires
+        ):
+            return self._bot_gateway
+
         try:
             data = await self.request(Route("GET", "/gateway/bot"))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
 
+        self.set_bot_gateway_info(
+            data, data["session_start_limit"]["reset_after"] / 1000
+        )
+        return data
+
+    def set_bot_gateway_info(self, data: GatewayBot, expires_in: float) -> None:
+        self._bot_gateway = data
+        self._bot_gateway_expires = time.monotonic() + expires_in
+
+    async def get_bot_gateway(
+        self, *, encoding: str = "json", zlib: bool = True
+    ) -> tuple[int, str]:
+        data = await self.get_bot_gateway_info()
+
         if zlib:
-            value = "{0}?encoding={1}&v={2}&compress=zlib-stream"
+            value = "{0}?encoding={1}&v={2}&compress=" + _GATEWAY_COMPRESSION
         else:
             value = "{0}?encoding={1}&v={2}"
         return data["shards"], value.format(data["url"], encoding, API_VERSION)
@@ -110,16 +110,10 @@ class Interaction:
         The interaction type.
     guild_id: Optional[:class:`int`]
         The guild ID the interaction was sent from.
-    channel: Optional[Union[:class:`abc.GuildChannel`, :class:`abc.PrivateChannel`, :class:`Thread`]]
-        The channel the interaction was sent from.
     channel_id: Optional[:class:`int`]
         The ID of the channel the interaction was sent from.
     application_id: :class:`int`
         The application ID that the interaction was for.
-    user: Optional[Union[:class:`User`, :class:`Member`]]
-        The user or member that sent the interaction. Will be `None` in PING interactions.
-    message: Optional[:class:`Message`]
-        The message that sent this interaction.
     token: :class:`str`
         The token to continue the interaction. These are valid
         for 15 minutes.
@@ -137,18 +131,19 @@ class Interaction:
         "id",
         "type",
         "guild_id",
-        "channel",
         "channel_id",
         "data",
         "application_id",
-        "message",
-        "user",
         "locale",
         "guild_locale",
         "token",
         "version",
         "custom_id",
-        "entitlements",
+        "_payload",
+        "_user",
+        "_message",
+        "_channel",
+        "_entitlements",
         "_channel_data",
         "_message_data",
         "_guild_data",
@@ -185,70 +180,128 @@ class Interaction:
             self.data.get("custom_id") if self.data is not None else None
         )
         self._app_permissions: int = int(data.get("app_permissions", 0))
-        self.entitlements: list[Entitlement] = [
-            Entitlement(data=e, state=self._state) for e in data.get("entitlements", [])
-        ]
 
-        self.message: Message | None = None
-        self.channel = None
+        # The model objects below are only built when first accessed, most
+        # component interactions never look past the custom ID and user ID.
+        self._payload: InteractionPayload = data
+        self._user: User | Member | None = MISSING
+        self._message: Message | None = MISSING
+        self._channel: InteractionChannel | None = MISSING
+        self._entitlements: list[Entitlement] = MISSING
 
-        self.user: User | Member | None = None
         self._permissions: int = 0
+        if self.guild_id and (member := data.get("member")):
+            self._permissions = int(member.get("permissions", 0))
 
         self._guild: Guild | None = None
         self._guild_data = data.get("guild")
-        if self.guild is None and self._guild_data:
-            self._guild = Guild(data=self._guild_data, state=self)
+        self._channel_data = data.get("channel")
+        self._message_data = data.get("message")
 
+    def _resolve_user(self) -> User | Member | None:
+        data = self._payload
         # TODO: there's a potential data loss here
         if self.guild_id:
-            guild = (
-                self.guild
-                or self._state._get_guild(self.guild_id)
-                or Object(id=self.guild_id)
-            )
             try:
                 member = data["member"]  # type: ignore
             except KeyError:
-                pass
-            else:
-                self._permissions = int(member.get("permissions", 0))
-                if not isinstance(guild, Object):
-                    cache_flag = self._state.member_cache_flags.interaction
-                    self.user = guild._get_and_update_member(
-                        member, int(member["user"]["id"]), cache_flag
-                    )
-                else:
-                    self.user = Member(state=self._state, data=member, guild=guild)
-        else:
-            try:
-                self.user = User(state=self._state, data=data["user"])
-            except KeyError:
-                pass
-
-        if channel := data.get("channel"):
-            if (ch_type := channel.get("type")) is not None:
-                factory, ch_type = _threaded_channel_factory(ch_type)
-
-                if ch_type in (ChannelType.group, ChannelType.private):
-                    self.channel = factory(
-                        me=self.user, data=channel, state=self._state
-                    )
-                elif self.guild:
-                    self.channel = factory(
-                        guild=self.guild, state=self._state, data=channel
-                    )
-        else:
-            self.channel = self.cached_channel
+                return None
+            guild = self.guild or Object(id=self.guild_id)
+            if not isinstance(guild, Object):
+                cache_flag = self._state.member_cache_flags.interaction
+                return guild._get_and_update_member(
+                    member, int(member["user"]["id"]), cache_flag
+                )
+            return Member(state=self._state, data=member, guild=guild)
+
+        try:
+            return User(state=self._state, data=data["user"])
+        except KeyError:
+            return None
+
+    def _resolve_channel(self) -> InteractionChannel | None:
+        channel = self._channel_data
+        if not channel:
+            return self.cached_channel
+
+        if (ch_type := channel.get("type")) is not None:
+            factory, ch_type = _threaded_channel_factory(ch_type)
+
+            if ch_type in (ChannelType.group, ChannelType.private):
+                return factory(me=self.user, data=channel, state=self._state)
+            elif self.guild:
+                return factory(guild=self.guild, state=self._state, data=channel)
+        return None
+
+    @property
+    def user(self) -> User | Member | None:
+        """The user or member that sent the interaction. Will be ``None`` in PING interactions."""
+        if self._user is MISSING:
+            self._user = self._resolve_user()
+        return self._user
 
-        self._channel_data = channel
+    @user.setter
+    def user(self, value: User | Member | None) -> None:
+        self._user = value
 
-        if message_data := data.get("message"):
-            self.message = Message(
-                state=self._state, channel=self.channel, data=message_data
+    @property
+    def user_id(self) -> int | None:
+        """The ID of the user that sent the interaction, without resolving :attr:`user`.
+
+        .. versionadded:: 2.6
+        """
+        if self._user is not MISSING:
+            return self._user and self._user.id
+        user = self._payload.get("member", {}).get("user") or self._payload.get("user")
+        return user and int(user["id"])
+
+    @property
+    def channel(self) -> InteractionChannel | None:
+        """The channel the interaction was sent from."""
+        if self._channel is MISSING:
+            self._channel = self._resolve_channel()
+        return self._channel
+
+    @channel.setter
+    def channel(self, value: InteractionChannel | None) -> None:
+        self._channel = value
+
+    @property
+    def message(self) -> Message | None:
+        """The message that sent this interaction."""
+        if self._message is MISSING:
+            self._message = self._message_data and Message(
+                state=self._state, channel=self.channel, data=self._message_data
             )
+        return self._message
+
+    @message.setter
+    def message(self, value: Message | None) -> None:
+        self._message = value
+
+    @property
+    def message_id(self) -> int | None:
+        """The ID of the message that sent this interaction, without resolving :attr:`message`.
 
-        self._message_data = message_data
+        .. versionadded:: 2.6
+        """
+        if self._message is not MISSING:
+            return self._message and self._message.id
+        return self._message_data and int(self._message_data["id"])
+
+    @property
+    def entitlements(self) -> list[Entitlement]:
+        """Entitlements of the user that sent the interaction."""
+        if self._entitlements is MISSING:
+            self._entitlements = [
+                Entitlement(data=e, state=self._state)
+                for e in self._payload.get("entitlements", [])
+            ]
+        return self._entitlements
+
+    @entitlements.setter
+    def entitlements(self, value: list[Entitlement]) -> None:
+        self._entitlements = value
 
     @property
     def client(self) -> Client:
@@ -260,7 +313,10 @@ class Interaction:
         """The guild the interaction was sent from."""
         if self._guild:
             return self._guild
-        return self._state and self._state._get_guild(self.guild_id)
+        guild = self._state and self._state._get_guild(self.guild_id)
+        if guild is None and self._guild_data:
+            guild = self._guild = Guild(data=self._guild_data, state=self)
+        return guild
 
     def is_command(self) -> bool:
         """Indicates whether the interaction is an application command."""
@@ -157,6 +157,53 @@ class VoiceState:
         return f"<{self.__class__.__name__} {inner}>"
 
 
+def _to_timestamp(dt: datetime.datetime | None) -> float | None:
+    return dt.timestamp() if dt is not None else None
+
+
+def _from_timestamp(ts: float | None) -> datetime.datetime | None:
+    return (
+        datetime.datetime.fromtimestamp(ts, tz=datetime.timezone.utc)
+        if ts is not None
+        else None
+    )
+
+
+class _MemberRecord:
+    # The compact form a Member is kept in once it is evicted from a guild's
+    # bounded member cache. Activities are not kept.
+    __slots__ = (
+        "user",
+        "roles",
+        "nick",
+        "avatar",
+        "joined_at",
+        "premium_since",
+        "communication_disabled_until",
+        "pending",
+        "client_status",
+    )
+
+    def __init__(self, member: Member) -> None:
+        self.user: User = member._user
+        self.roles: tuple[int, ...] = member._state._intern_role_ids(
+            tuple(member._roles)
+        )
+        self.nick: str | None = member.nick
+        self.avatar: str | None = member._avatar
+        self.joined_at: float | None = _to_timestamp(member.joined_at)
+        self.premium_since: float | None = _to_timestamp(member.premium_since)
+        self.communication_disabled_until: float | None = _to_timestamp(
+            member.communication_disabled_until
+        )
+        self.pending: bool = member.pending
+        # the default offline status is not worth a dict per member
+        status = member._client_status
+        self.client_status: dict[str | None, str] | None = (
+            None if status == {None: "offline"} else status
+        )
+
+
 def flatten_user(cls):
     for attr, value in itertools.chain(
         BaseUser.__dict__.items(), User.__dict__.items()
@@ -276,6 +323,8 @@ class Member(discord.abc.Messageable, _UserTag):
         "_state",
         "_avatar",
         "communication_disabled_until",
+        # guilds with a bounded member cache track materialized members weakly
+        "__weakref__",
     )
 
     if TYPE_CHECKING:
@@ -398,6 +447,32 @@ class Member(discord.abc.Messageable, _UserTag):
         self._user = member._user
         return self
 
+    @classmethod
+    def _from_record(
+        cls: type[M], record: _MemberRecord, *, guild: Guild, state: ConnectionState
+    ) -> M:
+        self: M = cls.__new__(cls)  # to bypass __init__
+
+        self._state = state
+        self._user = record.user
+        self.guild = guild
+        self._roles = utils.SnowflakeList(record.roles, is_sorted=True)
+        self.joined_at = _from_timestamp(record.joined_at)
+        self.premium_since = _from_timestamp(record.premium_since)
+        self.communication_disabled_until = _from_timestamp(
+            record.communication_disabled_until
+        )
+        self._client_status = (
+            {None: "offline"}
+            if record.client_status is None
+            else record.client_status.copy()
+        )
+        self.activities = ()
+        self.nick = record.nick
+        self.pending = record.pending
+        self._avatar = record.avatar
+        return self
+
     async def _get_channel(self):
         ch = await self.create_dm()
         return ch
@@ -36,6 +36,7 @@ import struct
 import sys
 import threading
 import time
+from collections import deque
 from typing import TYPE_CHECKING, Any, Callable, Literal, TypedDict, TypeVar
 
 from .errors import DiscordException
@@ -518,50 +519,249 @@ class Decoder(_OpusStruct):
         return array.array("h", pcm[: ret * channel_count]).tobytes()
 
 
-class DecodeManager(threading.Thread, _OpusStruct):
-    def __init__(self, client):
-        super().__init__(daemon=True, name="DecodeManager")
+class _JitterBuffer:
+    """Reorders the RTP packets of one SSRC by sequence number.
 
-        self.client = client
-        self.decode_queue = []
-
-        self.decoder = {}
-
-        self._end_thread = threading.Event()
+    Packets are held until the next expected sequence number arrives. A gap is
+    declared lost once ``depth`` packets are buffered behind it or the oldest
+    buffered packet waited for ``depth`` frame durations. Duplicates and
+    packets arriving after their slot was released are dropped.
+    """
 
-    def decode(self, opus_frame):
-        if not isinstance(opus_frame, RawData):
-            raise TypeError("opus_frame should be a RawData object.")
-        self.decode_queue.append(opus_frame)
+    __slots__ = ("depth", "max_delay", "packets", "next_sequence", "last_timestamp")
+
+    def __init__(self, depth: int = 4):
+        self.depth: int = depth
+        self.max_delay: float = depth * _OpusStruct.FRAME_LENGTH / 1000
+        self.packets: dict[int, RawData] = {}
+        self.next_sequence: int | None = None
+        self.last_timestamp: int | None = None
+
+    def push(self, packet: RawData) -> bool:
+        """Buffers a packet, returns ``False`` if it was dropped as late or duplicate."""
+        sequence = packet.sequence
+        if sequence in self.packets or (
+            self.next_sequence is not None
+            and (sequence - self.next_sequence) & 0xFFFF >= 0x8000
+        ):
+            return False
+        self.packets[sequence] = packet
+        return True
+
+    def _earliest(self) -> int:
+        # half the sequence space behind the next expected packet is in the past
+        base = self.next_sequence
+        if base is None:
+            base = next(iter(self.packets))
+        base = (base - 0x8000) & 0xFFFF
+        return min(self.packets, key=lambda s: (s - base) & 0xFFFF)
+
+    def pop(self, now: float, *, flush: bool = False) -> list[RawData | int]:
+        """Releases the packets that are due in order.
+
+        A lost run of packets is reported as the number of packets lost.
+        """
+        released: list[RawData | int] = []
+        packets = self.packets
+        while packets:
+            if self.next_sequence is not None:
+                packet = packets.pop(self.next_sequence, None)
+                if packet is not None:
+                    released.append(packet)
+                    self.last_timestamp = packet.timestamp
+                    self.next_sequence = (self.next_sequence + 1) & 0xFFFF
+                    continue
 
-    def run(self):
-        while not self._end_thread.is_set():
-            try:
-                data = self.decode_queue.pop(0)
-            except IndexError:
-                time.sleep(0.001)
-                continue
+            if (
+                not flush
+                and len(packets) < self.depth
+                and now - min(p.receive_time for p in packets.values())
+                < self.max_delay
+            ):
+                break
+
+            earliest = self._earliest()
+            if self.next_sequence is not None:
+                released.append((earliest - self.next_sequence) & 0xFFFF)
+            self.next_sequence = earliest
+        return released
+
+
+class _DecodeWorker(threading.Thread):
+    def __init__(self, manager: DecodeManager, index: int):
+        super().__init__(daemon=True, name=f"DecodeManager-{index}")
+        self.manager = manager
+        self.queue: deque[RawData] = deque()
+        self.condition = threading.Condition()
+        # number of streams assigned to this worker
+        self.streams = 0
+        self.busy = False
+        self.stopping = False
+
+    def put(self, frame: RawData) -> None:
+        manager = self.manager
+        with self.condition:
+            if len(self.queue) >= manager.max_queue:
+                # let the worker catch up for about one frame before dropping
+                self.condition.wait_for(
+                    lambda: len(self.queue) < manager.max_queue,
+                    timeout=manager.put_timeout,
+                )
+                if len(self.queue) >= manager.max_queue:
+                    self.queue.popleft()
+                    manager.dropped += 1
+            self.queue.append(frame)
+            self.condition.notify_all()
+
+    def run(self) -> None:
+        manager = self.manager
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.queue or self.stopping)
+                if not self.queue:
+                    return
+                data = self.queue.popleft()
+                self.busy = True
+                # wake a producer waiting for room
+                self.condition.notify_all()
 
             try:
                 if data.decrypted_data is None:
-                    continue
+                    data.decoded_data = manager.conceal(data)
                 else:
-                    data.decoded_data = self.get_decoder(data.ssrc).decode(
+                    data.decoded_data = manager.get_decoder(data.ssrc).decode(
                         data.decrypted_data
                     )
             except OpusError:
-                print("Error occurred while decoding opus frame.")
+                _log.exception("Error occurred while decoding opus frame.")
+            else:
+                manager._record_latency(time.perf_counter() - data.receive_time)
+                manager.client.recv_decoded_audio(data)
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+
+class DecodeManager(_OpusStruct):
+    """Decodes received opus frames on a small pool of worker threads.
+
+    Every SSRC is bound to one worker, so the frames of a stream are decoded
+    in order, while different speakers are decoded in parallel.
+    """
+
+    # frames queued per worker before the producer waits, then drops the oldest
+    MAX_QUEUE = 500
+    PUT_TIMEOUT = 0.02
+    # longest run of lost packets replaced by concealment frames, longer gaps
+    # are left to the silence padding derived from the RTP timestamps
+    MAX_CONCEALED = 5
+
+    def __init__(
+        self, client, *, workers: int | None = None, jitter_depth: int = 4
+    ):
+        self.client = client
+        self.max_queue = self.MAX_QUEUE
+        self.put_timeout = self.PUT_TIMEOUT
+        self.jitter_depth = jitter_depth
+        self.decoder = {}
+        self.dropped = 0
+        self.late = 0
+        self.lost = 0
+        self._jitter_buffers: dict[int, _JitterBuffer] = {}
+        self._jitter_lock = threading.Lock()
+        self._last_sweep = 0.0
+        self._latencies: deque[float] = deque(maxlen=100)
+        self._workers = [
+            _DecodeWorker(self, i)
+            for i in range(workers or min(4, os.cpu_count() or 1))
+        ]
+        self._assigned: dict[int, _DecodeWorker] = {}
+
+    def start(self):
+        for worker in self._workers:
+            worker.start()
+
+    def decode(self, opus_frame):
+        if not isinstance(opus_frame, RawData):
+            raise TypeError("opus_frame should be a RawData object.")
+        if opus_frame.decrypted_data is None:
+            return
+
+        with self._jitter_lock:
+            ssrc = opus_frame.ssrc
+            buffer = self._jitter_buffers.get(ssrc)
+            if buffer is None:
+                buffer = self._jitter_buffers[ssrc] = _JitterBuffer(self.jitter_depth)
+            if not buffer.push(opus_frame):
+                self.late += 1
+                return
+
+            now = opus_frame.receive_time
+            self._release(ssrc, buffer, now)
+            # streams that went quiet only release their tail on a sweep
+            if now - self._last_sweep >= self.FRAME_LENGTH / 1000:
+                self._last_sweep = now
+                for other, other_buffer in self._jitter_buffers.items():
+                    if other != ssrc and other_buffer.packets:
+                        self._release(other, other_buffer, now)
+
+    def _release(
+        self, ssrc: int, buffer: _JitterBuffer, now: float, flush: bool = False
+    ) -> None:
+        last_timestamp = buffer.last_timestamp
+        sequence = buffer.next_sequence
+        for item in buffer.pop(now, flush=flush):
+            if isinstance(item, int):
+                self.lost += item
+                if item <= self.MAX_CONCEALED and last_timestamp is not None:
+                    for _ in range(item):
+                        last_timestamp = (
+                            last_timestamp + self.SAMPLES_PER_FRAME
+                        ) & 0xFFFFFFFF
+                        self._dispatch(
+                            RawData._lost(self.client, ssrc, sequence, last_timestamp)
+                        )
+                        sequence = (sequence + 1) & 0xFFFF
+                sequence = buffer.next_sequence
                 continue
 
-            self.client.recv_decoded_audio(data)
+            last_timestamp = item.timestamp
+            sequence = (item.sequence + 1) & 0xFFFF
+            self._dispatch(item)
+
+    def _dispatch(self, frame: RawData) -> None:
+        worker = self._assigned.get(frame.ssrc)
+        if worker is None:
+            worker = min(self._workers, key=lambda w: w.streams)
+            worker.streams += 1
+            self._assigned[frame.ssrc] = worker
+        worker.put(frame)
+
+    def conceal(self, frame: RawData) -> bytes:
+        """Produces the PCM for a lost frame. Uses opus packet loss concealment
+        by default, override to change how losses sound in recordings.
+        """
+        return self.get_decoder(frame.ssrc).decode(None)
 
     def stop(self):
-        while self.decoding:
-            time.sleep(0.1)
-            self.decoder = {}
-            gc.collect()
-            print("Decoder Process Killed")
-        self._end_thread.set()
+        with self._jitter_lock:
+            now = time.perf_counter()
+            for ssrc, buffer in self._jitter_buffers.items():
+                self._release(ssrc, buffer, now, flush=True)
+            self._jitter_buffers = {}
+        for worker in self._workers:
+            with worker.condition:
+                worker.stopping = True
+                worker.condition.notify_all()
+        # the workers drain their queues before exiting
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.join()
+        self.decoder = {}
+        self._assigned = {}
+        gc.collect()
+        _log.debug("Decoder workers stopped.")
 
     def get_decoder(self, ssrc):
         d = self.decoder.get(ssrc)
@@ -570,6 +770,20 @@ class DecodeManager(threading.Thread, _OpusStruct):
         self.decoder[ssrc] = Decoder()
         return self.decoder[ssrc]
 
+    def _record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of frames waiting to be decoded."""
+        return sum(len(worker.queue) for worker in self._workers)
+
+    @property
+    def decode_latency(self) -> float:
+        """The average time in seconds between receiving and decoding the last 100 frames."""
+        latencies = self._latencies
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
     @property
     def decoding(self):
-        return bool(self.decode_queue)
+        return any(worker.queue or worker.busy for worker in self._workers)
@@ -27,16 +27,21 @@ from __future__ import annotations
 
 import asyncio
 import audioop
+import bisect
+import hashlib
 import io
 import json
 import logging
+import os
 import re
 import shlex
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import traceback
+from collections import deque
 from typing import IO, TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 from .errors import ClientException
@@ -44,6 +49,13 @@ from .oggparse import OggStream
 from .opus import Encoder as OpusEncoder
 from .utils import MISSING
 
+try:
+    import numpy
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
 if TYPE_CHECKING:
     from .voice_client import VoiceClient
 
@@ -59,7 +71,10 @@ __all__ = (
     "FFmpegAudio",
     "FFmpegPCMAudio",
     "FFmpegOpusAudio",
+    "OggOpusAudio",
+    "OpusCache",
     "PCMVolumeTransformer",
+    "MixerSource",
 )
 
 CREATE_NO_WINDOW: int
@@ -383,6 +398,13 @@ class FFmpegOpusAudio(FFmpegAudio):
         The subprocess failed to be created.
     """
 
+    # (path, mtime, size, method, executable) -> (codec, bitrate)
+    _PROBE_CACHE_SIZE: int = 256
+    _probe_cache: dict[tuple[Any, ...], tuple[str | None, int | None]] = {}
+    # probes of clients running their loops in other threads share the cache
+    _probe_lock: threading.Lock = threading.Lock()
+    _cache_writer: _OpusCacheWriter | None = None
+
     def __init__(
         self,
         source: str | io.BufferedIOBase,
@@ -541,6 +563,13 @@ class FFmpegOpusAudio(FFmpegAudio):
         executable = executable or "ffmpeg"
         probefunc = fallback = None
 
+        key = _file_key(source, method, executable)
+        if key is not None:
+            with cls._probe_lock:
+                cached = cls._probe_cache.get(key)
+            if cached is not None:
+                return cached
+
         if isinstance(method, str):
             probefunc = getattr(cls, f"_probe_codec_{method}", None)
             if probefunc is None:
@@ -579,6 +608,14 @@ class FFmpegOpusAudio(FFmpegAudio):
         else:
             _log.info("Probe found codec=%s, bitrate=%s", codec, bitrate)
         finally:
+            if key is not None and codec is not None:
+                with cls._probe_lock:
+                    if (
+                        key not in cls._probe_cache
+                        and len(cls._probe_cache) >= cls._PROBE_CACHE_SIZE
+                    ):
+                        del cls._probe_cache[next(iter(cls._probe_cache))]
+                    cls._probe_cache[key] = (codec, bitrate)
             return codec, bitrate
 
     @staticmethod
@@ -646,6 +683,220 @@ class FFmpegOpusAudio(FFmpegAudio):
     def is_opus(self) -> bool:
         return True
 
+    def cleanup(self) -> None:
+        super().cleanup()
+        # an entry is only kept if the output was read to the end
+        if self._cache_writer is not None:
+            self._cache_writer.discard()
+            self._cache_writer = None
+
+    def _write_cache(self, cache: OpusCache, key: str) -> None:
+        self._cache_writer = _OpusCacheWriter(self._stdout, self._process, cache, key)
+        self._packet_iter = OggStream(self._cache_writer).iter_packets()
+
+
+def _file_key(source: Any, *extra: Any) -> tuple[Any, ...] | None:
+    # local files are identified by path, modification time and size
+    if not isinstance(source, str):
+        return None
+    try:
+        stat = os.stat(source)
+    except (OSError, ValueError):
+        return None
+    return (os.path.realpath(source), stat.st_mtime_ns, stat.st_size, *extra)
+
+
+class OggOpusAudio(AudioSource):
+    """An audio source streaming the Opus packets of an Ogg file, such as the
+    files stored by :class:`OpusCache`, without starting FFmpeg.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ----------
+    source: Union[:class:`str`, :class:`io.BufferedIOBase`]
+        The path of the Ogg Opus file, or a file-like object to read it from.
+    """
+
+    def __init__(self, source: str | io.BufferedIOBase) -> None:
+        self._owned: bool = isinstance(source, str)
+        self._file: IO[bytes] = MISSING
+        self._file = open(source, "rb") if self._owned else source
+        self._packet_iter = OggStream(self._file).iter_packets()
+
+    def read(self) -> bytes:
+        return next(self._packet_iter, b"")
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        if self._owned and self._file is not MISSING:
+            self._file.close()
+        self._file = MISSING
+
+
+class _OpusCacheWriter:
+    """Copies what is read from FFmpeg's output into a temporary file, which
+    is stored in the cache once the output was read completely.
+    """
+
+    def __init__(self, stream: IO[bytes], process, cache: OpusCache, key: str):
+        self.stream: IO[bytes] = stream
+        self.process = process
+        self.cache: OpusCache = cache
+        self.key: str = key
+        fd, self.path = tempfile.mkstemp(suffix=".tmp", dir=cache.directory)
+        self.file: IO[bytes] | None = os.fdopen(fd, "wb")
+
+    def read(self, size: int) -> bytes:
+        data = self.stream.read(size)
+        if self.file is not None:
+            if data:
+                self.file.write(data)
+            else:
+                self._commit()
+        return data
+
+    def _commit(self) -> None:
+        self.file.close()
+        self.file = None
+        try:
+            returncode = self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            returncode = None
+        if returncode == 0:
+            self.cache._store(self.key, self.path)
+        else:
+            self._remove()
+
+    def discard(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self._remove()
+
+    def _remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class OpusCache:
+    """A disk cache of local audio files transcoded to Opus.
+
+    The first time a file is played it is transcoded by FFmpeg as usual and
+    the Opus stream is stored while playing. Later plays of the unchanged file
+    stream the stored packets through :class:`OggOpusAudio`, skipping probing
+    and FFmpeg entirely. Sources that are not local files, e.g. URLs, are
+    always played through FFmpeg.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ----------
+    directory: :class:`str`
+        The directory to store the transcoded files in. It is created if it
+        does not exist.
+    max_size: Optional[:class:`int`]
+        The size in bytes the cache may grow to before the least recently
+        played files are removed. Unlimited by default.
+
+    Examples
+    --------
+
+    Play a sound effect, without FFmpeg after the first time: ::
+
+        cache = discord.OpusCache("sounds-cache")
+
+        source = await cache.get("sounds/airhorn.mp3")
+        voice_client.play(source)
+    """
+
+    def __init__(self, directory: str, *, max_size: int | None = None) -> None:
+        self.directory: str = directory
+        self.max_size: int | None = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.ogg")
+
+    def _key(self, source: str, kwargs: dict[str, Any]) -> str | None:
+        key = _file_key(source, sorted(kwargs.items()))
+        if key is None:
+            return None
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    async def get(
+        self,
+        source: str,
+        *,
+        method: str | Callable[[str, str], tuple[str | None, int | None]] | None = None,
+        **kwargs: Any,
+    ) -> OggOpusAudio | FFmpegOpusAudio:
+        """|coro|
+
+        Returns an audio source playing the file, from the cache if possible.
+
+        Parameters
+        ----------
+        source: :class:`str`
+            The path of the file to play.
+        method
+            Identical to the ``method`` parameter for :meth:`FFmpegOpusAudio.from_probe`.
+        kwargs
+            The remaining parameters passed to :meth:`FFmpegOpusAudio.from_probe`
+            on a cache miss. They are part of the cache key, ``pipe`` is not
+            supported.
+
+        Returns
+        -------
+        Union[:class:`OggOpusAudio`, :class:`FFmpegOpusAudio`]
+            The cached audio, or the FFmpeg source filling the cache.
+        """
+        key = self._key(source, kwargs)
+        if key is not None:
+            path = self._path(key)
+            try:
+                audio = OggOpusAudio(path)
+            except FileNotFoundError:
+                pass
+            else:
+                # the access time is not reliable, the eviction goes by mtime
+                os.utime(path)
+                return audio
+
+        audio = await FFmpegOpusAudio.from_probe(source, method=method, **kwargs)
+        if key is not None:
+            audio._write_cache(self, key)
+        return audio
+
+    def _store(self, key: str, path: str) -> None:
+        os.replace(path, self._path(key))
+        if self.max_size is not None:
+            self._evict(self.max_size)
+
+    def _evict(self, max_size: int) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".ogg") and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        """Removes all files from the cache."""
+        self._evict(0)
+
 
 class PCMVolumeTransformer(AudioSource, Generic[AT]):
     """Transforms a previous :class:`AudioSource` to have volume controls.
@@ -696,15 +947,407 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
         return audioop.mul(ret, 2, min(self._volume, 2.0))
 
 
+class _MixerTrack:
+    __slots__ = ("source", "volume", "duck", "gain", "data")
+
+    def __init__(self, source: AudioSource, volume: float, duck: bool):
+        self.source: AudioSource = source
+        self.volume: float = volume
+        self.duck: bool = duck
+        # the gain applied last frame, changes are ramped over one frame
+        self.gain: float = 0.0
+        self.data: bytes = b""
+
+
+class MixerSource(AudioSource):
+    """Mixes several PCM audio sources, so they can be played at the same time.
+
+    Sources can be added and removed while playing, and are removed and cleaned
+    up once they finished. A source added with ``duck=True`` lowers the volume
+    of all other sources while it plays, e.g. to speak over music.
+
+    Mixing is vectorized with NumPy if it is installed, otherwise :mod:`audioop`
+    is used and volume changes are not smoothed.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ----------
+    *sources: :class:`AudioSource`
+        The sources to start mixing.
+    volume: :class:`float`
+        The volume of the mix, see :attr:`volume`.
+    duck_volume: :class:`float`
+        The volume of the other sources while a ducking source plays.
+        Defaults to ``0.3``.
+    keep_alive: :class:`bool`
+        Whether to play silence once all sources finished, so more sources can
+        be added later. Otherwise, the mixer ends with its last source.
+
+    Raises
+    ------
+    TypeError
+        Not an audio source.
+    ClientException
+        The audio source is opus encoded.
+    """
+
+    def __init__(
+        self,
+        *sources: AudioSource,
+        volume: float = 1.0,
+        duck_volume: float = 0.3,
+        keep_alive: bool = False,
+    ):
+        self.volume = volume
+        self.duck_volume: float = duck_volume
+        self.keep_alive: bool = keep_alive
+        self._lock: threading.Lock = threading.Lock()
+        # replaced instead of mutated, read iterates it without the lock
+        self._tracks: tuple[_MixerTrack, ...] = ()
+        self._silence: bytes = bytes(OpusEncoder.FRAME_SIZE)
+
+        if HAS_NUMPY:
+            samples = OpusEncoder.FRAME_SIZE // OpusEncoder.SAMPLE_SIZE
+            self._mix = numpy.zeros(samples * OpusEncoder.CHANNELS, numpy.float32)
+            self._scratch = numpy.empty_like(self._mix)
+            self._gains = numpy.empty_like(self._mix)
+            self._out = numpy.empty(self._mix.shape, numpy.int16)
+            # goes up to 1 over the frame, the same value for both channels
+            self._ramp = numpy.repeat(
+                numpy.linspace(1 / samples, 1, samples, dtype=numpy.float32),
+                OpusEncoder.CHANNELS,
+            )
+
+        for source in sources:
+            self.add(source)
+
+    @property
+    def volume(self) -> float:
+        """Retrieves or sets the volume of the mix as a floating point percentage
+        (e.g. ``1.0`` for 100%).
+        """
+        return self._volume
+
+    @volume.setter
+    def volume(self, value: float) -> None:
+        self._volume = max(value, 0.0)
+
+    @property
+    def sources(self) -> list[AudioSource]:
+        """The sources that are being mixed."""
+        return [track.source for track in self._tracks]
+
+    def add(self, source: AudioSource, *, volume: float = 1.0, duck: bool = False):
+        """Adds a source to the mix. It starts playing with the next frame.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to add.
+        volume: :class:`float`
+            The volume of this source as a floating point percentage.
+        duck: :class:`bool`
+            Whether the other sources are lowered to :attr:`duck_volume` while
+            this source plays.
+
+        Raises
+        ------
+        TypeError
+            Not an audio source.
+        ClientException
+            The audio source is opus encoded or already being mixed.
+        """
+        if not isinstance(source, AudioSource):
+            raise TypeError(f"expected AudioSource not {source.__class__.__name__}.")
+
+        if source.is_opus():
+            raise ClientException("AudioSource must not be Opus encoded.")
+
+        with self._lock:
+            if any(track.source is source for track in self._tracks):
+                raise ClientException("AudioSource is already being mixed.")
+            track = _MixerTrack(source, max(volume, 0.0), duck)
+            self._tracks = self._tracks + (track,)
+
+    def remove(self, source: AudioSource) -> None:
+        """Removes a source from the mix and cleans it up.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to remove.
+
+        Raises
+        ------
+        ValueError
+            The source is not being mixed.
+        """
+        with self._lock:
+            tracks = tuple(t for t in self._tracks if t.source is not source)
+            if len(tracks) == len(self._tracks):
+                raise ValueError("AudioSource is not being mixed.")
+            self._tracks = tracks
+        source.cleanup()
+
+    def set_volume(self, source: AudioSource, volume: float) -> None:
+        """Sets the volume of one source in the mix.
+
+        Parameters
+        ----------
+        source: :class:`AudioSource`
+            The source to change the volume of.
+        volume: :class:`float`
+            The new volume as a floating point percentage.
+
+        Raises
+        ------
+        ValueError
+            The source is not being mixed.
+        """
+        for track in self._tracks:
+            if track.source is source:
+                track.volume = max(volume, 0.0)
+                return
+        raise ValueError("AudioSource is not being mixed.")
+
+    def cleanup(self) -> None:
+        with self._lock:
+            tracks, self._tracks = self._tracks, ()
+        for track in tracks:
+            track.source.cleanup()
+
+    def _remove_finished(self, finished: list[_MixerTrack]) -> None:
+        # only the tracks read this frame, ones added meanwhile have no data yet
+        with self._lock:
+            self._tracks = tuple(
+                track
+                for track in self._tracks
+                if not any(track is done for done in finished)
+            )
+        for track in finished:
+            track.source.cleanup()
+
+    def read(self) -> bytes:
+        tracks = self._tracks
+        playing = 0
+        ducking = False
+        for track in tracks:
+            track.data = data = track.source.read()
+            if data:
+                playing += 1
+                ducking = ducking or track.duck
+
+        if playing != len(tracks):
+            self._remove_finished([track for track in tracks if not track.data])
+        if not playing:
+            # sources added during this read play from the next frame
+            return self._silence if self.keep_alive or self._tracks else b""
+
+        volume = self._volume
+        duck_volume = self.duck_volume * volume if ducking else volume
+        if HAS_NUMPY:
+            return self._mix_numpy(tracks, volume, duck_volume)
+        return self._mix_audioop(tracks, volume, duck_volume)
+
+    def _mix_numpy(self, tracks, volume: float, duck_volume: float) -> bytes:
+        mix = self._mix
+        scratch = self._scratch
+        gains = self._gains
+        mix.fill(0)
+        for track in tracks:
+            if not track.data:
+                continue
+            # a partial last frame may end in half a sample
+            samples = numpy.frombuffer(
+                track.data, numpy.int16, count=len(track.data) // 2
+            )
+            size = len(samples)
+            gain = track.volume * (volume if track.duck else duck_volume)
+            if gain == track.gain:
+                numpy.multiply(samples, gain, out=scratch[:size])
+            else:
+                # ramp to the new gain over this frame instead of clicking
+                numpy.multiply(self._ramp[:size], gain - track.gain, out=gains[:size])
+                gains[:size] += track.gain
+                numpy.multiply(samples, gains[:size], out=scratch[:size])
+                track.gain = gain
+            mix[:size] += scratch[:size]
+
+        numpy.clip(mix, -32768, 32767, out=mix)
+        numpy.copyto(self._out, mix, casting="unsafe")
+        return self._out.tobytes()
+
+    def _mix_audioop(self, tracks, volume: float, duck_volume: float) -> bytes:
+        frame_size = OpusEncoder.FRAME_SIZE
+        mixed = None
+        for track in tracks:
+            data = track.data
+            if not data:
+                continue
+            if len(data) < frame_size:
+                data = data + self._silence[len(data) :]
+            gain = track.volume * (volume if track.duck else duck_volume)
+            track.gain = gain
+            if gain != 1.0:
+                data = audioop.mul(data, 2, gain)
+            # audioop.add saturates instead of wrapping around
+            mixed = data if mixed is None else audioop.add(mixed, data, 2)
+        return mixed
+
+
+class PlaybackStats:
+    """Timing statistics of the audio sent by a :class:`VoiceClient`.
+
+    They are kept across everything played by the voice client, see
+    :attr:`VoiceClient.playback_stats`.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    ----------
+    frames: :class:`int`
+        The amount of frames sent.
+    underruns: :class:`int`
+        How often a frame was due before the audio source produced it.
+    overruns: :class:`int`
+        How often sending fell more than two frames behind schedule. The
+        schedule is restarted instead of sending the missed frames in a burst.
+    """
+
+    #: The upper bounds in milliseconds of the :attr:`jitter` buckets.
+    JITTER_BUCKETS: tuple[float, ...] = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, float("inf"))
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets all statistics."""
+        self.frames: int = 0
+        self.underruns: int = 0
+        self.overruns: int = 0
+        self._jitter: list[int] = [0] * len(self.JITTER_BUCKETS)
+
+    @property
+    def jitter(self) -> dict[float, int]:
+        """A histogram of how late frames were sent compared to their schedule.
+        Maps the upper bound of each bucket in milliseconds to the amount of
+        frames in it.
+        """
+        return dict(zip(self.JITTER_BUCKETS, self._jitter))
+
+    def _record(self, lateness: float) -> None:
+        self.frames += 1
+        self._jitter[bisect.bisect_left(self.JITTER_BUCKETS, lateness * 1000)] += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlaybackStats frames={self.frames} underruns={self.underruns} "
+            f"overruns={self.overruns}>"
+        )
+
+
+class _AudioPrefetcher(threading.Thread):
+    """Reads and encodes the frames of the player's source ahead of time,
+    so a slow read does not delay sending.
+    """
+
+    def __init__(self, player: AudioPlayer, depth: int):
+        super().__init__(daemon=True, name=f"{player.name}:prefetch")
+        self.player: AudioPlayer = player
+        self.depth: int = depth
+        self.frames: deque[bytes] = deque()
+        self.condition: threading.Condition = threading.Condition()
+        # bumped when the source is swapped, frames of the old source are dropped
+        self.generation: int = 0
+        self.finished: bool = False
+        self.error: Exception | None = None
+        self.stopping: bool = False
+
+    def _ready(self) -> bool:
+        return self.stopping or (not self.finished and len(self.frames) < self.depth)
+
+    def run(self) -> None:
+        player = self.player
+        while True:
+            with self.condition:
+                self.condition.wait_for(self._ready)
+                if self.stopping:
+                    return
+                generation = self.generation
+                source = player.source
+
+            error = None
+            try:
+                data = source.read()
+                if data and not source.is_opus():
+                    client = player.client
+                    if not client.encoder:
+                        client.encoder = OpusEncoder()
+                    data = client.encoder.encode(data, OpusEncoder.SAMPLES_PER_FRAME)
+            except Exception as exc:
+                data, error = b"", exc
+
+            with self.condition:
+                if generation != self.generation:
+                    continue
+                if data:
+                    self.frames.append(data)
+                else:
+                    self.finished = True
+                    self.error = error
+                self.condition.notify_all()
+
+    def pop(self, wait: bool = False) -> bytes | None:
+        """Returns the next frame, ``b""`` once the source ended or ``None``
+        if no frame is ready.
+        """
+        with self.condition:
+            if wait:
+                self.condition.wait_for(
+                    lambda: self.frames or self.finished or self.stopping
+                )
+            if self.frames:
+                frame = self.frames.popleft()
+                self.condition.notify_all()
+                return frame
+            return b"" if self.finished and not self.stopping else None
+
+    def reset(self) -> None:
+        with self.condition:
+            self.generation += 1
+            self.frames.clear()
+            self.finished = False
+            self.error = None
+            self.condition.notify_all()
+
+    def stop(self) -> None:
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+
+
 class AudioPlayer(threading.Thread):
     DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
+    # frames read and encoded ahead of sending
+    PREFETCH: int = 5
+    # frames sending may fall behind before the schedule is restarted
+    MAX_LAG: int = 2
 
-    def __init__(self, source: AudioSource, client: VoiceClient, *, after=None):
+    def __init__(
+        self,
+        source: AudioSource,
+        client: VoiceClient,
+        *,
+        after=None,
+        stats: PlaybackStats | None = None,
+    ):
         threading.Thread.__init__(self)
         self.daemon: bool = True
         self.source: AudioSource = source
         self.client: VoiceClient = client
         self.after: Callable[[Exception | None], Any] | None = after
+        self.stats: PlaybackStats = PlaybackStats() if stats is None else stats
 
         self._end: threading.Event = threading.Event()
         self._resumed: threading.Event = threading.Event()
@@ -712,6 +1355,7 @@ class AudioPlayer(threading.Thread):
         self._current_error: Exception | None = None
         self._connected: threading.Event = client._connected
         self._lock: threading.Lock = threading.Lock()
+        self._prefetcher: _AudioPrefetcher = _AudioPrefetcher(self, self.PREFETCH)
 
         if after is not None and not callable(after):
             raise TypeError('Expected a callable for the "after" parameter.')
@@ -722,6 +1366,10 @@ class AudioPlayer(threading.Thread):
 
         # getattr lookup speed ups
         play_audio = self.client.send_audio_packet
+        prefetcher = self._prefetcher
+        stats = self.stats
+        max_lag = self.DELAY * self.MAX_LAG
+        prefetcher.start()
         self._speak(True)
 
         while not self._end.is_set():
@@ -739,17 +1387,38 @@ class AudioPlayer(threading.Thread):
                 self.loops = 0
                 self._start = time.perf_counter()
 
-            self.loops += 1
-            data = self.source.read()
+            # every frame has a fixed slot, so sleep overshoot does not add up
+            next_time = self._start + self.DELAY * self.loops
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            data = prefetcher.pop(wait=not self.loops)
+            if data is None:
+                if self.loops:
+                    stats.underruns += 1
+                data = prefetcher.pop(wait=True)
+                if data is None:
+                    continue
+                # the late frame starts a new schedule rather than a burst
+                self.loops = 0
+                self._start = next_time = time.perf_counter()
 
             if not data:
+                if prefetcher.error is not None:
+                    raise prefetcher.error
                 self.stop()
                 break
 
-            play_audio(data, encode=not self.source.is_opus())
-            next_time = self._start + self.DELAY * self.loops
-            delay = max(0, self.DELAY + (next_time - time.perf_counter()))
-            time.sleep(delay)
+            lateness = time.perf_counter() - next_time
+            if lateness > max_lag:
+                stats.overruns += 1
+                self.loops = 0
+                self._start = time.perf_counter()
+
+            self.loops += 1
+            stats._record(lateness)
+            play_audio(data, encode=False)
 
     def run(self) -> None:
         try:
@@ -758,6 +1427,10 @@ class AudioPlayer(threading.Thread):
             self._current_error = exc
             self.stop()
         finally:
+            self._prefetcher.stop()
+            if self._prefetcher.is_alive():
+                # a read in progress is left to fail once the source is cleaned up
+                self._prefetcher.join(self.DELAY)
             self.source.cleanup()
             self._call_after()
 
@@ -780,6 +1453,7 @@ class AudioPlayer(threading.Thread):
     def stop(self) -> None:
         self._end.set()
         self._resumed.set()
+        self._prefetcher.stop()
         self._speak(False)
 
     def pause(self, *, update_speaking: bool = True) -> None:
@@ -804,6 +1478,7 @@ class AudioPlayer(threading.Thread):
         with self._lock:
             self.pause(update_speaking=False)
             self.source = source
+            self._prefetcher.reset()
             self.resume(update_speaking=False)
 
     def _speak(self, speaking: bool) -> None:
@@ -26,7 +26,10 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
+import time
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import aiohttp
@@ -43,9 +46,11 @@ from .errors import (
 )
 from .gateway import *
 from .state import AutoShardedConnectionState
+from .user import ClientUser
 
 if TYPE_CHECKING:
     from .activity import BaseActivity
+    from .cluster import ClusterLink
     from .gateway import DiscordWebSocket
 
     EI = TypeVar("EI", bound="EventItem")
@@ -58,6 +63,35 @@ __all__ = (
 _log = logging.getLogger(__name__)
 
 
+class _IdentifyRatelimiter:
+    """Spaces out the IDENTIFYs of shards sharing a ``max_concurrency`` bucket.
+
+    Shards whose ``shard_id % max_concurrency`` differ may identify in parallel.
+    """
+
+    # whether the client checks the session start limit before acquiring,
+    # ratelimiters that count the identifies elsewhere turn it off
+    counts_session_starts: bool = True
+
+    def __init__(self, max_concurrency: int, per: float = 5.0) -> None:
+        self.max_concurrency: int = max_concurrency
+        self.per: float = per
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._next: dict[int, float] = {}
+
+    def bucket(self, shard_id: int) -> int:
+        return shard_id % self.max_concurrency
+
+    async def acquire(self, shard_id: int) -> None:
+        key = self.bucket(shard_id)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            delay = self._next.get(key, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next[key] = time.monotonic() + self.per
+
+
 class EventType:
     close = 0
     reconnect = 1
@@ -128,9 +162,9 @@ class Shard:
         if self._task is not None and not self._task.done():
             self._task.cancel()
 
-    async def close(self) -> None:
+    async def close(self, code: int = 1000) -> None:
         self._cancel_task()
-        await self.ws.close(code=1000)
+        await self.ws.close(code=code)
 
     async def disconnect(self) -> None:
         await self.close()
@@ -297,6 +331,16 @@ class ShardInfo:
         """Measures latency between a HEARTBEAT and a HEARTBEAT_ACK in seconds for this shard."""
         return self._parent.ws.latency
 
+    @property
+    def heartbeat_jitter(self) -> float:
+        """The average delay of this shard's recent heartbeats behind their schedule in seconds.
+
+        A growing value means the event loop is too busy to send heartbeats on time.
+
+        .. versionadded:: 2.6
+        """
+        return self._parent.ws.heartbeat_jitter
+
     def is_ws_ratelimited(self) -> bool:
         """Whether the websocket is currently rate limited.
 
@@ -329,15 +373,38 @@ class AutoShardedClient(Client):
     if this is used. By default, when omitted, the client will launch shards from
     0 to ``shard_count - 1``.
 
+    Shards are identified in parallel as far as the ``max_concurrency`` of the
+    bot's session start limit allows, and the Bot Gateway information is cached
+    until that limit resets.
+
+    If a ``session_cache`` path is given, the gateway information and the session
+    of every shard are written to that JSON file on :meth:`close`, which then
+    leaves the sessions resumable. The next launch resumes shards from it when
+    their session is at most :attr:`SESSION_RESUME_TIMEOUT` seconds old instead
+    of identifying them. A resumed shard receives no ``READY`` or
+    ``GUILD_CREATE`` events, so the cache only contains what later events carry;
+    only use this if the bot does not rely on a fully populated cache.
+
+    .. versionchanged:: 2.6
+        Added ``session_cache`` and parallel identifying.
+
     Attributes
     ----------
     shard_ids: Optional[List[:class:`int`]]
         An optional list of shard_ids to launch the shards with.
+    cluster: Optional[:class:`ClusterLink`]
+        The link to the :class:`ShardCluster` supervising this client, if it
+        was created in a cluster worker process.
+
+        .. versionadded:: 2.6
     """
 
     if TYPE_CHECKING:
         _connection: AutoShardedConnectionState
 
+    # seconds after closing a persisted session is still assumed to be resumable
+    SESSION_RESUME_TIMEOUT: float = 120.0
+
     def __init__(
         self,
         *args: Any,
@@ -346,6 +413,9 @@ class AutoShardedClient(Client):
     ) -> None:
         kwargs.pop("shard_id", None)
         self.shard_ids: list[int] | None = kwargs.pop("shard_ids", None)
+        self.session_cache: str | os.PathLike | None = kwargs.pop(
+            "session_cache", None
+        )
         super().__init__(*args, loop=loop, **kwargs)
 
         if self.shard_ids is not None:
@@ -362,6 +432,8 @@ class AutoShardedClient(Client):
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
         self.__queue = asyncio.PriorityQueue()
+        self._identify_ratelimiter = _IdentifyRatelimiter(1)
+        self.cluster: ClusterLink | None = None
 
     def _get_websocket(
         self, guild_id: int | None = None, *, shard_id: int | None = None
@@ -404,6 +476,20 @@ class AutoShardedClient(Client):
             (shard_id, shard.ws.latency) for shard_id, shard in self.__shards.items()
         ]
 
+    @property
+    def heartbeat_jitters(self) -> list[tuple[int, float]]:
+        """A list of the average delays of every shard's recent heartbeats
+        behind their schedule in seconds.
+
+        This returns a list of tuples with elements ``(shard_id, jitter)``.
+
+        .. versionadded:: 2.6
+        """
+        return [
+            (shard_id, shard.ws.heartbeat_jitter)
+            for shard_id, shard in self.__shards.items()
+        ]
+
     def get_shard(self, shard_id: int) -> ShardInfo | None:
         """Gets the shard information at a given shard ID or ``None`` if not found."""
         try:
@@ -421,37 +507,184 @@ class AutoShardedClient(Client):
             for shard_id, parent in self.__shards.items()
         }
 
-    async def launch_shard(
-        self, gateway: str, shard_id: int, *, initial: bool = False
+    async def _call_before_identify_hook(
+        self, shard_id: int | None, *, initial: bool = False
     ) -> None:
+        if self._identify_ratelimiter.counts_session_starts:
+            info = await self.http.get_bot_gateway_info()
+            limit = info["session_start_limit"]
+            if limit["remaining"] <= 0:
+                # reset_after is as old as the info, which may come from the session
+                # cache, the expiry was adjusted to when the limit actually resets
+                delay = max(0.0, self.http._bot_gateway_expires - time.monotonic())
+                _log.warning(
+                    "Session start limit exhausted, shard ID %s waits %.2fs to identify.",
+                    shard_id,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                info = await self.http.get_bot_gateway_info(refresh=True)
+                limit = info["session_start_limit"]
+            limit["remaining"] -= 1
+
+        await self._identify_ratelimiter.acquire(shard_id or 0)
+        # the default hook's fixed sleep is superseded by the ratelimiter
+        if type(self).before_identify_hook is not Client.before_identify_hook:
+            await self.before_identify_hook(shard_id, initial=initial)
+
+    def _load_session_cache(self) -> dict[str, Any]:
+        if self.session_cache is None:
+            return {}
+
         try:
-            coro = DiscordWebSocket.from_client(
-                self, initial=initial, gateway=gateway, shard_id=shard_id
+            with open(self.session_cache, encoding="utf-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            _log.warning(
+                "Ignoring unreadable session cache %s", self.session_cache, exc_info=True
+            )
+            return {}
+
+    def _save_session_cache(self) -> None:
+        if self.session_cache is None:
+            return
+
+        data: dict[str, Any] = {
+            "saved_at": time.time(),
+            "shard_count": self.shard_count,
+            "shards": {
+                str(shard_id): {
+                    "session_id": shard.ws.session_id,
+                    "sequence": shard.ws.sequence,
+                    "resume_gateway_url": shard.ws.resume_gateway_url,
+                }
+                for shard_id, shard in self.__shards.items()
+                if shard.ws.session_id is not None and shard.ws.resume_gateway_url
+            },
+        }
+        if self.http._bot_gateway is not None:
+            data["gateway"] = self.http._bot_gateway
+            data["gateway_expires_at"] = time.time() + (
+                self.http._bot_gateway_expires - time.monotonic()
             )
+        if self.user is not None:
+            data["user"] = self.user._to_minimal_user_json()
+            data["application_id"] = self.application_id
+
+        tmp = f"{os.fspath(self.session_cache)}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fp:
+                json.dump(data, fp, separators=(",", ":"))
+            os.replace(tmp, self.session_cache)
+        except OSError:
+            _log.warning(
+                "Failed to write session cache %s", self.session_cache, exc_info=True
+            )
+
+    def _get_resumable_sessions(self, cache: dict[str, Any]) -> dict[int, Any]:
+        if (
+            cache.get("shard_count") != self.shard_count
+            or time.time() - cache.get("saved_at", 0) > self.SESSION_RESUME_TIMEOUT
+            or "user" not in cache
+        ):
+            return {}
+
+        state = self._connection
+        if state.user is None:
+            state.user = user = ClientUser(state=state, data=cache["user"])
+            state._users[user.id] = user  # type: ignore
+        if state.application_id is None:
+            state.application_id = cache.get("application_id")
+
+        return {int(shard_id): data for shard_id, data in cache["shards"].items()}
+
+    async def launch_shard(
+        self,
+        gateway: str,
+        shard_id: int,
+        *,
+        initial: bool = False,
+        session: dict[str, Any] | None = None,
+    ) -> None:
+        try:
+            if session is None:
+                coro = DiscordWebSocket.from_client(
+                    self, initial=initial, gateway=gateway, shard_id=shard_id
+                )
+            else:
+                _, _, query = gateway.partition("?")
+                coro = DiscordWebSocket.from_client(
+                    self,
+                    gateway=f"{session['resume_gateway_url']}?{query}",
+                    shard_id=shard_id,
+                    session=session["session_id"],
+                    sequence=session["sequence"],
+                    resume=True,
+                )
             ws = await asyncio.wait_for(coro, timeout=180.0)
         except Exception:
             _log.exception("Failed to connect for shard_id: %s. Retrying...", shard_id)
             await asyncio.sleep(5.0)
             return await self.launch_shard(gateway, shard_id)
 
+        if session is not None:
+            ws.resume_gateway_url = session["resume_gateway_url"]
+
         # keep reading the shard while others connect
         self.__shards[shard_id] = ret = Shard(ws, self, self.__queue.put_nowait)
         ret.launch()
 
     async def launch_shards(self) -> None:
+        cache = self._load_session_cache()
+        expires_in = cache.get("gateway_expires_at", 0) - time.time()
+        if "gateway" in cache and expires_in > 0:
+            self.http.set_bot_gateway_info(cache["gateway"], expires_in)
+
+        shard_count, gateway = await self.http.get_bot_gateway()
         if self.shard_count is None:
-            self.shard_count, gateway = await self.http.get_bot_gateway()
-        else:
-            gateway = await self.http.get_gateway()
+            self.shard_count = shard_count
 
         self._connection.shard_count = self.shard_count
 
         shard_ids = self.shard_ids or range(self.shard_count)
         self._connection.shard_ids = shard_ids
 
+        info = await self.http.get_bot_gateway_info()
+        limiter = self._identify_ratelimiter
+        limiter.max_concurrency = info["session_start_limit"]["max_concurrency"]
+
+        sessions = self._get_resumable_sessions(cache)
+        resumed = [shard_id for shard_id in shard_ids if shard_id in sessions]
+        if resumed:
+            if len(resumed) == len(shard_ids):
+                # otherwise the READY of the identified shards dispatches on_ready
+                self._connection._pending_resumes.update(resumed)
+            await asyncio.gather(
+                *(
+                    self.launch_shard(gateway, shard_id, session=sessions[shard_id])
+                    for shard_id in resumed
+                )
+            )
+
+        # launch one shard of every concurrency bucket at a time
+        buckets: dict[int, list[int]] = {}
         for shard_id in shard_ids:
-            initial = shard_id == shard_ids[0]
-            await self.launch_shard(gateway, shard_id, initial=initial)
+            if shard_id not in sessions:
+                buckets.setdefault(limiter.bucket(shard_id), []).append(shard_id)
+        queues = list(buckets.values())
+        first = shard_ids[0]
+        for wave in range(max(map(len, queues), default=0)):
+            await asyncio.gather(
+                *(
+                    self.launch_shard(
+                        gateway, queue[wave], initial=queue[wave] == first
+                    )
+                    for queue in queues
+                    if wave < len(queue)
+                )
+            )
 
         self._connection.shards_launched.set()
 
@@ -492,12 +725,15 @@ class AutoShardedClient(Client):
             except Exception:
                 pass
 
+        # closing with 1000 would invalidate the sessions we want to resume
+        code = 1000 if self.session_cache is None else 4000
         to_close = [
-            asyncio.ensure_future(shard.close(), loop=self.loop)
+            asyncio.ensure_future(shard.close(code), loop=self.loop)
             for shard in self.__shards.values()
         ]
         if to_close:
             await asyncio.wait(to_close)
+        self._save_session_cache()
 
         await self.http.close()
         self.__queue.put_nowait(EventItem(EventType.clean_close, None, None))
@@ -17,4 +17,5 @@ from .mp3 import *
 from .mp4 import *
 from .ogg import *
 from .pcm import *
+from .streaming import *
 from .wave import *
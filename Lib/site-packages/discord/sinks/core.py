@@ -51,6 +51,10 @@ else:
     CREATE_NO_WINDOW = 0x08000000
 
 
+# version, payload type, sequence, timestamp, ssrc
+_RTP_HEADER = struct.Struct(">xxHII")
+
+
 default_filters = {
     "time": 0,
     "users": [],
@@ -102,22 +106,39 @@ class RawData:
     """
 
     def __init__(self, data, client):
-        self.data = bytearray(data)
+        # data may be a view into a reused receive buffer, only copies are kept
         self.client = client
 
-        self.header = data[:12]
-        self.data = self.data[12:]
+        self.header = bytes(data[:12])
+        self.data = bytes(data[12:])
 
-        unpacker = struct.Struct(">xxHII")
-        self.sequence, self.timestamp, self.ssrc = unpacker.unpack_from(self.header)
-        self.decrypted_data = getattr(self.client, f"_decrypt_{self.client.mode}")(
-            self.header, self.data
+        self.sequence, self.timestamp, self.ssrc = _RTP_HEADER.unpack_from(
+            self.header
         )
+        decrypt = getattr(client, "_decrypt_packet", None)
+        if decrypt is None:
+            decrypt = getattr(client, f"_decrypt_{client.mode}")
+        self.decrypted_data = decrypt(self.header, self.data)
         self.decoded_data = None
 
         self.user_id = None
         self.receive_time = time.perf_counter()
 
+    @classmethod
+    def _lost(cls, client, ssrc: int, sequence: int, timestamp: int) -> "RawData":
+        # stands in for a packet that never arrived, decoding it conceals the loss
+        self = cls.__new__(cls)
+        self.client = client
+        self.data = self.header = b""
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.ssrc = ssrc
+        self.decrypted_data = None
+        self.decoded_data = None
+        self.user_id = None
+        self.receive_time = time.perf_counter()
+        return self
+
 
 class AudioData:
     """Handles data that's been completely decrypted and decoded and is ready to be saved to file.
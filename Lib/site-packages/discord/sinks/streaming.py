@@ -0,0 +1,255 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import logging
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+
+from .core import CREATE_NO_WINDOW, AudioData, Filters, Sink, default_filters
+from .errors import SinkException, StreamingSinkError
+
+__all__ = (
+    "StreamingAudioData",
+    "StreamingSink",
+)
+
+_log = logging.getLogger(__name__)
+
+# ffmpeg muxer and options per encoding, the output is a pipe so the
+# mp4 based containers are written fragmented
+_FFMPEG_FORMATS = {
+    "mp3": ("mp3",),
+    "ogg": ("ogg",),
+    "mka": ("matroska",),
+    "mkv": ("matroska",),
+    "mp4": ("mp4", "-movflags", "frag_keyframe+empty_moov"),
+    "m4a": ("ipod", "-movflags", "frag_keyframe+empty_moov"),
+}
+
+
+class StreamingAudioData(AudioData):
+    """Audio data that is written to a temporary file while it is recorded.
+
+    PCM is either appended to the file directly or piped into an ffmpeg process
+    encoding into the file, so only a small write buffer is kept in memory.
+
+    .. versionadded:: 2.6
+
+    Attributes
+    ----------
+    file
+        The temporary file holding the audio. It is deleted once closed.
+    size: :class:`int`
+        The amount of PCM bytes written so far.
+    """
+
+    def __init__(self, file, *, process=None, wav=None):
+        super().__init__(file)
+        self.process = process
+        self.size = 0
+        self._wav = wav
+        if process is not None:
+            self._write = process.stdin.write
+        elif wav is not None:
+            self._write = wav.writeframesraw
+        else:
+            self._write = file.write
+
+    def write(self, data):
+        """Writes audio data.
+
+        Raises
+        ------
+        ClientException
+            The AudioData is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The AudioData is already finished writing.")
+        if self._write is None:
+            return
+        try:
+            self._write(data)
+        except (OSError, ValueError):
+            # the encoder went away, the rest of the recording is discarded
+            # instead of taking down the decoding thread
+            _log.exception("Writing to the audio file failed.")
+            self._write = None
+        else:
+            self.size += len(data)
+
+    def cleanup(self):
+        """Finishes the file. Only the tail of the recording is left to encode,
+        so this takes about the same time for any recording length.
+
+        Raises
+        ------
+        ClientException
+            The AudioData is already finished writing.
+        """
+        if self.finished:
+            raise SinkException("The AudioData is already finished writing.")
+        self._write = None
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            self.process.wait()
+        elif self._wav is not None:
+            # patches the sizes in the header
+            self._wav.close()
+        else:
+            self.file.flush()
+        self.file.seek(0)
+        self.finished = True
+
+
+class StreamingSink(Sink):
+    """A sink that streams every user's audio to a temporary file as it arrives.
+
+    Unlike the other sinks, which keep the whole recording in memory and encode
+    it once the recording stopped, encoding happens incrementally through one
+    ffmpeg process per user, so memory usage does not grow with the length of
+    the recording.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ----------
+    encoding: :class:`str`
+        The format to record in. One of ``pcm``, ``wav``, ``mp3``, ``ogg``,
+        ``mka``, ``mkv``, ``mp4`` or ``m4a``. Everything but ``pcm`` and ``wav``
+        requires ffmpeg.
+    filters: Optional[:class:`dict`]
+        The filters to apply, see :class:`~.Filters`.
+    directory: Optional[:class:`str`]
+        The directory to create the temporary files in. Defaults to the
+        system's temporary directory.
+
+    Raises
+    ------
+    StreamingSinkError
+        An invalid encoding type was specified.
+    """
+
+    def __init__(self, encoding="wav", *, filters=None, directory=None):
+        if encoding not in _FFMPEG_FORMATS and encoding not in ("pcm", "wav"):
+            raise StreamingSinkError(f"Unsupported encoding {encoding!r}.")
+        if filters is None:
+            filters = default_filters
+        self.filters = filters
+        Filters.__init__(self, **self.filters)
+
+        self.encoding = encoding
+        self.directory = directory
+        self.vc = None
+        self.audio_data = {}
+        self._lock = threading.Lock()
+
+    def init(self, vc):
+        if self.encoding in _FFMPEG_FORMATS and shutil.which("ffmpeg") is None:
+            raise StreamingSinkError("ffmpeg was not found.")
+        super().init(vc)
+
+    def _open(self):
+        file = tempfile.TemporaryFile(
+            suffix=f".{self.encoding}", dir=self.directory
+        )
+        if self.encoding == "pcm":
+            return StreamingAudioData(file)
+
+        decoder = self.vc.decoder
+        if self.encoding == "wav":
+            wav = wave.open(file, "wb")
+            wav.setnchannels(decoder.CHANNELS)
+            wav.setsampwidth(decoder.SAMPLE_SIZE // decoder.CHANNELS)
+            wav.setframerate(decoder.SAMPLING_RATE)
+            return StreamingAudioData(file, wav=wav)
+
+        args = [
+            "ffmpeg",
+            "-f",
+            "s16le",
+            "-ar",
+            str(decoder.SAMPLING_RATE),
+            "-loglevel",
+            "error",
+            "-ac",
+            str(decoder.CHANNELS),
+            "-i",
+            "-",
+            "-f",
+            *_FFMPEG_FORMATS[self.encoding],
+            "pipe:1",
+        ]
+        try:
+            process = subprocess.Popen(
+                args,
+                creationflags=CREATE_NO_WINDOW,
+                stdin=subprocess.PIPE,
+                stdout=file,
+            )
+        except FileNotFoundError:
+            file.close()
+            raise StreamingSinkError("ffmpeg was not found.") from None
+        except subprocess.SubprocessError as exc:
+            file.close()
+            raise StreamingSinkError(
+                "Popen failed: {0.__class__.__name__}: {0}".format(exc)
+            ) from exc
+        return StreamingAudioData(file, process=process)
+
+    @Filters.container
+    def write(self, data, user):
+        audio = self.audio_data.get(user)
+        if audio is None:
+            # users are written from several decoding threads
+            with self._lock:
+                audio = self.audio_data.get(user)
+                if audio is None:
+                    try:
+                        audio = self._open()
+                    except StreamingSinkError:
+                        _log.exception("Could not start recording user %s.", user)
+                        return
+                    self.audio_data[user] = audio
+        audio.write(data)
+
+    def format_audio(self, audio):
+        """Formats the recorded audio. The audio is already encoded while
+        recording, so this only marks it as formatted.
+
+        Raises
+        ------
+        StreamingSinkError
+            Audio may only be formatted after recording is finished.
+        """
+        if self.vc.recording:
+            raise StreamingSinkError(
+                "Audio may only be formatted after recording is finished."
+            )
+        audio.on_format(self.encoding)
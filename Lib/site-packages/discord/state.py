@@ -27,17 +27,20 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import heapq
 import inspect
 import itertools
 import logging
 import os
-from collections import OrderedDict, deque
+import time
+from collections import OrderedDict
+from collections.abc import Sequence as _Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
-    Deque,
+    Iterator,
     Sequence,
     TypeVar,
     Union,
@@ -95,6 +98,100 @@ if TYPE_CHECKING:
     Channel = Union[GuildChannel, VocalGuildChannel, PrivateChannel, PartialMessageable]
 
 
+def _dispatches(*events: str) -> Callable[[Callable[[Any, Any], None]], Any]:
+    # Marks a parser that only dispatches ``events`` and leaves the cache alone,
+    # so that it can be skipped entirely when nothing listens to any of them.
+    def decorator(func: Callable[[Any, Any], None]) -> Callable[[Any, Any], None]:
+        func.__dispatches__ = events  # type: ignore
+        return func
+
+    return decorator
+
+
+class MessageCache(_Sequence):
+    """Insertion ordered message cache with O(1) lookup, insertion and eviction.
+
+    The cache is bounded either by a number of messages or, when ``max_bytes``
+    is given, by an approximate memory budget. As a sequence it is a live view
+    of the cached messages, oldest first; indexing by position is O(n).
+    """
+
+    # Rough footprint of a cached Message with its author and slot references.
+    BASE_SIZE = 1024
+    EMBED_SIZE = 1024
+    ATTACHMENT_SIZE = 256
+
+    __slots__ = ("max_messages", "max_bytes", "size", "_messages", "_sizes")
+
+    def __init__(
+        self, max_messages: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        self.max_messages: int | None = max_messages
+        self.max_bytes: int | None = max_bytes
+        self.size: int = 0
+        self._messages: OrderedDict[int, Message] = OrderedDict()
+        self._sizes: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages.values())
+
+    def __reversed__(self) -> Iterator[Message]:
+        return reversed(self._messages.values())
+
+    def __contains__(self, message: Any) -> bool:
+        return self._messages.get(getattr(message, "id", None)) == message
+
+    def __getitem__(self, index: int) -> Message:  # type: ignore
+        size = len(self._messages)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("message cache index out of range")
+        # walk from whichever end is closer
+        if index < size // 2:
+            return next(itertools.islice(self._messages.values(), index, None))
+        return next(
+            itertools.islice(reversed(self._messages.values()), size - index - 1, None)
+        )
+
+    @classmethod
+    def estimate_size(cls, message: Message) -> int:
+        return (
+            cls.BASE_SIZE
+            + len(message.content)
+            + cls.EMBED_SIZE * len(message.embeds)
+            + cls.ATTACHMENT_SIZE * len(message.attachments)
+        )
+
+    def get(self, message_id: int | None) -> Message | None:
+        return self._messages.get(message_id)  # type: ignore
+
+    def append(self, message: Message) -> None:
+        self.pop(message.id)
+        self._messages[message.id] = message
+        if self.max_bytes is not None:
+            size = self.estimate_size(message)
+            self._sizes[message.id] = size
+            self.size += size
+            while self.size > self.max_bytes and len(self._messages) > 1:
+                self.pop(next(iter(self._messages)))
+        elif self.max_messages is not None:
+            while len(self._messages) > self.max_messages:
+                self._messages.popitem(last=False)
+
+    def pop(self, message_id: int) -> Message | None:
+        message = self._messages.pop(message_id, None)
+        if message is not None and self.max_bytes is not None:
+            self.size -= self._sizes.pop(message_id, 0)
+        return message
+
+    def values(self) -> list[Message]:
+        return list(self._messages.values())
+
+
 class ChunkRequest:
     def __init__(
         self,
@@ -103,20 +200,35 @@ class ChunkRequest:
         resolver: Callable[[int], Any],
         *,
         cache: bool = True,
+        buffer: bool = True,
     ) -> None:
         self.guild_id: int = guild_id
         self.resolver: Callable[[int], Any] = resolver
         self.loop: asyncio.AbstractEventLoop = loop
         self.cache: bool = cache
+        # without a buffer the members are only streamed into the guild's cache
+        # and the waiters receive Guild.members once the last chunk arrived
+        self.buffered: bool = buffer or not cache
         self.nonce: str = os.urandom(16).hex()
         self.buffer: list[Member] = []
         self.waiters: list[asyncio.Future[list[Member]]] = []
+        # called with the members of every chunk as it arrives
+        self.listeners: list[Callable[[list[Member]], Any]] = []
 
     def add_members(self, members: list[Member]) -> None:
-        self.buffer.extend(members)
+        for listener in self.listeners:
+            try:
+                listener(members)
+            except Exception:
+                _log.exception("Chunk listener for guild_id %s raised.", self.guild_id)
+        if self.buffered:
+            self.buffer.extend(members)
         if self.cache:
             guild = self.resolver(self.guild_id)
             if guild is None:
+                if not self.buffered:
+                    self.buffered = True
+                    self.buffer.extend(members)
                 return
 
             for member in members:
@@ -138,9 +250,96 @@ class ChunkRequest:
         return future
 
     def done(self) -> None:
+        result = self.buffer
+        if not self.buffered:
+            guild = self.resolver(self.guild_id)
+            result = guild.members if guild is not None else []
         for future in self.waiters:
             if not future.done():
-                future.set_result(self.buffer)
+                future.set_result(result)
+
+
+class ChunkScheduler:
+    """Requests the members of guilds at startup with a bounded number of
+    chunk requests in flight.
+
+    Guilds are chunked by ascending priority, then in the order they were
+    scheduled. :meth:`bump` moves a guild that is still queued ahead of the
+    others, which the state does for guilds with interactions or member joins.
+    """
+
+    # seconds to wait for the last chunk of a guild before freeing its slot
+    CHUNK_TIMEOUT: float = 60.0
+
+    def __init__(self, state: ConnectionState) -> None:
+        self._state: ConnectionState = state
+        self._heap: list[tuple[int, int, int]] = []
+        self._queued: dict[int, tuple[int, int, int]] = {}
+        self._futures: dict[int, asyncio.Future[list[Member]]] = {}
+        self._counter = itertools.count()
+        self.in_flight: int = 0
+        self.completed: int = 0
+        self.timed_out: int = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._queued)
+
+    def schedule(self, guild: Guild, priority: int = 0) -> asyncio.Future[list[Member]]:
+        try:
+            return self._futures[guild.id]
+        except KeyError:
+            pass
+
+        future = self._futures[guild.id] = self._state.loop.create_future()
+        self._push(guild.id, priority)
+        self._pump()
+        return future
+
+    def bump(self, guild_id: int) -> None:
+        entry = self._queued.get(guild_id)
+        if entry is not None and entry[0] > -1:
+            self._push(guild_id, -1)
+
+    def _push(self, guild_id: int, priority: int) -> None:
+        entry = (priority, next(self._counter), guild_id)
+        # replaced entries stay in the heap and are skipped once popped
+        self._queued[guild_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _pump(self) -> None:
+        limit = self._state._chunk_concurrency()
+        while self.in_flight < limit and self._heap:
+            entry = heapq.heappop(self._heap)
+            guild_id = entry[2]
+            if self._queued.get(guild_id) is not entry:
+                continue
+            del self._queued[guild_id]
+            self.in_flight += 1
+            self._state.loop.create_task(self._chunk(guild_id))
+
+    async def _chunk(self, guild_id: int) -> None:
+        state = self._state
+        result: list[Member] = []
+        try:
+            guild = state._get_guild(guild_id)
+            if guild is not None and state._guild_needs_chunking(guild):
+                result = await asyncio.wait_for(
+                    state.chunk_guild(guild, buffer=False), timeout=self.CHUNK_TIMEOUT
+                )
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            _log.warning("Timed out waiting for chunks for guild_id %s.", guild_id)
+        except Exception:
+            _log.exception("Failed to chunk guild_id %s.", guild_id)
+        else:
+            self.completed += 1
+        finally:
+            self.in_flight -= 1
+            future = self._futures.pop(guild_id, None)
+            if future is not None and not future.done():
+                future.set_result(result)
+            self._pump()
 
 
 _log = logging.getLogger(__name__)
@@ -161,6 +360,12 @@ class ConnectionState:
         _get_client: Callable[..., Client]
         _parsers: dict[str, Callable[[dict[str, Any]], None]]
 
+    # distinct role id combinations shared between member records
+    _ROLE_ID_ARRAYS_LIMIT: int = 10_000
+    # member requests are gateway commands, which are rate limited per connection
+    # rather than by the identify concurrency
+    _CHUNK_CONCURRENCY_PER_SHARD: int = 2
+
     def __init__(
         self,
         *,
@@ -176,6 +381,12 @@ class ConnectionState:
         self.max_messages: int | None = options.get("max_messages", 1000)
         if self.max_messages is not None and self.max_messages <= 0:
             self.max_messages = 1000
+        self.max_messages_bytes: int | None = options.get("max_messages_bytes")
+        if self.max_messages_bytes is not None and self.max_messages_bytes <= 0:
+            raise ValueError("max_messages_bytes must be a positive integer")
+        self.member_cache_limit: int | None = options.get("member_cache_limit")
+        if self.member_cache_limit is not None and self.member_cache_limit <= 0:
+            raise ValueError("member_cache_limit must be a positive integer")
 
         self.dispatch: Callable = dispatch
         self.handlers: dict[str, Callable] = handlers
@@ -189,6 +400,12 @@ class ConnectionState:
         self.guild_ready_timeout: float = options.get("guild_ready_timeout", 2.0)
         if self.guild_ready_timeout < 0:
             raise ValueError("guild_ready_timeout cannot be negative")
+        self.chunk_concurrency: int | None = options.get("chunk_concurrency")
+        if self.chunk_concurrency is not None and self.chunk_concurrency <= 0:
+            raise ValueError("chunk_concurrency must be a positive integer")
+        # seconds between READY and on_ready of the last startup
+        self.time_to_ready: float | None = None
+        self._ready_started: float = 0.0
 
         allowed_mentions = options.get("allowed_mentions")
 
@@ -253,13 +470,38 @@ class ConnectionState:
             self.store_user = self.create_user  # type: ignore
             self.deref_user = self.deref_user_no_intents  # type: ignore
 
+        self.skip_unobserved_events: bool = options.get(
+            "skip_unobserved_events", True
+        )
+        self._skipped_events: dict[str, int] = {}
+
         self.parsers = parsers = {}
         for attr, func in inspect.getmembers(self):
             if attr.startswith("parse_"):
-                parsers[attr[6:].upper()] = func
+                event = attr[6:].upper()
+                dispatches = getattr(func, "__dispatches__", None)
+                if dispatches and self.skip_unobserved_events:
+                    func = self._skip_unobserved(event, func, dispatches)
+                parsers[event] = func
 
         self.clear()
 
+    def _skip_unobserved(
+        self,
+        event: str,
+        parser: Callable[[Any], None],
+        dispatches: tuple[str, ...],
+    ) -> Callable[[Any], None]:
+        def skip_or_parse(data: Any) -> None:
+            client = self._get_client()
+            for name in dispatches:
+                if client._has_listeners(name):
+                    return parser(data)
+
+            self._skipped_events[event] = self._skipped_events.get(event, 0) + 1
+
+        return skip_or_parse
+
     def clear(self, *, views: bool = True) -> None:
         self.user: ClientUser | None = None
         # Originally, this code used WeakValueDictionary to maintain references to the
@@ -275,9 +517,12 @@ class ConnectionState:
         # using __del__. Testing this for memory leaks led to no discernible leaks,
         # though more testing will have to be done.
         self._users: dict[int, User] = {}
+        # role id tuples shared between compact member records
+        self._role_id_arrays: dict[tuple[int, ...], tuple[int, ...]] = {}
         self._emojis: dict[int, Emoji] = {}
         self._stickers: dict[int, GuildSticker] = {}
         self._guilds: dict[int, Guild] = {}
+        self._chunk_scheduler: ChunkScheduler = ChunkScheduler(self)
         if views:
             self._view_store: ViewStore = ViewStore(self)
         self._modal_store: ModalStore = ModalStore(self)
@@ -288,9 +533,11 @@ class ConnectionState:
         # extra dict to look up private channels by user id
         self._private_channels_by_user: dict[int, DMChannel] = {}
         if self.max_messages is not None:
-            self._messages: Deque[Message] | None = deque(maxlen=self.max_messages)
+            self._messages: MessageCache | None = MessageCache(
+                self.max_messages, self.max_messages_bytes
+            )
         else:
-            self._messages: Deque[Message] | None = None
+            self._messages: MessageCache | None = None
 
     def process_chunk_requests(
         self, guild_id: int, nonce: str | None, members: list[Member], complete: bool
@@ -362,6 +609,16 @@ class ConnectionState:
                 user._stored = True
             return user
 
+    def _intern_role_ids(self, role_ids: tuple[int, ...]) -> tuple[int, ...]:
+        arrays = self._role_id_arrays
+        interned = arrays.get(role_ids)
+        if interned is None:
+            if len(arrays) >= self._ROLE_ID_ARRAYS_LIMIT:
+                # records keep their tuples, only future sharing starts over
+                arrays.clear()
+            interned = arrays[role_ids] = role_ids
+        return interned
+
     def deref_user(self, user_id: int) -> None:
         self._users.pop(user_id, None)
 
@@ -481,17 +738,28 @@ class ConnectionState:
                 self._private_channels_by_user.pop(recipient.id, None)
 
     def _get_message(self, msg_id: int | None) -> Message | None:
-        return (
-            utils.find(lambda m: m.id == msg_id, reversed(self._messages))
-            if self._messages
-            else None
-        )
+        return self._messages.get(msg_id) if self._messages is not None else None
 
     def _add_guild_from_data(self, data: GuildPayload) -> Guild:
         guild = Guild(data=data, state=self)
         self._add_guild(guild)
         return guild
 
+    def _chunk_concurrency(self) -> int:
+        # a single gateway connection
+        return self.chunk_concurrency or self._CHUNK_CONCURRENCY_PER_SHARD
+
+    def _ready_done(self) -> None:
+        self.time_to_ready = time.perf_counter() - self._ready_started
+        scheduler = self._chunk_scheduler
+        _log.info(
+            "Ready after %.2fs, chunked %d guilds (%d timed out, %d still queued).",
+            self.time_to_ready,
+            scheduler.completed,
+            scheduler.timed_out,
+            scheduler.queued + scheduler.in_flight,
+        )
+
     def _guild_needs_chunking(self, guild: Guild) -> bool:
         # If presences are enabled then we get back the old guild.large behaviour
         return (
@@ -582,7 +850,7 @@ class ConnectionState:
                     break
                 else:
                     if self._guild_needs_chunking(guild):
-                        future = await self.chunk_guild(guild, wait=False)
+                        future = self._chunk_scheduler.schedule(guild)
                         states.append((guild, future))
                     elif guild.unavailable is False:
                         self.dispatch("guild_available", guild)
@@ -591,7 +859,8 @@ class ConnectionState:
 
             for guild, future in states:
                 try:
-                    await asyncio.wait_for(future, timeout=5.0)
+                    # a timeout leaves the guild queued to be chunked in the background
+                    await asyncio.wait_for(asyncio.shield(future), timeout=5.0)
                 except asyncio.TimeoutError:
                     _log.warning(
                         "Shard ID %s timed out waiting for chunks for guild_id %s.",
@@ -614,6 +883,7 @@ class ConnectionState:
             pass
         else:
             # dispatch the event
+            self._ready_done()
             self.call_handlers("ready")
             self.dispatch("ready")
         finally:
@@ -624,6 +894,7 @@ class ConnectionState:
             self._ready_task.cancel()
 
         self._ready_state = asyncio.Queue()
+        self._ready_started = time.perf_counter()
         self.clear(views=False)
         self.user = ClientUser(state=self, data=data["user"])
         self.store_user(data["user"])
@@ -651,31 +922,38 @@ class ConnectionState:
         # unsure what the implementation would be like
         pass
 
+    @_dispatches("auto_moderation_rule_create")
     def parse_auto_moderation_rule_create(self, data) -> None:
         rule = AutoModRule(state=self, data=data)
         self.dispatch("auto_moderation_rule_create", rule)
 
+    @_dispatches("auto_moderation_rule_update")
     def parse_auto_moderation_rule_update(self, data) -> None:
         # somehow get a 'before' object?
         rule = AutoModRule(state=self, data=data)
         self.dispatch("auto_moderation_rule_update", rule)
 
+    @_dispatches("auto_moderation_rule_delete")
     def parse_auto_moderation_rule_delete(self, data) -> None:
         rule = AutoModRule(state=self, data=data)
         self.dispatch("auto_moderation_rule_delete", rule)
 
+    @_dispatches("auto_moderation_action_execution")
     def parse_auto_moderation_action_execution(self, data) -> None:
         event = AutoModActionExecutionEvent(self, data)
         self.dispatch("auto_moderation_action_execution", event)
 
+    @_dispatches("entitlement_create")
     def parse_entitlement_create(self, data) -> None:
         event = Entitlement(data=data, state=self)
         self.dispatch("entitlement_create", event)
 
+    @_dispatches("entitlement_update")
     def parse_entitlement_update(self, data) -> None:
         event = Entitlement(data=data, state=self)
         self.dispatch("entitlement_update", event)
 
+    @_dispatches("entitlement_delete")
     def parse_entitlement_delete(self, data) -> None:
         event = Entitlement(data=data, state=self)
         self.dispatch("entitlement_delete", event)
@@ -703,14 +981,17 @@ class ConnectionState:
         self.dispatch("raw_message_delete", raw)
         if self._messages is not None and found is not None:
             self.dispatch("message_delete", found)
-            self._messages.remove(found)
+            self._messages.pop(found.id)
 
     def parse_message_delete_bulk(self, data) -> None:
         raw = RawBulkMessageDeleteEvent(data)
         if self._messages:
             found_messages = [
-                message for message in self._messages if message.id in raw.message_ids
+                message
+                for message_id in raw.message_ids
+                if (message := self._messages.get(message_id)) is not None
             ]
+            found_messages.sort(key=lambda m: m.id)
         else:
             found_messages = []
         raw.cached_messages = found_messages
@@ -719,7 +1000,7 @@ class ConnectionState:
             self.dispatch("bulk_message_delete", found_messages)
             for msg in found_messages:
                 # self._messages won't be None here
-                self._messages.remove(msg)  # type: ignore
+                self._messages.pop(msg.id)  # type: ignore
 
     def parse_message_update(self, data) -> None:
         raw = RawMessageUpdateEvent(data)
@@ -816,6 +1097,8 @@ class ConnectionState:
 
     def parse_interaction_create(self, data) -> None:
         interaction = Interaction(data=data, state=self)
+        if interaction.guild_id is not None:
+            self._chunk_scheduler.bump(interaction.guild_id)
         if data["type"] == 3:  # interaction component
             custom_id = interaction.data["custom_id"]  # type: ignore
             component_type = interaction.data["component_type"]  # type: ignore
@@ -867,10 +1150,12 @@ class ConnectionState:
         if ref:
             ref._update(data)
 
+    @_dispatches("invite_create")
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
         self.dispatch("invite_create", invite)
 
+    @_dispatches("invite_delete")
     def parse_invite_delete(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
         self.dispatch("invite_delete", invite)
@@ -937,6 +1222,7 @@ class ConnectionState:
             )
             return
 
+    @_dispatches("private_channel_pins_update", "guild_channel_pins_update")
     def parse_channel_pins_update(self, data) -> None:
         channel_id = int(data["channel_id"])
         try:
@@ -1165,6 +1451,9 @@ class ConnectionState:
             )
             return
 
+        # joins are what a raid looks like, get the members of this guild first
+        self._chunk_scheduler.bump(guild.id)
+
         member = Member(guild=guild, data=data, state=self)
         if self.member_cache_flags.joined:
             guild._add_member(member)
@@ -1281,16 +1570,22 @@ class ConnectionState:
     def is_guild_evicted(self, guild) -> bool:
         return guild.id not in self._guilds
 
-    async def chunk_guild(self, guild, *, wait=True, cache=None):
+    async def chunk_guild(self, guild, *, wait=True, cache=None, buffer=True, on_chunk=None):
         # Note: This method makes an API call without timeout, and should be used in
         #       conjunction with `asyncio.wait_for(..., timeout=...)`.
+        # Without a buffer the result is Guild.members, see ChunkRequest.
         cache = cache or self.member_cache_flags.joined
         request = self._chunk_requests.get(guild.id)  # nosec B113
         if request is None:
             self._chunk_requests[guild.id] = request = ChunkRequest(
-                guild.id, self.loop, self._get_guild, cache=cache
+                guild.id, self.loop, self._get_guild, cache=cache, buffer=buffer
             )
+            if on_chunk is not None:
+                request.listeners.append(on_chunk)
             await self.chunker(guild.id, nonce=request.nonce)
+        elif on_chunk is not None:
+            # joins a request in flight, earlier chunks are not replayed
+            request.listeners.append(on_chunk)
 
         if wait:
             return await request.wait()
@@ -1298,7 +1593,7 @@ class ConnectionState:
 
     async def _chunk_and_dispatch(self, guild, unavailable):
         try:
-            await asyncio.wait_for(self.chunk_guild(guild), timeout=60.0)
+            await asyncio.wait_for(self.chunk_guild(guild, buffer=False), timeout=60.0)
         except asyncio.TimeoutError:
             _log.info("Somehow timed out waiting for chunks.")
 
@@ -1365,14 +1660,13 @@ class ConnectionState:
 
         # do a cleanup of the messages cache
         if self._messages is not None:
-            self._messages: Deque[Message] | None = deque(
-                (msg for msg in self._messages if msg.guild != guild),
-                maxlen=self.max_messages,
-            )
+            for msg in [msg for msg in self._messages if msg.guild == guild]:
+                self._messages.pop(msg.id)
 
         self._remove_guild(guild)
         self.dispatch("guild_remove", guild)
 
+    @_dispatches("raw_audit_log_entry", "audit_log_entry")
     def parse_guild_audit_log_entry_create(self, data) -> None:
         guild = self._get_guild(int(data["guild_id"]))
         if guild is None:
@@ -1393,6 +1687,7 @@ class ConnectionState:
             entry = AuditLogEntry(users={data["user_id"]: user}, data=data, guild=guild)
             self.dispatch("audit_log_entry", entry)
 
+    @_dispatches("member_ban")
     def parse_guild_ban_add(self, data) -> None:
         # we make the assumption that GUILD_BAN_ADD is done
         # before GUILD_MEMBER_REMOVE is called
@@ -1409,6 +1704,7 @@ class ConnectionState:
                 member = guild.get_member(user.id) or user
                 self.dispatch("member_ban", guild, member)
 
+    @_dispatches("member_unban")
     def parse_guild_ban_remove(self, data) -> None:
         guild = self._get_guild(int(data["guild_id"]))
         if guild is not None and "user" in data:
@@ -1603,6 +1899,7 @@ class ConnectionState:
                 guild._add_scheduled_event(event)
                 self.dispatch("scheduled_event_user_remove", event, member)
 
+    @_dispatches("guild_integrations_update")
     def parse_guild_integrations_update(self, data) -> None:
         guild = self._get_guild(int(data["guild_id"]))
         if guild is not None:
@@ -1616,6 +1913,7 @@ class ConnectionState:
                 data["guild_id"],
             )
 
+    @_dispatches("integration_create")
     def parse_integration_create(self, data) -> None:
         guild_id = int(data.pop("guild_id"))
         guild = self._get_guild(guild_id)
@@ -1629,6 +1927,7 @@ class ConnectionState:
                 guild_id,
             )
 
+    @_dispatches("integration_update")
     def parse_integration_update(self, data) -> None:
         guild_id = int(data.pop("guild_id"))
         guild = self._get_guild(guild_id)
@@ -1642,6 +1941,7 @@ class ConnectionState:
                 guild_id,
             )
 
+    @_dispatches("raw_integration_delete")
     def parse_integration_delete(self, data) -> None:
         guild_id = int(data["guild_id"])
         guild = self._get_guild(guild_id)
@@ -1654,6 +1954,7 @@ class ConnectionState:
                 guild_id,
             )
 
+    @_dispatches("webhooks_update")
     def parse_webhooks_update(self, data) -> None:
         guild = self._get_guild(int(data["guild_id"]))
         if guild is None:
@@ -1809,6 +2110,7 @@ class ConnectionState:
                 data["guild_id"],
             )
 
+    @_dispatches("raw_typing", "typing")
     def parse_typing_start(self, data) -> None:
         raw = RawTypingEvent(data)
 
@@ -1903,6 +2205,8 @@ class AutoShardedConnectionState(ConnectionState):
         super().__init__(*args, **kwargs)
         self.shard_ids: list[int] | range = []
         self.shards_launched: asyncio.Event = asyncio.Event()
+        # shards launched by resuming a persisted session, which get no READY
+        self._pending_resumes: set[int] = set()
 
     def _update_message_references(self) -> None:
         # self._messages won't be None when this is called
@@ -1934,11 +2238,12 @@ class AutoShardedConnectionState(ConnectionState):
             guild_id, query=query, limit=limit, presences=presences, nonce=nonce
         )
 
+    def _chunk_concurrency(self) -> int:
+        return self.chunk_concurrency or len(self.shard_ids) * self._CHUNK_CONCURRENCY_PER_SHARD
+
     async def _delay_ready(self) -> None:
         await self.shards_launched.wait()
         processed = []
-        max_concurrency = len(self.shard_ids) * 2
-        current_bucket = []
         while True:
             # this snippet of code is basically waiting N seconds
             # until the last GUILD_CREATE was sent
@@ -1957,23 +2262,8 @@ class AutoShardedConnectionState(ConnectionState):
                         ),
                         guild.id,
                     )
-                    if len(current_bucket) >= max_concurrency:
-                        try:
-                            await utils.sane_wait_for(
-                                current_bucket, timeout=max_concurrency * 70.0
-                            )
-                        except asyncio.TimeoutError:
-                            fmt = (
-                                "Shard ID %s failed to wait for chunks from a"
-                                " sub-bucket with length %d"
-                            )
-                            _log.warning(fmt, guild.shard_id, len(current_bucket))
-                        finally:
-                            current_bucket = []
-
                     # Chunk the guild in the background while we wait for GUILD_CREATE streaming
-                    future = asyncio.ensure_future(self.chunk_guild(guild))
-                    current_bucket.append(future)
+                    future = self._chunk_scheduler.schedule(guild)
                 else:
                     future = self.loop.create_future()
                     future.set_result([])
@@ -2015,12 +2305,14 @@ class AutoShardedConnectionState(ConnectionState):
         self._ready_task = None
 
         # dispatch the event
+        self._ready_done()
         self.call_handlers("ready")
         self.dispatch("ready")
 
     def parse_ready(self, data) -> None:
         if not hasattr(self, "_ready_state"):
             self._ready_state = asyncio.Queue()
+            self._ready_started = time.perf_counter()
 
         self.user = user = ClientUser(state=self, data=data["user"])
         # self._users is a list of Users, we're setting a ClientUser
@@ -2045,6 +2337,7 @@ class AutoShardedConnectionState(ConnectionState):
 
         self.dispatch("connect")
         self.dispatch("shard_connect", data["__shard_id__"])
+        self._pending_resumes.discard(data["__shard_id__"])
 
         if self._ready_task is None:
             self._ready_task = asyncio.create_task(self._delay_ready())
@@ -2052,3 +2345,10 @@ class AutoShardedConnectionState(ConnectionState):
     def parse_resumed(self, data) -> None:
         self.dispatch("resumed")
         self.dispatch("shard_resumed", data["__shard_id__"])
+
+        if data["__shard_id__"] in self._pending_resumes:
+            self._pending_resumes.discard(data["__shard_id__"])
+            # every shard was resumed from a previous process, no READY will arrive
+            if not self._pending_resumes and self._ready_task is None:
+                self.call_handlers("ready")
+                self.dispatch("ready")
@@ -446,6 +446,10 @@ class View:
             self.on_timeout(), name=f"discord-ui-view-timeout-{self.id}"
         )
 
+        if self.__cancel_callback:
+            self.__cancel_callback(self)
+            self.__cancel_callback = None
+
     def _dispatch_item(self, item: Item, interaction: Interaction):
         if self.__stopped.done():
             return
@@ -570,6 +574,10 @@ class ViewStore:
         self._views: dict[tuple[int, int | None, str], tuple[View, Item]] = {}
         # message_id: View
         self._synced_message_views: dict[int, View] = {}
+        # view.id: keys of self._views owned by that view
+        self._view_keys: dict[str, set[tuple[int, int | None, str]]] = {}
+        # view.id: keys of self._synced_message_views owned by that view
+        self._view_messages: dict[str, set[int]] = {}
         self._state: ConnectionState = state
 
     @property
@@ -581,39 +589,37 @@ class ViewStore:
         }
         return list(views.values())
 
-    def __verify_integrity(self):
-        to_remove: list[tuple[int, int | None, str]] = []
-        for k, (view, _) in self._views.items():
-            if view.is_finished():
-                to_remove.append(k)
-
-        for k in to_remove:
-            del self._views[k]
-
     def add_view(self, view: View, message_id: int | None = None):
-        self.__verify_integrity()
-
         view._start_listening_from_store(self)
+        keys = self._view_keys.setdefault(view.id, set())
         for item in view.children:
             if item.is_dispatchable():
-                self._views[(item.type.value, message_id, item.custom_id)] = (view, item)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)  # type: ignore
+                previous = self._views.get(key)
+                if previous is not None and previous[0] is not view:
+                    self._view_keys.get(previous[0].id, set()).discard(key)
+                self._views[key] = (view, item)
+                keys.add(key)
 
         if message_id is not None:
+            previous = self._synced_message_views.get(message_id)
+            if previous is not None and previous is not view:
+                self._view_messages.get(previous.id, set()).discard(message_id)
             self._synced_message_views[message_id] = view
+            self._view_messages.setdefault(view.id, set()).add(message_id)
 
     def remove_view(self, view: View):
-        for item in view.children:
-            if item.is_dispatchable():
-                self._views.pop((item.type.value, item.custom_id), None)  # type: ignore
+        for key in self._view_keys.pop(view.id, ()):
+            value = self._views.get(key)
+            if value is not None and value[0] is view:
+                del self._views[key]
 
-        for key, value in self._synced_message_views.items():
-            if value.id == view.id:
-                del self._synced_message_views[key]
-                break
+        for message_id in self._view_messages.pop(view.id, ()):
+            if self._synced_message_views.get(message_id) is view:
+                del self._synced_message_views[message_id]
 
     def dispatch(self, component_type: int, custom_id: str, interaction: Interaction):
-        self.__verify_integrity()
-        message_id: int | None = interaction.message and interaction.message.id
+        message_id: int | None = interaction.message_id
         key = (component_type, message_id, custom_id)
         # Fallback to None message_id searches in case a persistent view
         # was added without an associated message_id
@@ -624,6 +630,10 @@ class ViewStore:
             return
 
         view, item = value
+        if view.is_finished():
+            self.remove_view(view)
+            return
+
         item.refresh_state(interaction)
         view._dispatch_item(item, interaction)
 
@@ -631,7 +641,10 @@ class ViewStore:
         return message_id in self._synced_message_views
 
     def remove_message_tracking(self, message_id: int) -> View | None:
-        return self._synced_message_views.pop(message_id, None)
+        view = self._synced_message_views.pop(message_id, None)
+        if view is not None:
+            self._view_messages.get(view.id, set()).discard(message_id)
+        return view
 
     def update_from_message(self, message_id: int, components: list[ComponentPayload]):
         # pre-req: is_message_tracked == true
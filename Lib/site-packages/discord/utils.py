@@ -42,6 +42,7 @@ from bisect import bisect_left
 from dataclasses import field
 from inspect import isawaitable as _isawaitable
 from inspect import signature as _signature
+from json.encoder import encode_basestring_ascii as _encode_string
 from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
@@ -669,12 +670,54 @@ if HAS_MSGSPEC:
 
 else:
 
+    # json.dumps builds a new encoder on every call when given options
+    _json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True)
+
     def _to_json(obj: Any) -> str:
-        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True)
+        return _json_encoder.encode(obj)
 
     _from_json = json.loads
 
 
+class _EncodedDict(dict):
+    """A payload dict that carries its own JSON encoding in ``json``."""
+
+    __slots__ = ("json",)
+
+
+def _has_encoded(obj: Any) -> bool:
+    if type(obj) is dict:
+        return any(_has_encoded(value) for value in obj.values())
+    if type(obj) is list:
+        return any(type(item) is _EncodedDict for item in obj)
+    return type(obj) is _EncodedDict
+
+
+def _to_json_payload(obj: Any) -> str:
+    # like _to_json, but the JSON of encoded dicts (e.g. cached embeds) is
+    # copied in as is instead of being encoded again
+    if type(obj) is _EncodedDict:
+        return obj.json
+    if type(obj) is list:
+        if not any(type(item) is _EncodedDict for item in obj):
+            return _to_json(obj)
+        items = [
+            item.json if type(item) is _EncodedDict else _to_json(item) for item in obj
+        ]
+        return f"[{','.join(items)}]"
+    if type(obj) is not dict:
+        return _to_json(obj)
+
+    encoded = [key for key, value in obj.items() if _has_encoded(value)]
+    if not encoded:
+        return _to_json(obj)
+    rest = _to_json({key: value for key, value in obj.items() if key not in encoded})
+    parts = ",".join(
+        f"{_encode_string(key)}:{_to_json_payload(obj[key])}" for key in encoded
+    )
+    return f"{rest[:-1]}{',' if len(rest) > 2 else ''}{parts}}}"
+
+
 def _parse_ratelimit_header(request: Any, *, use_clock: bool = False) -> float:
     reset_after: str | None = request.headers.get("X-Ratelimit-Reset-After")
     if not use_clock and reset_after:
@@ -52,7 +52,7 @@ from . import opus, utils
 from .backoff import ExponentialBackoff
 from .errors import ClientException, ConnectionClosed
 from .gateway import *
-from .player import AudioPlayer, AudioSource
+from .player import AudioPlayer, AudioSource, PlaybackStats
 from .sinks import RawData, RecordingException, Sink
 from .utils import MISSING
 
@@ -85,6 +85,16 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+# the zero padding of the nonces used by the supported modes
+_NONCE_PADDING = bytes(12)
+_LITE_NONCE_PADDING = bytes(20)
+_RTP_EXTENSION_LENGTH = struct.Struct(">xxH")
+# large enough for any RTP packet discord sends
+_RECV_BUFFER_SIZE = 4096
+
+# one second of 48kHz stereo silence, written in slices to pad recordings
+_SILENCE = bytes(opus._OpusStruct.SAMPLE_SIZE * opus._OpusStruct.SAMPLING_RATE)
+
 
 class VoiceProtocol:
     """A class that represents the Discord voice protocol.
@@ -253,6 +263,7 @@ class VoiceClient(VoiceProtocol):
         self.timeout: float = 0
         self._runner: asyncio.Task = MISSING
         self._player: AudioPlayer | None = None
+        self._playback_stats: PlaybackStats = PlaybackStats()
         self.encoder: Encoder = MISSING
         self.decoder = None
         self._lite_nonce: int = 0
@@ -262,6 +273,12 @@ class VoiceClient(VoiceProtocol):
         self.recording = False
         self.user_timestamps = {}
         self.sink = None
+        # decoding runs on several threads, the sink is written one call at a time
+        self._sink_lock = threading.Lock()
+        self._secret_box = None
+        self._secret_box_key = None
+        self._decrypt_packet = None
+        self._decrypt_mode = None
         self.starting_time = None
         self.stopping_time = None
 
@@ -563,21 +580,28 @@ class VoiceClient(VoiceProtocol):
         encrypt_packet = getattr(self, f"_encrypt_{self.mode}")
         return encrypt_packet(header, data)
 
+    def _get_secret_box(self):
+        # the box is rebuilt only when the session description sends a new key
+        if self._secret_box_key is not self.secret_key:
+            self._secret_box = nacl.secret.SecretBox(bytes(self.secret_key))
+            self._secret_box_key = self.secret_key
+        return self._secret_box
+
     def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._get_secret_box()
         nonce = bytearray(24)
         nonce[:12] = header
 
         return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
 
     def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._get_secret_box()
         nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
 
         return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
 
     def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._get_secret_box()
         nonce = bytearray(24)
 
         nonce[:4] = struct.pack(">I", self._lite_nonce)
@@ -586,34 +610,32 @@ class VoiceClient(VoiceProtocol):
         return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
 
     def _decrypt_xsalsa20_poly1305(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
-        nonce = bytearray(24)
-        nonce[:12] = header
+        box = self._get_secret_box()
+        nonce = bytes(header) + _NONCE_PADDING
 
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+        return self.strip_header_ext(box.decrypt(bytes(data), nonce))
 
     def _decrypt_xsalsa20_poly1305_suffix(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._get_secret_box()
 
         nonce_size = nacl.secret.SecretBox.NONCE_SIZE
-        nonce = data[-nonce_size:]
+        data = bytes(data)
 
-        return self.strip_header_ext(box.decrypt(bytes(data[:-nonce_size]), nonce))
+        return self.strip_header_ext(
+            box.decrypt(data[:-nonce_size], data[-nonce_size:])
+        )
 
     def _decrypt_xsalsa20_poly1305_lite(self, header, data):
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        box = self._get_secret_box()
+        data = bytes(data)
+        nonce = data[-4:] + _LITE_NONCE_PADDING
 
-        nonce = bytearray(24)
-        nonce[:4] = data[-4:]
-        data = data[:-4]
-
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+        return self.strip_header_ext(box.decrypt(data[:-4], nonce))
 
     @staticmethod
     def strip_header_ext(data):
         if data[0] == 0xBE and data[1] == 0xDE and len(data) > 4:
-            _, length = struct.unpack_from(">HH", data)
+            (length,) = _RTP_EXTENSION_LENGTH.unpack_from(data)
             offset = 4 + length * 4
             data = data[offset:]
         return data
@@ -711,7 +733,9 @@ class VoiceClient(VoiceProtocol):
 
             after = _after
 
-        self._player = AudioPlayer(source, self, after=after)
+        self._player = AudioPlayer(
+            source, self, after=after, stats=self._playback_stats
+        )
         self._player.start()
         return future
 
@@ -737,6 +761,11 @@ class VoiceClient(VoiceProtocol):
         if self.paused:
             return
 
+        if self._decrypt_mode != self.mode:
+            # resolved once per session instead of per packet
+            self._decrypt_packet = getattr(self, f"_decrypt_{self.mode}")
+            self._decrypt_mode = self.mode
+
         data = RawData(data, self)
 
         if data.decrypted_data == b"\xf8\xff\xfe":  # Frame of silence
@@ -744,12 +773,22 @@ class VoiceClient(VoiceProtocol):
 
         self.decoder.decode(data)
 
-    def start_recording(self, sink, callback, *args, sync_start: bool = False):
+    def start_recording(
+        self,
+        sink,
+        callback,
+        *args,
+        sync_start: bool = False,
+        jitter_depth: int = 4,
+    ):
         """The bot will begin recording audio from the current voice channel it is in.
         This function uses a thread so the current code line will not be stopped.
         Must be in a voice channel to use.
         Must not be already recording.
 
+        Audio is decoded on several threads, the sink is written from them one
+        call at a time.
+
         .. versionadded:: 2.0
 
         Parameters
@@ -763,6 +802,12 @@ class VoiceClient(VoiceProtocol):
         sync_start: :class:`bool`
             If True, the recordings of subsequent users will start with silence.
             This is useful for recording audio just as it was heard.
+        jitter_depth: :class:`int`
+            How many packets of a user are held back to put late packets back in
+            order before a missing packet is considered lost. Each packet adds 20
+            milliseconds of delay. Defaults to 4.
+
+            .. versionadded:: 2.6
 
         Raises
         ------
@@ -782,7 +827,7 @@ class VoiceClient(VoiceProtocol):
 
         self.empty_socket()
 
-        self.decoder = opus.DecodeManager(self)
+        self.decoder = opus.DecodeManager(self, jitter_depth=jitter_depth)
         self.decoder.start()
         self.recording = True
         self.sync_start = sync_start
@@ -812,7 +857,8 @@ class VoiceClient(VoiceProtocol):
         """
         if not self.recording:
             raise RecordingException("Not currently recording audio.")
-        self.decoder.stop()
+        # the receiving thread stops taking packets, then drains the decoder
+        # before cleaning up the sink
         self.recording = False
         self.paused = False
 
@@ -847,6 +893,9 @@ class VoiceClient(VoiceProtocol):
         self.user_timestamps: dict[int, tuple[int, float]] = {}
         self.starting_time = time.perf_counter()
         self.first_packet_timestamp: float
+        # packets are received into one buffer, RawData copies what it keeps
+        buffer = bytearray(_RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
         while self.recording:
             ready, _, err = select.select([self.socket], [], [self.socket], 0.01)
             if not ready:
@@ -855,13 +904,14 @@ class VoiceClient(VoiceProtocol):
                 continue
 
             try:
-                data = self.socket.recv(4096)
+                size = self.socket.recv_into(buffer)
             except OSError:
                 self.stop_recording()
                 continue
 
-            self.unpack_audio(data)
+            self.unpack_audio(view[:size])
 
+        self.decoder.stop()
         self.stopping_time = time.perf_counter()
         self.sink.cleanup()
         callback = asyncio.run_coroutine_threadsafe(callback(sink, *args), self.loop)
@@ -871,6 +921,16 @@ class VoiceClient(VoiceProtocol):
             print(result)
 
     def recv_decoded_audio(self, data: RawData):
+        while data.ssrc not in self.ws.ssrc_map:
+            time.sleep(0.05)
+        user = self.ws.ssrc_map[data.ssrc]["user_id"]
+
+        # called from every decoding thread, sinks are not required to be
+        # thread safe so the timestamps and writes are serialized
+        with self._sink_lock:
+            self._deliver(data, user)
+
+    def _deliver(self, data: RawData, user: int) -> None:
         # Add silence when they were not being recorded.
         if data.ssrc not in self.user_timestamps:  # First packet from user
             if (
@@ -885,28 +945,35 @@ class VoiceClient(VoiceProtocol):
                 ) - 960
 
         else:  # Previously received a packet from user
-            dRT = (
-                data.receive_time - self.user_timestamps[data.ssrc][1]
-            ) * 48000  # delta receive time
-            dT = data.timestamp - self.user_timestamps[data.ssrc][0]  # delta timestamp
-            diff = abs(100 - dT * 100 / dRT)
-            if (
-                diff > 60 and dT != 960
-            ):  # If the difference in change is more than 60% threshold
-                silence = dRT - 960
-            else:
-                silence = dT - 960
+            # frames come in RTP order out of the jitter buffer, lost ones concealed
+            dT = (
+                data.timestamp - self.user_timestamps[data.ssrc][0]
+            ) & 0xFFFFFFFF  # delta timestamp
+            silence = 0
+            if dT != 960:
+                dRT = (
+                    data.receive_time - self.user_timestamps[data.ssrc][1]
+                ) * 48000  # delta receive time
+                diff = abs(100 - dT * 100 / dRT) if dRT > 0 else 0
+                if diff > 60:  # If the difference in change is more than 60% threshold
+                    silence = dRT - 960
+                else:
+                    silence = dT - 960
 
         self.user_timestamps.update({data.ssrc: (data.timestamp, data.receive_time)})
 
-        data.decoded_data = (
-            struct.pack("<h", 0) * max(0, int(silence)) * opus._OpusStruct.CHANNELS
-            + data.decoded_data
-        )
+        if silence > 0:
+            self._write_silence(user, int(silence))
+        self.sink.write(data.decoded_data, user)
 
-        while data.ssrc not in self.ws.ssrc_map:
-            time.sleep(0.05)
-        self.sink.write(data.decoded_data, self.ws.ssrc_map[data.ssrc]["user_id"])
+    def _write_silence(self, user: int, samples: int) -> None:
+        size = samples * opus._OpusStruct.SAMPLE_SIZE
+        block = len(_SILENCE)
+        while size >= block:
+            self.sink.write(_SILENCE, user)
+            size -= block
+        if size:
+            self.sink.write(_SILENCE[:size], user)
 
     def is_playing(self) -> bool:
         """Indicates if we're currently playing audio."""
@@ -932,6 +999,15 @@ class VoiceClient(VoiceProtocol):
         if self._player:
             self._player.resume()
 
+    @property
+    def playback_stats(self) -> PlaybackStats:
+        """Timing statistics of the audio played through this voice client,
+        such as underruns and a jitter histogram.
+
+        .. versionadded:: 2.6
+        """
+        return self._playback_stats
+
     @property
     def source(self) -> AudioSource | None:
         """The audio source being played, if playing.
@@ -26,7 +26,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import json
+import io
 import logging
 import re
 import weakref
@@ -47,8 +47,9 @@ from ..errors import (
     InvalidArgument,
     NotFound,
 )
+from ..file import File
 from ..flags import MessageFlags
-from ..http import Route
+from ..http import Route, _build_form
 from ..message import Attachment, Message
 from ..mixins import Hashable
 from ..object import Object
@@ -57,6 +58,7 @@ from ..user import BaseUser, User
 
 __all__ = (
     "Webhook",
+    "WebhookBroadcaster",
     "WebhookMessage",
     "PartialWebhookChannel",
     "PartialWebhookGuild",
@@ -70,7 +72,6 @@ if TYPE_CHECKING:
     from ..abc import Snowflake
     from ..channel import TextChannel
     from ..embeds import Embed
-    from ..file import File
     from ..guild import Guild
     from ..http import Response
     from ..mentions import AllowedMentions
@@ -118,9 +119,10 @@ class AsyncWebhookAdapter:
         auth_token: str | None = None,
         params: dict[str, Any] | None = None,
     ) -> Any:
+        # `files` is no longer read, the form rewinds and streams the files itself.
+        # It is kept for the callers and subclasses that still pass it.
         headers: dict[str, str] = {}
-        files = files or []
-        to_send: str | aiohttp.FormData | None = None
+        to_send: str | aiohttp.MultipartWriter | None = None
         bucket = (route.webhook_id, route.webhook_token)
 
         try:
@@ -130,7 +132,10 @@ class AsyncWebhookAdapter:
 
         if payload is not None:
             headers["Content-Type"] = "application/json"
-            to_send = utils._to_json(payload)
+            to_send = utils._to_json_payload(payload)
+
+        if multipart:
+            to_send = _build_form(multipart)
 
         if auth_token is not None:
             headers["Authorization"] = f"Bot {auth_token}"
@@ -146,14 +151,6 @@ class AsyncWebhookAdapter:
 
         async with AsyncDeferredLock(lock) as lock:
             for attempt in range(5):
-                for file in files:
-                    file.reset(seek=attempt)
-
-                if multipart:
-                    form_data = aiohttp.FormData(quote_fields=False)
-                    for p in multipart:
-                        form_data.add_field(**p)
-                    to_send = form_data
                 try:
                     async with session.request(
                         method,
@@ -171,12 +168,16 @@ class AsyncWebhookAdapter:
                             url,
                             response.status,
                         )
-                        data = (await response.text(encoding="utf-8")) or None
-                        if (
-                            data
-                            and response.headers["Content-Type"] == "application/json"
-                        ):
-                            data = json.loads(data)
+                        # decoded straight from the body bytes, skipping the str
+                        data = (await response.read()) or None
+                        if data is not None:
+                            if (
+                                response.headers.get("Content-Type")
+                                == "application/json"
+                            ):
+                                data = utils._from_json(data)
+                            else:
+                                data = data.decode("utf-8")
 
                         remaining = response.headers.get("X-Ratelimit-Remaining")
                         if remaining == "0" and response.status != 429:
@@ -521,7 +522,7 @@ class AsyncWebhookAdapter:
                 }
             )
         payload["attachments"] = attachments
-        form[0]["value"] = utils._to_json(payload)
+        form[0]["value"] = utils._to_json_payload(payload)
 
         route = Route(
             "POST",
@@ -673,7 +674,9 @@ def handle_message_parameters(
         files = [file]
 
     if files:
-        multipart.append({"name": "payload_json", "value": utils._to_json(payload)})
+        multipart.append(
+            {"name": "payload_json", "value": utils._to_json_payload(payload)}
+        )
         payload = None
         if len(files) == 1:
             file = files[0]
@@ -2036,3 +2039,235 @@ class Webhook(BaseWebhook):
             proxy_auth=self.proxy_auth,
             thread_id=thread_id,
         )
+
+
+class WebhookBroadcaster:
+    """Sends messages through many webhooks at once over one shared session.
+
+    Every webhook still sends its own messages one after another within its
+    rate limit bucket, while different webhooks send concurrently.
+
+    .. versionadded:: 2.6
+
+    Parameters
+    ----------
+    webhooks: Iterable[Union[:class:`Webhook`, :class:`str`]]
+        The webhooks, or their URLs, to broadcast to. They need a token.
+    session: Optional[:class:`aiohttp.ClientSession`]
+        The session to send with. If not given, a pooled session is created
+        and closed by :meth:`close`.
+    max_concurrency: :class:`int`
+        How many webhooks are sent to at the same time. Defaults to ``10``.
+    proxy: Optional[:class:`str`]
+        Proxy URL.
+    proxy_auth: Optional[:class:`aiohttp.BasicAuth`]
+        Proxy authentication.
+
+    Raises
+    ------
+    InvalidArgument
+        A webhook does not have a token or an URL is invalid.
+
+    Examples
+    --------
+
+    Post a summary to several servers: ::
+
+        async with discord.WebhookBroadcaster(urls) as broadcaster:
+            results = await broadcaster.send(embed=summary)
+    """
+
+    def __init__(
+        self,
+        webhooks: Any = (),
+        *,
+        session: aiohttp.ClientSession | None = None,
+        max_concurrency: int = 10,
+        proxy: str | None = None,
+        proxy_auth: aiohttp.BasicAuth | None = None,
+    ):
+        self.max_concurrency: int = max_concurrency
+        self.proxy: str | None = proxy
+        self.proxy_auth: aiohttp.BasicAuth | None = proxy_auth
+        self._owns_session: bool = session is None
+        self._session: aiohttp.ClientSession | None = session
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._webhooks: list[Webhook] = []
+        for webhook in webhooks:
+            self.add(webhook)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The session the webhooks send with."""
+        return self._get_session()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            # one keep-alive connection per concurrent send
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+            for webhook in self._webhooks:
+                webhook.session = self._session
+        return self._session
+
+    @property
+    def webhooks(self) -> list[Webhook]:
+        """The webhooks messages are broadcast to."""
+        return list(self._webhooks)
+
+    def add(self, webhook: Webhook | str) -> Webhook:
+        """Adds a webhook to broadcast to.
+
+        Parameters
+        ----------
+        webhook: Union[:class:`Webhook`, :class:`str`]
+            The webhook or its URL. Webhook objects are copied to send with
+            the shared session, the webhook passed is not modified.
+
+        Returns
+        -------
+        :class:`Webhook`
+            The webhook that is broadcast to.
+
+        Raises
+        ------
+        InvalidArgument
+            The webhook does not have a token or the URL is invalid.
+        """
+        if isinstance(webhook, str):
+            webhook = Webhook.from_url(
+                webhook,
+                session=self._session,  # type: ignore
+                proxy=self.proxy,
+                proxy_auth=self.proxy_auth,
+            )
+        elif webhook.token is None:
+            raise InvalidArgument(
+                "This webhook does not have a token associated with it"
+            )
+        else:
+            webhook = Webhook.partial(
+                webhook.id,
+                webhook.token,
+                session=self._session,  # type: ignore
+                proxy=self.proxy,
+                proxy_auth=self.proxy_auth,
+            )
+        self._webhooks.append(webhook)
+        return webhook
+
+    def remove(self, webhook: Webhook) -> None:
+        """Stops broadcasting to a webhook.
+
+        Parameters
+        ----------
+        webhook: :class:`Webhook`
+            The webhook to remove, compared by ID.
+
+        Raises
+        ------
+        ValueError
+            The webhook is not broadcast to.
+        """
+        self._webhooks.remove(webhook)
+
+    async def send(
+        self,
+        content: str = MISSING,
+        *,
+        file: File = MISSING,
+        files: list[File] = MISSING,
+        return_exceptions: bool = True,
+        **kwargs: Any,
+    ) -> list[WebhookMessage | None | BaseException]:
+        """|coro|
+
+        Sends a message through all webhooks.
+
+        Parameters
+        ----------
+        content: :class:`str`
+            The content of the message to send.
+        file: :class:`File`
+            The file to upload. It is read once and uploaded by every webhook,
+            then closed.
+        files: List[:class:`File`]
+            A list of files to upload, read once and closed like ``file``.
+        return_exceptions: :class:`bool`
+            Whether the exceptions of failed webhooks are returned in place of
+            their message. Otherwise, the first exception is raised once all
+            webhooks finished. Defaults to ``True``.
+        **kwargs
+            The remaining arguments of :meth:`Webhook.send`.
+
+        Returns
+        -------
+        List[Optional[Union[:class:`WebhookMessage`, :exc:`BaseException`]]]
+            The result of every webhook, in the order of :attr:`webhooks`.
+            Messages are only returned if ``wait`` is ``True``.
+
+        Raises
+        ------
+        InvalidArgument
+            Both ``file`` and ``files`` were passed.
+        HTTPException
+            Sending failed and ``return_exceptions`` is ``False``.
+        """
+        if file is not MISSING and files is not MISSING:
+            raise InvalidArgument("Cannot mix file and files keyword arguments.")
+        if file is not MISSING:
+            files = [file]
+
+        # the files are read once, every request uploads its own copy
+        uploads: list[tuple[bytes, File]] = []
+        loop = asyncio.get_running_loop()
+        try:
+            for f in files or ():
+                f.reset()
+                uploads.append((await loop.run_in_executor(None, f.fp.read), f))
+        finally:
+            for f in files or ():
+                f.close()
+
+        self._get_session()
+        semaphore = self._semaphore
+
+        async def send_one(webhook: Webhook) -> WebhookMessage | None:
+            async with semaphore:
+                if not uploads:
+                    return await webhook.send(content, **kwargs)
+                copies = [
+                    File(
+                        io.BytesIO(data),
+                        filename=f.filename,
+                        description=f.description,
+                        spoiler=f.spoiler,
+                    )
+                    for data, f in uploads
+                ]
+                return await webhook.send(content, files=copies, **kwargs)
+
+        results = await asyncio.gather(
+            *(send_one(webhook) for webhook in self._webhooks),
+            return_exceptions=True,
+        )
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the session, if it was created by the broadcaster.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> WebhookBroadcaster:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
@@ -0,0 +1,263 @@
+"""Runs a ShardCluster against a local stand-in for the Discord API and gateway.
+
+The stand-in answers /users/@me and /gateway/bot and serves a gateway that
+sends HELLO, then READY and one GUILD_CREATE per shard after each IDENTIFY.
+A ShardCluster with several worker processes and a max_concurrency above 1
+connects every shard to it, then one worker is killed. Checked are:
+
+- IDENTIFYs of one max_concurrency bucket arrive at least 5 seconds apart,
+  while the buckets identify in parallel
+- every IDENTIFY is counted once against the session start limit, by the
+  supervisor and not by the workers
+- ShardCluster.query and ClusterLink.query combine the results of every worker
+- the killed worker is restarted and its shards identify again
+
+    python clustertest.py
+    python clustertest.py --shards 8 --clusters 4 --max-concurrency 2
+    python clustertest.py --history cluster_history.jsonl
+
+Also reports how long it took for every shard to connect and for the killed
+worker to be back. No token or network access is needed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+from aiohttp import WSMsgType, web
+
+import discord
+from discord.cluster import ShardCluster
+from discord.http import Route
+from gatewaybench import BOT_ID, guild_create, user
+
+# the identify window of a max_concurrency bucket
+PER = 5.0
+# how much earlier than PER an IDENTIFY may arrive, for the IPC and socket hops
+TOLERANCE = 0.1
+SESSION_STARTS = 1000
+
+
+class StandIn:
+    def __init__(self, shard_count, max_concurrency):
+        self.shard_count = shard_count
+        self.max_concurrency = max_concurrency
+        self.gateway_requests = 0
+        self.identifies = []
+
+    def json(self, data):
+        return web.Response(body=json.dumps(data).encode(), content_type="application/json")
+
+    async def me(self, request):
+        return self.json(dict(user(BOT_ID), bot=True))
+
+    async def gateway_bot(self, request):
+        self.gateway_requests += 1
+        return self.json({
+            "url": f"ws://127.0.0.1:{self.port}/gateway",
+            "shards": self.shard_count,
+            "session_start_limit": {
+                "total": SESSION_STARTS, "remaining": SESSION_STARTS,
+                "reset_after": 86400000, "max_concurrency": self.max_concurrency,
+            },
+        })
+
+    def guild_id(self, shard_id):
+        # a guild id that Discord would route to this shard
+        return (self.shard_count + shard_id) << 22
+
+    async def gateway(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({"op": 10, "d": {"heartbeat_interval": 45000}, "s": None, "t": None})
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            data = json.loads(msg.data)
+            if data["op"] == 1:
+                await ws.send_json({"op": 11, "d": None, "s": None, "t": None})
+            elif data["op"] == 2:
+                shard_id, shard_count = data["d"]["shard"]
+                self.identifies.append((time.monotonic(), shard_id))
+                guild_id = self.guild_id(shard_id)
+                await ws.send_json({"op": 0, "t": "READY", "s": 1, "d": {
+                    "v": 10, "user": dict(user(BOT_ID), bot=True), "session_id": f"cluster{shard_id}",
+                    "resume_gateway_url": f"ws://127.0.0.1:{self.port}/gateway",
+                    "application": {"id": str(BOT_ID), "flags": 0}, "shard": [shard_id, shard_count],
+                    "guilds": [{"id": str(guild_id), "unavailable": True}],
+                }})
+                await ws.send_json({"op": 0, "t": "GUILD_CREATE", "s": 2, "d": guild_create(guild_id, 10)})
+        return ws
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/api/v10/users/@me", self.me)
+        app.router.add_get("/api/v10/gateway/bot", self.gateway_bot)
+        app.router.add_get("/gateway", self.gateway)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+
+class WorkerClient(discord.AutoShardedClient):
+    async def start(self, token, *, reconnect=True):
+        # the session start limit as the supervisor handed it over
+        handed = self.http._bot_gateway["session_start_limit"]["remaining"]
+        self.cluster.add_handler(
+            "session_starts", lambda _: (handed, self.http._bot_gateway["session_start_limit"]["remaining"])
+        )
+        self.cluster.add_handler("cluster_guilds", lambda _: self.cluster_guilds())
+        await super().start(token, reconnect=reconnect)
+
+    async def cluster_guilds(self):
+        return sum(await self.cluster.query("guild_count"))
+
+
+def make_client(**options):
+    # runs in the worker processes, which inherit the stand-in's address
+    Route.base = os.environ["CLUSTERTEST_API"]
+    return WorkerClient(intents=discord.Intents.default(), **options)
+
+
+async def wait_until(predicate, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if await predicate():
+            return True
+        await asyncio.sleep(0.2)
+    return False
+
+
+def check_spacing(identifies, max_concurrency):
+    failures = []
+    last = {}
+    for at, shard_id in sorted(identifies):
+        bucket = shard_id % max_concurrency
+        if bucket in last and at - last[bucket] < PER - TOLERANCE:
+            failures.append(f"shard {shard_id} identified {at - last[bucket]:.2f}s after the last "
+                            f"IDENTIFY of bucket {bucket}")
+        last[bucket] = at
+
+    first = {}
+    for at, shard_id in sorted(identifies):
+        first.setdefault(shard_id % max_concurrency, at)
+    if len(first) > 1 and max(first.values()) - min(first.values()) >= PER:
+        failures.append("the max_concurrency buckets did not identify in parallel")
+    return failures
+
+
+async def run(args):
+    server = StandIn(args.shards, args.max_concurrency)
+    port = await server.start()
+    os.environ["CLUSTERTEST_API"] = Route.base = f"http://127.0.0.1:{port}/api/v10"
+
+    cluster = ShardCluster(make_client, token="clustertest", cluster_count=args.clusters)
+    cluster.MONITOR_INTERVAL = 0.2
+    supervisor = asyncio.create_task(cluster.start())
+    failures = []
+    results = {}
+
+    async def identified():
+        return len(server.identifies) >= args.shards
+
+    async def guilds_back():
+        try:
+            return sum(await cluster.query("guild_count")) == args.shards
+        except (ConnectionError, RuntimeError):
+            return False
+
+    try:
+        start = time.monotonic()
+        if not await wait_until(identified, args.timeout):
+            failures.append(f"{len(server.identifies)} of {args.shards} shards identified")
+            return failures, results
+        if not await wait_until(guilds_back, args.timeout):
+            failures.append("the workers did not receive every guild")
+            return failures, results
+        results["connect_seconds"] = time.monotonic() - start
+
+        shard_ids = sorted(shard_id for ids in await cluster.query("shard_ids") for shard_id in ids)
+        if shard_ids != list(range(args.shards)):
+            failures.append(f"ShardCluster.query returned the shard IDs {shard_ids}")
+        totals = await cluster.query("cluster_guilds")
+        if totals != [args.shards] * len(cluster._workers):
+            failures.append(f"ClusterLink.query counted the guilds {totals}, expected {args.shards} each")
+
+        victim = cluster._workers[-1]
+        pid = victim.process.pid
+        before = len(server.identifies)
+        start = time.monotonic()
+        victim.process.kill()
+
+        async def restarted():
+            process = victim.process
+            return (
+                process is not None
+                and process.pid != pid
+                and len(server.identifies) >= before + len(victim.shard_ids)
+                and await guilds_back()
+            )
+
+        if not await wait_until(restarted, args.timeout):
+            failures.append(f"cluster {victim.cluster_id} was not restarted with its shards")
+            return failures, results
+        results["restart_seconds"] = time.monotonic() - start
+        reidentified = sorted(shard_id for _, shard_id in server.identifies[before:])
+        if reidentified != victim.shard_ids:
+            failures.append(f"shards {reidentified} identified again, expected {victim.shard_ids}")
+
+        failures += check_spacing(server.identifies, args.max_concurrency)
+
+        identifies = len(server.identifies)
+        remaining = cluster._gateway["session_start_limit"]["remaining"]
+        if remaining != SESSION_STARTS - identifies:
+            failures.append(f"the supervisor counted {SESSION_STARTS - remaining} session starts "
+                            f"for {identifies} IDENTIFYs")
+        if server.gateway_requests != 1:
+            failures.append(f"/gateway/bot was requested {server.gateway_requests} times")
+        for cluster_id, (handed, now) in enumerate(await cluster.query("session_starts")):
+            if handed != now:
+                failures.append(f"cluster {cluster_id} counted {handed - now} session starts itself")
+        results["identifies"] = identifies
+    finally:
+        await cluster.close()
+        await supervisor
+        await server.runner.cleanup()
+    return failures, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shards", type=int, default=6)
+    parser.add_argument("--clusters", type=int, default=3, help="worker processes")
+    parser.add_argument("--max-concurrency", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for the shards to connect")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    failures, results = asyncio.run(run(args))
+    if "identifies" in results:
+        print(f"{'identifies':>12}{'connect s':>11}{'restart s':>11}")
+        print(f"{results['identifies']:>12}{results['connect_seconds']:>11.2f}{results['restart_seconds']:>11.2f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results, "failures": failures}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
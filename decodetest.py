@@ -0,0 +1,168 @@
+"""Feeds synthetic RTP packets through the voice receive and decode pipeline.
+
+Packets for a number of speakers are interleaved like they arrive on the
+socket and passed to VoiceClient.unpack_audio, which hands them to the
+DecodeManager worker pool. Decryption is skipped and opus decoding is replaced
+by a stand-in that returns PCM carrying the packet's sequence number, so the
+test runs without PyNaCl or libopus and can check what reached the sink:
+
+- every frame of every speaker arrived, in RTP order per speaker
+- the sink was never written to from two threads at once
+
+    python decodetest.py
+    python decodetest.py --speakers 25 --seconds 60 --workers 4
+    python decodetest.py --history decode_history.jsonl
+
+Also reports packets/sec, the highest queue depth seen and the decode latency.
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord import opus, voice_client
+from discord.voice_client import VoiceClient
+
+# nothing is decrypted, the client only has to be constructible without PyNaCl
+voice_client.has_nacl = True
+
+MARKER = b"SEQ!"
+PCM_SIZE = opus.Decoder.FRAME_SIZE
+
+
+class StandInDecoder:
+    # the "PCM" is the marker and sequence number padded to a full frame
+    def __init__(self, cost):
+        self.cost = cost
+
+    def decode(self, data):
+        if self.cost:
+            deadline = time.perf_counter() + self.cost
+            while time.perf_counter() < deadline:
+                pass
+        if data is None:
+            return MARKER + b"LOST" + bytes(PCM_SIZE - 8)
+        return data[:8] + bytes(PCM_SIZE - 8)
+
+
+class StandInManager(opus.DecodeManager):
+    def __init__(self, client, *, cost, **kwargs):
+        super().__init__(client, **kwargs)
+        self.cost = cost
+
+    def get_decoder(self, ssrc):
+        decoder = self.decoder.get(ssrc)
+        if decoder is None:
+            decoder = self.decoder[ssrc] = StandInDecoder(self.cost)
+        return decoder
+
+
+class CheckingSink:
+    def __init__(self):
+        self.frames = {}
+        self.overlaps = 0
+        self._writing = False
+
+    def write(self, data, user):
+        if self._writing:
+            self.overlaps += 1
+        self._writing = True
+        try:
+            # give another thread the chance to overlap
+            time.sleep(0)
+            if data[:4] == MARKER:
+                self.frames.setdefault(user, []).append(struct.unpack(">I", data[4:8])[0])
+        finally:
+            self._writing = False
+
+
+def make_client(speakers, sink, workers, cost):
+    client = VoiceClient(discord.Client(), None)
+    # packets are sent in the clear, only the RTP handling is exercised
+    client.mode = client._decrypt_mode = "plain"
+    client._decrypt_packet = lambda header, data: data
+    client.ws = types.SimpleNamespace(ssrc_map={1000 + s: {"user_id": s} for s in range(speakers)})
+    client.decoder = StandInManager(client, workers=workers, cost=cost)
+    client.sink = sink
+    client.sync_start = False
+    client.user_timestamps = {}
+    client.recording = True
+    return client
+
+
+def generate_packets(speakers, frames):
+    packets = []
+    for seq in range(frames):
+        for speaker in range(speakers):
+            header = struct.pack(">BBHII", 0x80, 0x78, seq & 0xFFFF, seq * 960 & 0xFFFFFFFF, 1000 + speaker)
+            packets.append(header + MARKER + struct.pack(">I", seq) + bytes(100))
+    return packets
+
+
+def run(args):
+    frames = args.seconds * 50
+    sink = CheckingSink()
+    client = make_client(args.speakers, sink, args.workers, args.decode_cost / 1e6)
+    packets = generate_packets(args.speakers, frames)
+
+    deepest = 0
+    client.decoder.start()
+    start = time.perf_counter()
+    for index, packet in enumerate(packets):
+        client.unpack_audio(packet)
+        if index % 100 == 0:
+            deepest = max(deepest, client.decoder.queue_depth)
+    latency = client.decoder.decode_latency
+    client.decoder.stop()
+    elapsed = time.perf_counter() - start
+
+    failures = []
+    if sink.overlaps:
+        failures.append(f"the sink was written from several threads at once {sink.overlaps} times")
+    for speaker in range(args.speakers):
+        received = sink.frames.get(speaker, [])
+        if received != list(range(frames)):
+            failures.append(f"speaker {speaker} received {len(received)} of {frames} frames or out of order")
+    return failures, {
+        "packets": len(packets),
+        "packets_per_sec": len(packets) / elapsed,
+        "max_queue_depth": deepest,
+        "decode_latency_ms": latency * 1000,
+        "dropped": client.decoder.dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speakers", type=int, default=25)
+    parser.add_argument("--seconds", type=int, default=10, help="seconds of audio per speaker")
+    parser.add_argument("--workers", type=int, help="decoder threads, defaults to the DecodeManager default")
+    parser.add_argument("--decode-cost", type=float, default=0.0, help="microseconds the stand-in decoder spins per frame")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    failures, results = run(args)
+    print(f"{'packets':>10}{'packets/sec':>14}{'max queue':>11}{'latency ms':>12}{'dropped':>9}")
+    print(f"{results['packets']:>10}{results['packets_per_sec']:>14.0f}{results['max_queue_depth']:>11}"
+          f"{results['decode_latency_ms']:>12.2f}{results['dropped']:>9}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results, "failures": failures}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Measures how fast a re-rendered embed is turned into a request body.
+
+A roll board embed with one field per roller is rendered over and over, every
+render changing a few fields (or none, with --changes 0), and encoded into a
+message payload the way HTTPClient sends it. Compared are a plain Embed built
+from scratch every render, the plain Embed updated in place and a CachedEmbed
+updated in place.
+
+    python embedbench.py
+    python embedbench.py --fields 25 --renders 20000 --changes 1
+    python embedbench.py --history embed_history.jsonl
+
+Results per embed: renders/sec and microseconds per render.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord import utils
+
+
+def rolls(fields, renders, changes):
+    # the rolls of every render, only `changes` of them differ from the last one
+    rng = random.Random(0)
+    current = [rng.randint(1, 100) for _ in range(fields)]
+    history = []
+    for _ in range(renders):
+        for index in rng.sample(range(fields), changes):
+            current[index] = rng.randint(1, 100)
+        history.append(list(current))
+    return history
+
+
+def build(cls, values):
+    embed = cls(title="Now Rolling: Thunderfury", description="Highest roll wins.", colour=0x3498DB)
+    embed.set_footer(text="Rolls close in 60 seconds")
+    for index, value in enumerate(values):
+        embed.add_field(name=f"Raider {index}", value=f"rolled {value}")
+    return embed
+
+
+def encode(embed):
+    payload = {"content": None, "embeds": [embed.to_dict()], "components": [], "allowed_mentions": {"parse": []}}
+    return utils._to_json_payload(payload)
+
+
+def rebuilt(history):
+    for values in history:
+        embed = build(discord.Embed, values)
+        len(embed)
+        encode(embed)
+
+
+def updated(cls):
+    def scenario(history):
+        embed = build(cls, history[0])
+        last = history[0]
+        for values in history:
+            for index, (old, new) in enumerate(zip(last, values)):
+                if old != new:
+                    embed.set_field_at(index, name=f"Raider {index}", value=f"rolled {new}")
+            last = values
+            len(embed)
+            encode(embed)
+
+    return scenario
+
+
+def measure(scenario, history, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        scenario(history)
+        best = min(best, time.perf_counter() - start)
+    return {"renders_per_sec": len(history) / best, "usec_per_render": best / len(history) * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--renders", type=int, default=10000)
+    parser.add_argument("--changes", type=int, default=1, help="fields changed per render")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds, the best one is reported")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    history = rolls(args.fields, args.renders, args.changes)
+    results = {
+        name: measure(scenario, history, args.rounds)
+        for name, scenario in (
+            ("Embed, rebuilt", rebuilt),
+            ("Embed, updated", updated(discord.Embed)),
+            ("CachedEmbed, updated", updated(discord.CachedEmbed)),
+        )
+    }
+
+    print(f"{'embed':<24}{'renders/sec':>14}{'usec/render':>14}")
+    for name, r in results.items():
+        print(f"{name:<24}{r['renders_per_sec']:>14.0f}{r['usec_per_render']:>14.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""Replays a gateway session through the discord package without a network.
+
+The session is either generated (READY, large GUILD_CREATEs, member chunks,
+message, interaction and typing bursts) or loaded from a JSON lines recording of raw
+gateway messages. Every message goes through DiscordWebSocket.received_message
+and the ConnectionState parsers, like it would on a live connection.
+
+    python gatewaybench.py
+    python gatewaybench.py --guilds 20 --members 5000 --history bench_history.jsonl
+    python gatewaybench.py --session recorded.jsonl
+    python gatewaybench.py --session recorded.jsonl --compression zlib zstd
+
+The messages are sent as zlib-stream frames, zstd-stream frames (needs the
+zstandard package) or plain text. Results per event type: events/sec,
+allocated blocks still alive after each event and the peak memory reached
+while handling one event. With several compressions, the whole replay is
+compared too: bytes on the wire, seconds and decoded MiB/sec.
+
+The replaying client only listens to messages and interactions, so events like
+TYPING_START are skipped unparsed. --skip-report replays the session again
+with skip_unobserved_events=False and reports the parse time that was saved.
+
+    python gatewaybench.py --skip-report
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord.gateway import HAS_ZSTD, DiscordWebSocket
+from discord.state import ConnectionState
+
+if HAS_ZSTD:
+    import zstandard
+
+BOT_ID = 1000
+TIMESTAMP = "2024-01-01T00:00:00.000000+00:00"
+
+
+def user(user_id):
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id}",
+        "discriminator": "0",
+        "global_name": None,
+        "avatar": None,
+    }
+
+
+def member(user_id, roles):
+    return {
+        "user": user(user_id),
+        "roles": roles,
+        "joined_at": TIMESTAMP,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def guild_create(guild_id, member_count):
+    channels = [
+        {"id": str(guild_id + c), "type": 0, "name": f"channel{c}", "position": c, "permission_overwrites": []}
+        for c in range(1, 21)
+    ]
+    roles = [
+        {"id": str(guild_id + 100 + r), "name": f"role{r}", "permissions": "0", "position": r,
+         "color": 0, "hoist": False, "managed": False, "mentionable": False}
+        for r in range(10)
+    ]
+    roles.append({"id": str(guild_id), "name": "@everyone", "permissions": "0", "position": 0,
+                  "color": 0, "hoist": False, "managed": False, "mentionable": False})
+    members = [member(guild_id + 1000 + m, [roles[m % 10]["id"]]) for m in range(min(member_count, 250))]
+    return {
+        "id": str(guild_id), "name": f"guild{guild_id}", "icon": None, "owner_id": str(BOT_ID),
+        "member_count": member_count, "large": member_count > 250, "unavailable": False,
+        "features": [], "emojis": [], "stickers": [], "channels": channels, "threads": [],
+        "roles": roles, "members": members, "presences": [], "voice_states": [],
+        "stage_instances": [], "guild_scheduled_events": [], "joined_at": TIMESTAMP,
+        "verification_level": 0, "default_message_notifications": 0, "explicit_content_filter": 0,
+        "mfa_level": 0, "premium_tier": 0, "preferred_locale": "en-US", "nsfw_level": 0,
+    }
+
+
+def message(guild_id, message_id, author_id):
+    return {
+        "id": str(message_id), "channel_id": str(guild_id + 1), "guild_id": str(guild_id),
+        "author": user(author_id), "member": {"roles": [], "joined_at": TIMESTAMP, "deaf": False, "mute": False},
+        "content": "!roll 100", "timestamp": TIMESTAMP, "edited_timestamp": None, "tts": False,
+        "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [],
+        "embeds": [], "pinned": False, "type": 0,
+    }
+
+
+def interaction(guild_id, interaction_id, user_id):
+    source = message(guild_id, interaction_id - 1, BOT_ID)
+    source["components"] = [{"type": 1, "components": [
+        {"type": 2, "style": 1, "custom_id": f"roll:{n}", "label": "Roll"} for n in range(5)
+    ]}]
+    return {
+        "id": str(interaction_id), "application_id": str(BOT_ID), "type": 3, "token": "token",
+        "version": 1, "guild_id": str(guild_id), "channel_id": str(guild_id + 1),
+        "member": dict(member(user_id, []), permissions="0"), "message": source,
+        "data": {"custom_id": "roll:1", "component_type": 2}, "locale": "en-US",
+        "app_permissions": "0", "entitlements": [],
+    }
+
+
+def typing(guild_id, user_id):
+    return {
+        "channel_id": str(guild_id + 1), "guild_id": str(guild_id), "user_id": str(user_id),
+        "timestamp": 1704067200, "member": member(user_id, []),
+    }
+
+
+def generate_session(guilds, members, messages, interactions, typings):
+    guild_ids = [(g + 1) << 32 for g in range(guilds)]
+    events = [("READY", {
+        "v": 10, "user": dict(user(BOT_ID), bot=True), "session_id": "bench",
+        "resume_gateway_url": "wss://localhost", "application": {"id": str(BOT_ID), "flags": 0},
+        "guilds": [{"id": str(g), "unavailable": True} for g in guild_ids],
+    })]
+    events += [("GUILD_CREATE", guild_create(g, members)) for g in guild_ids]
+
+    # member chunks of 1000 like Discord sends them
+    for g in guild_ids:
+        count = -(-members // 1000)
+        for index in range(count):
+            chunk = [member(g + 1000 + m, []) for m in range(index * 1000, min(members, (index + 1) * 1000))]
+            events.append(("GUILD_MEMBERS_CHUNK", {
+                "guild_id": str(g), "members": chunk, "chunk_index": index, "chunk_count": count,
+            }))
+
+    snowflake = 1 << 40
+    for n in range(messages):
+        snowflake += 1
+        g = guild_ids[n % guilds]
+        events.append(("MESSAGE_CREATE", message(g, snowflake, g + 1000 + n % members)))
+    for n in range(interactions):
+        snowflake += 2
+        g = guild_ids[n % guilds]
+        events.append(("INTERACTION_CREATE", interaction(g, snowflake, g + 1000 + n % members)))
+    for n in range(typings):
+        g = guild_ids[n % guilds]
+        events.append(("TYPING_START", typing(g, g + 1000 + n % members)))
+
+    return [{"op": 0, "t": name, "s": seq, "d": data} for seq, (name, data) in enumerate(events, 1)]
+
+
+def load_session(path):
+    with open(path, encoding="utf-8") as fp:
+        return [json.loads(line) for line in fp if line.strip()]
+
+
+def encode_session(session, compress):
+    # frames as they come off the socket, zlib-stream or zstd-stream compressed or plain text
+    if compress == "none":
+        return [json.dumps(msg, separators=(",", ":")) for msg in session]
+    if compress == "zstd":
+        compressor = zstandard.ZstdCompressor().compressobj()
+        flush = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+    else:
+        compressor = zlib.compressobj()
+        flush = zlib.Z_SYNC_FLUSH
+    return [
+        compressor.compress(json.dumps(msg, separators=(",", ":")).encode()) + compressor.flush(flush)
+        for msg in session
+    ]
+
+
+def make_websocket(client, loop, compress="zlib"):
+    ws = DiscordWebSocket(None, loop=loop)
+    if compress == "zstd":
+        # what from_client does for a compress=zstd-stream gateway URL
+        ws._zstd = zstandard.ZstdDecompressor().decompressobj()
+    ws.token = "bench"
+    ws._connection = client._connection
+    ws._discord_parsers = client._connection.parsers
+    ws._dispatch = client.dispatch
+    ws.call_hooks = client._connection.call_hooks
+    ws.shard_id = None
+    ws.shard_count = None
+    ws._initial_identify = True
+    ws._max_heartbeat_timeout = 60.0
+    client._connection._update_references(ws)
+    return ws
+
+
+async def replay(session, frames, compress, measure_memory, skip=True):
+    client = discord.Client(
+        intents=discord.Intents.all(), chunk_guilds_at_startup=False, guild_ready_timeout=0,
+        skip_unobserved_events=skip,
+    )
+    loop = asyncio.get_running_loop()
+    ws = make_websocket(client, loop, compress)
+
+    @client.event
+    async def on_message(message):
+        pass
+
+    @client.event
+    async def on_interaction(interaction):
+        pass
+
+    stats = {}
+    gc.collect()
+    gc.disable()
+    try:
+        for msg, frame in zip(session, frames):
+            name = msg.get("t") or f"OP {msg.get('op')}"
+            entry = stats.setdefault(name, {"count": 0, "seconds": 0.0, "blocks": 0, "peak": 0})
+            if measure_memory:
+                blocks = sys.getallocatedblocks()
+                current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            await ws.received_message(frame)
+            entry["seconds"] += time.perf_counter() - start
+            entry["count"] += 1
+            if measure_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                entry["blocks"] += sys.getallocatedblocks() - blocks
+                entry["peak"] = max(entry["peak"], peak - current)
+        # let the tasks scheduled by the events run before tearing down
+        await asyncio.sleep(0)
+    finally:
+        gc.enable()
+        await client.close()
+    return stats
+
+
+def best_seconds(session, frames, compress, rounds, skip):
+    timings = [asyncio.run(replay(session, frames, compress, False, skip)) for _ in range(rounds)]
+    return {name: min(t[name]["seconds"] for t in timings) for name in timings[0]}
+
+
+def skip_report(session, compress, rounds):
+    # parse time per event type the client skips, with and without skipping
+    frames = encode_session(session, compress)
+    skipped = best_seconds(session, frames, compress, rounds, True)
+    parsed = best_seconds(session, frames, compress, rounds, False)
+    counts = {}
+    for msg in session:
+        counts[msg.get("t")] = counts.get(msg.get("t"), 0) + 1
+    report = {}
+    for name, seconds in parsed.items():
+        parser = getattr(ConnectionState, f"parse_{name.lower()}", None)
+        if getattr(parser, "__dispatches__", None):
+            report[name] = {
+                "count": counts[name],
+                "usec_parsed": seconds / counts[name] * 1e6,
+                "usec_skipped": skipped[name] / counts[name] * 1e6,
+                "seconds_saved": seconds - skipped[name],
+            }
+    return report
+
+
+def run(session, compress, rounds):
+    frames = encode_session(session, compress)
+    timings = [asyncio.run(replay(session, frames, compress, False)) for _ in range(rounds)]
+    tracemalloc.start()
+    try:
+        memory = asyncio.run(replay(session, frames, compress, True))
+    finally:
+        tracemalloc.stop()
+
+    results = {}
+    for name, entry in memory.items():
+        # best of the timing rounds, the memory round is slowed down by tracemalloc
+        seconds = min(t[name]["seconds"] for t in timings)
+        results[name] = {
+            "count": entry["count"],
+            "events_per_sec": entry["count"] / seconds if seconds else float("inf"),
+            "blocks_per_event": entry["blocks"] / entry["count"],
+            "peak_kib_per_event": entry["peak"] / 1024,
+        }
+
+    seconds = min(sum(entry["seconds"] for entry in t.values()) for t in timings)
+    decoded = sum(len(json.dumps(msg, separators=(",", ":")).encode()) for msg in session)
+    summary = {
+        "wire_mib": sum(len(frame) for frame in frames) / 2**20,
+        "seconds": seconds,
+        "decoded_mib_per_sec": decoded / 2**20 / seconds,
+    }
+    return results, summary
+
+
+def print_results(results):
+    print(f"{'event':<24}{'count':>8}{'events/sec':>14}{'blocks/event':>14}{'peak KiB':>12}")
+    for name, r in sorted(results.items(), key=lambda item: -item[1]["count"]):
+        print(f"{name:<24}{r['count']:>8}{r['events_per_sec']:>14.0f}{r['blocks_per_event']:>14.1f}{r['peak_kib_per_event']:>12.1f}")
+
+
+def print_skip_report(report):
+    print(f"{'skipped event':<24}{'count':>8}{'usec parsed':>13}{'usec skipped':>14}{'seconds saved':>15}")
+    for name, r in sorted(report.items(), key=lambda item: -item[1]["seconds_saved"]):
+        print(f"{name:<24}{r['count']:>8}{r['usec_parsed']:>13.1f}{r['usec_skipped']:>14.1f}{r['seconds_saved']:>15.3f}")
+    print(f"{'total':<24}{'':>8}{'':>13}{'':>14}{sum(r['seconds_saved'] for r in report.values()):>15.3f}")
+
+
+def print_summaries(summaries):
+    print(f"{'compression':<14}{'wire MiB':>10}{'seconds':>10}{'decoded MiB/sec':>17}")
+    for name, s in summaries.items():
+        print(f"{name:<14}{s['wire_mib']:>10.1f}{s['seconds']:>10.2f}{s['decoded_mib_per_sec']:>17.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--session", help="JSON lines file of recorded gateway messages to replay")
+    parser.add_argument("--save-session", help="write the generated session to this JSON lines file")
+    parser.add_argument("--guilds", type=int, default=10)
+    parser.add_argument("--members", type=int, default=2000, help="members per guild")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--interactions", type=int, default=5000)
+    parser.add_argument("--typings", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds, the best one is reported")
+    parser.add_argument("--compression", nargs="+", choices=("zlib", "zstd", "none"), default=["zlib"],
+                        help="transport compressions to replay the session with")
+    parser.add_argument("--no-compress", action="store_true", help="send plain text frames, same as --compression none")
+    parser.add_argument("--skip-report", action="store_true",
+                        help="also replay without skip_unobserved_events and report the parse time saved")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+    compressions = ["none"] if args.no_compress else args.compression
+    if "zstd" in compressions and not HAS_ZSTD:
+        parser.error("zstd-stream needs the zstandard package")
+
+    if args.session:
+        session = load_session(args.session)
+    else:
+        session = generate_session(args.guilds, args.members, args.messages, args.interactions, args.typings)
+        if args.save_session:
+            with open(args.save_session, "w", encoding="utf-8") as fp:
+                fp.writelines(json.dumps(msg) + "\n" for msg in session)
+
+    runs = {}
+    for compress in compressions:
+        runs[compress] = results, summary = run(session, compress, args.rounds)
+        if len(compressions) > 1:
+            print(f"{compress}:")
+        print_results(results)
+    if len(compressions) > 1:
+        print()
+        print_summaries({compress: summary for compress, (_, summary) in runs.items()})
+    report = None
+    if args.skip_report:
+        report = skip_report(session, compressions[0], args.rounds)
+        print()
+        print_skip_report(report)
+
+    if args.history:
+        results, _ = runs[compressions[0]]
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "session": args.session or vars(args), "results": results,
+                  "compressions": {compress: summary for compress, (_, summary) in runs.items()},
+                  "skip_report": report}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
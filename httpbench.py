@@ -0,0 +1,100 @@
+"""Measures request throughput within one rate limit bucket against a local stand-in for the Discord API.
+
+The stand-in server from ratelimittest.py answers after a fixed latency and
+enforces the bucket's limit with 429 responses. A burst of concurrent
+requests for one channel is sent through HTTPClient two ways:
+
+- behind one lock per bucket, one request in flight at a time, like the
+  client used to send them
+- pipelined, as many in flight as X-RateLimit-Remaining allows
+
+    python httpbench.py
+    python httpbench.py --requests 500 --limit 50 --per 1 --latency 0.05
+    python httpbench.py --history http_history.jsonl
+
+Results per scenario: seconds, requests/sec and the number of 429s.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import aiohttp
+
+import discord
+from discord.http import HTTPClient, Route
+from ratelimittest import ROUTES, StandIn
+
+
+def locked(http):
+    lock = asyncio.Lock()
+
+    async def request(route):
+        async with lock:
+            return await http.request(route)
+
+    return request
+
+
+def pipelined(http):
+    return http.request
+
+
+async def measure(scenario, args):
+    server = StandIn(args.limit, args.per, args.latency)
+    port = await server.start()
+    Route.base = f"http://127.0.0.1:{port}/api/v10"
+    http = HTTPClient(unsync_clock=False)
+    # what static_login does, without fetching the user
+    http._HTTPClient__session = aiohttp.ClientSession()
+    request = scenario(http)
+    method, path = ROUTES[0]
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(request(Route(method, path, channel_id=10**17)) for _ in range(args.requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await http.close()
+        await server.runner.cleanup()
+    return {
+        "seconds": elapsed,
+        "requests_per_sec": args.requests / elapsed,
+        "rate_limited": server.rate_limited,
+    }
+
+
+async def run(args):
+    return {
+        name: await measure(scenario, args)
+        for name, scenario in (("bucket lock", locked), ("pipelined", pipelined))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=50, help="requests per bucket and window")
+    parser.add_argument("--per", type=float, default=1.0, help="seconds per window")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the stand-in takes per request")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{'scenario':<16}{'seconds':>10}{'requests/sec':>14}{'429s':>8}")
+    for name, r in results.items():
+        print(f"{name:<16}{r['seconds']:>10.2f}{r['requests_per_sec']:>14.1f}{r['rate_limited']:>8}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
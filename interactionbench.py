@@ -0,0 +1,94 @@
+"""Measures how many button click interactions per second are parsed.
+
+Button click payloads carrying the clicked message with a row of five roll
+buttons, like raidbot.py's roll messages, are turned into Interaction objects
+for a guild with a full member cache. Compared are:
+
+- lazy, reading only custom_id and user_id as a roll button callback does
+- materialized, also building the user, message, channel and entitlements,
+  which is what every interaction used to cost
+
+    python interactionbench.py
+    python interactionbench.py --interactions 50000
+    python interactionbench.py --history interaction_history.jsonl
+
+Results per scenario: interactions/sec and microseconds per interaction.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord.interactions import Interaction
+from gatewaybench import guild_create, interaction, make_websocket
+
+
+def lazy(state, payloads):
+    for data in payloads:
+        item = Interaction(data=data, state=state)
+        item.custom_id
+        item.user_id
+
+
+def materialized(state, payloads):
+    for data in payloads:
+        item = Interaction(data=data, state=state)
+        item.custom_id
+        item.user
+        item.message
+        item.channel
+        item.entitlements
+
+
+async def run(args):
+    client = discord.Client(intents=discord.Intents.all(), chunk_guilds_at_startup=False)
+    make_websocket(client, asyncio.get_running_loop())
+    state = client._connection
+    guild_id = 1 << 32
+    state.parse_guild_create(guild_create(guild_id, 250))
+    payloads = [interaction(guild_id, (1 << 40) + 2 * n, guild_id + 1000 + n % 250) for n in range(args.interactions)]
+
+    results = {}
+    try:
+        for name, scenario in (("lazy", lazy), ("materialized", materialized)):
+            best = float("inf")
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                scenario(state, payloads)
+                best = min(best, time.perf_counter() - start)
+            results[name] = {
+                "interactions_per_sec": args.interactions / best,
+                "usec_per_interaction": best / args.interactions * 1e6,
+            }
+    finally:
+        await client.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interactions", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds, the best one is reported")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{'scenario':<16}{'interactions/sec':>18}{'usec/interaction':>18}")
+    for name, r in results.items():
+        print(f"{name:<16}{r['interactions_per_sec']:>18.0f}{r['usec_per_interaction']:>18.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Replays packet traces through the voice receive jitter buffer offline.
+
+Every trace is a list of RTP packets of one SSRC in the order they arrive,
+with their arrival times. The packets are pushed into a _JitterBuffer and
+released the way DecodeManager does it, then what came out is checked:
+
+- fixed traces with reordering, duplicates, losses, late packets and the
+  16-bit sequence number wrap release exactly the expected packets and gaps
+- random traces with arrival jitter below the buffer depth release every
+  packet that was sent, in sequence order, and report every lost one
+
+Half of the random traces start close enough to 65535 to cross the wrap.
+
+    python jittertest.py
+    python jittertest.py --traces 500 --packets 2000 --jitter 0.05 --loss 0.02
+    python jittertest.py --history jitter_history.jsonl
+
+Also reports packets/sec through push and pop.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord.opus import _JitterBuffer
+
+FRAME = 0.02
+DEPTH = 4
+
+
+def packet(sequence, arrival):
+    # only what the jitter buffer reads from RawData
+    return types.SimpleNamespace(
+        sequence=sequence & 0xFFFF, timestamp=sequence * 960 & 0xFFFFFFFF, receive_time=arrival
+    )
+
+
+def in_order(sequences, start=0.0):
+    return [packet(sequence, start + n * FRAME) for n, sequence in enumerate(sequences)]
+
+
+def replay(trace, depth=DEPTH):
+    buffer = _JitterBuffer(depth)
+    released = []
+    dropped = 0
+    for item in trace:
+        if not buffer.push(item):
+            dropped += 1
+            continue
+        released.extend(buffer.pop(item.receive_time))
+    released.extend(buffer.pop(trace[-1].receive_time, flush=True))
+    return released, dropped
+
+
+def render(released):
+    return [f"lost {item}" if isinstance(item, int) else item.sequence for item in released]
+
+
+def fixed_traces():
+    # name, trace, released, dropped by push
+    wrap = [65533, 65534, 65535, 0, 1, 2]
+    yield "in order", in_order(range(8)), list(range(8)), 0
+    yield "swapped pairs", in_order([1, 0, 3, 2, 5, 4, 6]), list(range(7)), 0
+    yield "three ahead", in_order([1, 2, 3, 0, 4]), list(range(5)), 0
+    yield "wrap in order", in_order(wrap), wrap, 0
+    yield "wrap reordered", in_order([65534, 65533, 0, 65535, 2, 1, 3]), wrap + [3], 0
+    yield "loss across wrap", in_order([65534, 65535, 1, 2, 3, 4, 5]), \
+        [65534, 65535, "lost 1", 1, 2, 3, 4, 5], 0
+    yield "duplicate buffered", in_order([0, 2, 2, 1, 3]), [0, 1, 2, 3], 1
+    yield "duplicate released", in_order([0, 1, 2, 1, 3]), [0, 1, 2, 3], 1
+    yield "duplicate across wrap", in_order([65535, 0, 65535, 1]), [65535, 0, 1], 1
+    yield "single loss", in_order([0, 1, 3, 4, 5, 6, 7]), [0, 1, "lost 1", 3, 4, 5, 6, 7], 0
+    yield "run lost", in_order([0, 4, 5, 6, 7, 8]), [0, "lost 3", 4, 5, 6, 7, 8], 0
+    # 1 comes after the buffer gave up on it, it is reported lost and dropped
+    yield "late", in_order([0, 2, 3, 4, 5, 1, 6]), [0, "lost 1", 2, 3, 4, 5, 6], 1
+    yield "late across wrap", in_order([65535, 1, 2, 3, 4, 0, 5]), [65535, "lost 1", 1, 2, 3, 4, 5], 1
+    # too few packets pile up behind the gap, it is released by its age
+    yield "gap by time", [packet(0, 0.0), packet(2, FRAME), packet(3, FRAME + DEPTH * FRAME)], \
+        [0, "lost 1", 2, 3], 0
+
+
+def random_trace(rng, args, start):
+    trace = []
+    lost = 0
+    for n in range(args.packets):
+        sent = n * FRAME
+        # the first and last packet always arrive so every loss is a gap
+        if 0 < n < args.packets - 1 and rng.random() < args.loss:
+            lost += 1
+            continue
+        trace.append(packet(start + n, sent + rng.uniform(0, args.jitter)))
+        if rng.random() < args.duplicates:
+            trace.append(packet(start + n, sent + rng.uniform(0, args.jitter)))
+    trace.sort(key=lambda p: p.receive_time)
+    return trace, lost
+
+
+def check_random(trace, released, dropped, start, args, lost):
+    sent = {p.sequence for p in trace}
+    received = [item.sequence for item in released if not isinstance(item, int)]
+    if received != sorted(sent, key=lambda s: (s - start) & 0xFFFF):
+        return "packets released out of order, twice or not at all"
+    if len(trace) - dropped != len(received):
+        return f"{dropped} packets dropped, {len(trace) - len(received)} expected as duplicates"
+    reported = sum(item for item in released if isinstance(item, int))
+    if reported != lost:
+        return f"{reported} packets reported lost, {lost} were"
+    return None
+
+
+def run(args):
+    failures = []
+    for name, trace, expected, expected_dropped in fixed_traces():
+        released, dropped = replay(trace)
+        if render(released) != expected or dropped != expected_dropped:
+            failures.append(f"{name}: released {render(released)} dropping {dropped}, "
+                            f"expected {expected} dropping {expected_dropped}")
+
+    if args.jitter >= (DEPTH - 1) * FRAME:
+        failures.append(f"--jitter must be below {(DEPTH - 1) * FRAME}s for the buffer to reorder every packet")
+        return failures, {}
+
+    rng = random.Random(args.seed)
+    pushed = 0
+    elapsed = 0.0
+    for index in range(args.traces):
+        start = rng.randrange(0x10000 - args.packets // 2, 0x10000) if index % 2 else rng.randrange(0x10000)
+        trace, lost = random_trace(rng, args, start)
+        began = time.perf_counter()
+        released, dropped = replay(trace)
+        elapsed += time.perf_counter() - began
+        pushed += len(trace)
+        failure = check_random(trace, released, dropped, start & 0xFFFF, args, lost)
+        if failure is not None:
+            failures.append(f"random trace {index} starting at {start & 0xFFFF}: {failure}")
+
+    return failures, {"packets": pushed, "packets_per_sec": pushed / elapsed if elapsed else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--traces", type=int, default=200, help="random traces")
+    parser.add_argument("--packets", type=int, default=1000, help="packets sent per random trace")
+    parser.add_argument("--jitter", type=float, default=0.05, help="largest arrival delay in seconds")
+    parser.add_argument("--loss", type=float, default=0.02, help="share of packets never arriving")
+    parser.add_argument("--duplicates", type=float, default=0.01, help="share of packets arriving twice")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    failures, results = run(args)
+    if results:
+        print(f"{'packets':>10}{'packets/sec':>14}")
+        print(f"{results['packets']:>10}{results['packets_per_sec']:>14.0f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results, "failures": failures}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Measures the memory a large guild's member cache takes.
+
+A guild is created and filled with generated members through GUILD_MEMBERS_CHUNK
+events, like chunking it at startup does. Every cache limit is measured in a
+fresh process, so the results don't share interned strings or freed arenas:
+
+- no limit, every member is a full Member object
+- member_cache_limit, the least recently used members are kept as compact records
+
+    python memberbench.py
+    python memberbench.py --members 500000 --limits none 1000 50000
+    python memberbench.py --history member_history.jsonl
+
+Results per limit: MiB allocated by the cache, bytes per member, the growth of
+the resident set size and how long filling the cache took.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord.state import ChunkRequest
+from gatewaybench import guild_create, make_websocket, member
+
+MIB = 1024 * 1024
+
+
+def rss():
+    # current resident set size, the peak is all getrusage offers
+    with open("/proc/self/statm") as fp:
+        return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def chunks(guild_id, members, roles, nonce):
+    count = -(-members // 1000)
+    for index in range(count):
+        yield {
+            "guild_id": str(guild_id),
+            "members": [
+                # a few common role combinations, as on real guilds
+                member(guild_id + 1000 + m, [str(guild_id + 100 + r) for r in range(m % roles)])
+                for m in range(index * 1000, min(members, (index + 1) * 1000))
+            ],
+            "chunk_index": index,
+            "chunk_count": count,
+            "nonce": nonce,
+        }
+
+
+async def fill(members, limit, roles):
+    client = discord.Client(
+        intents=discord.Intents.all(), chunk_guilds_at_startup=False, member_cache_limit=limit,
+    )
+    make_websocket(client, asyncio.get_running_loop())
+    state = client._connection
+    guild_id = 1 << 32
+    state.parse_guild_create(guild_create(guild_id, members))
+    guild = client.get_guild(guild_id)
+    # answers a chunk request like Guild.chunk() makes
+    request = ChunkRequest(guild_id, asyncio.get_running_loop(), state._get_guild, buffer=False)
+    state._chunk_requests[request.nonce] = request
+
+    gc.collect()
+    tracemalloc.start()
+    before_rss = rss()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    for chunk in chunks(guild_id, members, roles, request.nonce):
+        state.parse_guild_members_chunk(chunk)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    after_rss = rss()
+    tracemalloc.stop()
+
+    cached = len(guild._members) + len(guild._member_records)
+    assert cached >= members, cached
+    result = {
+        "cache_mib": (after - before) / MIB,
+        "bytes_per_member": (after - before) / members,
+        "rss_mib": (after_rss - before_rss) / MIB,
+        "seconds": elapsed,
+        "members_objects": len(guild._members),
+    }
+    await client.close()
+    return result
+
+
+def measure(limit, args):
+    # one process per limit, results come back as JSON on stdout
+    command = [sys.executable, __file__, "--child", str(limit), "--members", str(args.members),
+               "--roles", str(args.roles)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=500000)
+    parser.add_argument("--limits", nargs="+", default=["none", "1000", "50000"],
+                        help="member_cache_limit values to measure, none for no limit")
+    parser.add_argument("--roles", type=int, default=5, help="distinct role combinations")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        limit = None if args.child == "none" else int(args.child)
+        print(json.dumps(asyncio.run(fill(args.members, limit, args.roles))))
+        return
+
+    results = {limit: measure(limit, args) for limit in args.limits}
+    print(f"{'limit':>8}{'Members':>10}{'cache MiB':>12}{'bytes/member':>14}{'RSS MiB':>10}{'seconds':>10}")
+    for limit, r in results.items():
+        print(f"{limit:>8}{r['members_objects']:>10}{r['cache_mib']:>12.1f}{r['bytes_per_member']:>14.0f}"
+              f"{r['rss_mib']:>10.1f}{r['seconds']:>10.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
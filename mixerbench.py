@@ -0,0 +1,88 @@
+"""Measures how many frames per second MixerSource mixes.
+
+Every source is a PCMAudio over generated 16-bit 48KHz stereo PCM, one of them
+ducking the others. A frame has to be mixed well within the 20ms it plays for,
+next to opus encoding and sending it, so the results are also given as the
+share of that budget one frame takes.
+
+    python mixerbench.py
+    python mixerbench.py --sources 2 4 8 16 --seconds 30
+    python mixerbench.py --history mixer_history.jsonl
+
+Uses NumPy if it is installed, --audioop forces the fallback.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord import player
+from discord.opus import Encoder
+
+BUDGET = Encoder.FRAME_LENGTH / 1000
+
+
+def make_sources(count, frames):
+    pcm = os.urandom(Encoder.FRAME_SIZE * frames)
+    return [discord.PCMAudio(io.BytesIO(pcm)) for _ in range(count)]
+
+
+def measure(count, frames, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        sources = make_sources(count, frames)
+        mixer = discord.MixerSource(keep_alive=False)
+        for index, source in enumerate(sources):
+            # a callout over music, with changing volumes to exercise the ramps
+            mixer.add(source, volume=0.5 + index / count, duck=index == 0)
+
+        mixed = 0
+        start = time.perf_counter()
+        while mixer.read():
+            mixed += 1
+        best = min(best, time.perf_counter() - start)
+        assert mixed == frames
+    per_frame = best / frames
+    return {
+        "frames": frames,
+        "frames_per_sec": frames / best,
+        "usec_per_frame": per_frame * 1e6,
+        "budget_percent": per_frame / BUDGET * 100,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, nargs="+", default=[2, 4, 8, 16])
+    parser.add_argument("--seconds", type=int, default=20, help="seconds of audio per source")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds, the best one is reported")
+    parser.add_argument("--audioop", action="store_true", help="mix with audioop even if NumPy is installed")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    if args.audioop:
+        player.HAS_NUMPY = False
+    backend = "numpy" if player.HAS_NUMPY else "audioop"
+    frames = args.seconds * 1000 // Encoder.FRAME_LENGTH
+    results = {count: measure(count, frames, args.rounds) for count in args.sources}
+
+    print(f"backend: {backend}")
+    print(f"{'sources':>8}{'frames/sec':>14}{'usec/frame':>14}{'% of 20ms':>12}")
+    for count, r in results.items():
+        print(f"{count:>8}{r['frames_per_sec']:>14.0f}{r['usec_per_frame']:>14.1f}{r['budget_percent']:>12.2f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "backend": backend, "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Measures message events against a full message cache.
+
+A client with max_messages set to the requested size is filled through
+MESSAGE_CREATE events, then edits and deletes of random cached messages are
+parsed and Client.cached_messages is read. Compared are:
+
+- the deque with linear scans the cache used to be
+- MessageCache, keyed by message id
+
+    python msgcachebench.py
+    python msgcachebench.py --messages 100000 --events 5000
+    python msgcachebench.py --history msgcache_history.jsonl
+
+Results per cache: microseconds per MESSAGE_CREATE, MESSAGE_UPDATE,
+MESSAGE_DELETE and per cached_messages access.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord import utils
+from gatewaybench import TIMESTAMP, guild_create, make_websocket, message
+
+
+class ScanningCache:
+    # what ConnectionState used before MessageCache
+    def __init__(self, max_messages):
+        self._messages = deque(maxlen=max_messages)
+
+    def __len__(self):
+        return len(self._messages)
+
+    def __iter__(self):
+        return iter(self._messages)
+
+    def __getitem__(self, index):
+        return self._messages[index]
+
+    def get(self, message_id):
+        return utils.find(lambda m: m.id == message_id, reversed(self._messages))
+
+    def append(self, message):
+        self._messages.append(message)
+
+    def pop(self, message_id):
+        found = self.get(message_id)
+        if found is not None:
+            self._messages.remove(found)
+        return found
+
+    def values(self):
+        return list(self._messages)
+
+
+def timed(func, items):
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+async def measure(cache, args):
+    client = discord.Client(intents=discord.Intents.all(), chunk_guilds_at_startup=False,
+                            max_messages=args.messages)
+    make_websocket(client, asyncio.get_running_loop())
+    state = client._connection
+    if cache is not None:
+        state._messages = cache(args.messages)
+    guild_id = 1 << 32
+    state.parse_guild_create(guild_create(guild_id, 250))
+
+    rng = random.Random(0)
+    first = 1 << 40
+    creates = [message(guild_id, first + n, guild_id + 1000 + n % 250) for n in range(args.messages)]
+    targets = rng.sample(range(first, first + args.messages), 2 * args.events)
+    updates = [
+        {"id": str(message_id), "channel_id": str(guild_id + 1), "guild_id": str(guild_id),
+         "content": "!roll 20", "edited_timestamp": TIMESTAMP}
+        for message_id in targets[:args.events]
+    ]
+    deletes = [
+        {"id": str(message_id), "channel_id": str(guild_id + 1), "guild_id": str(guild_id)}
+        for message_id in targets[args.events:]
+    ]
+
+    result = {
+        "usec_per_create": timed(state.parse_message_create, creates),
+        "usec_per_update": timed(state.parse_message_update, updates),
+        "usec_per_delete": timed(state.parse_message_delete, deletes),
+        "usec_per_cached_messages": timed(lambda _: client.cached_messages[-1], range(args.events)),
+    }
+    assert len(state._messages) == args.messages - args.events
+    await client.close()
+    return result
+
+
+async def run(args):
+    return {
+        name: await measure(cache, args)
+        for name, cache in (("deque scan", ScanningCache), ("MessageCache", None))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100000, help="max_messages, the cache is filled to it")
+    parser.add_argument("--events", type=int, default=1000, help="edits and deletes each")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{'cache':<14}{'usec/create':>13}{'usec/update':>13}{'usec/delete':>13}{'usec/cached_messages':>22}")
+    for name, r in results.items():
+        print(f"{name:<14}{r['usec_per_create']:>13.1f}{r['usec_per_update']:>13.1f}{r['usec_per_delete']:>13.1f}"
+              f"{r['usec_per_cached_messages']:>22.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Checks that the HTTP client stays within the rate limits of a local stand-in for the Discord API.
+
+The stand-in server enforces Discord-style rate limit buckets: every route it
+serves answers with the same X-RateLimit-Bucket hash, so the routes share one
+limit per channel, and requests over the limit get a 429. Bursts of concurrent
+requests are sent through HTTPClient over all routes of a few channels, the
+first burst before any bucket is known to the client:
+
+- no request was answered with a 429
+- every request succeeded
+
+    python ratelimittest.py
+    python ratelimittest.py --channels 3 --requests 200 --limit 5 --per 1
+    python ratelimittest.py --history ratelimit_history.jsonl
+
+Also reports the requests per second reached.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import aiohttp
+from aiohttp import web
+
+import discord
+from discord.http import HTTPClient, Route
+
+ROUTES = (
+    ("GET", "/channels/{channel_id}/pins"),
+    ("GET", "/channels/{channel_id}/messages/{message_id}"),
+    ("GET", "/channels/{channel_id}/messages/{message_id}/threads"),
+)
+
+
+class StandIn:
+    def __init__(self, limit, per, latency):
+        self.limit = limit
+        self.per = per
+        self.latency = latency
+        self.buckets = {}
+        self.requests = 0
+        self.rate_limited = 0
+
+    def json(self, data, status=200, headers=None):
+        # plain application/json, the way Discord sends it
+        return web.Response(
+            body=json.dumps(data).encode(), status=status, headers=headers, content_type="application/json"
+        )
+
+    async def handle(self, request):
+        self.requests += 1
+        channel_id = request.match_info["channel_id"]
+        await asyncio.sleep(self.latency)
+
+        now = time.time()
+        reset, used = self.buckets.get(channel_id, (now + self.per, 0))
+        if now >= reset:
+            reset, used = now + self.per, 0
+        headers = {
+            "X-RateLimit-Bucket": "6ab5c2b3d8a1",
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Reset": f"{reset:.3f}",
+            "X-RateLimit-Reset-After": f"{reset - now:.3f}",
+        }
+        if used >= self.limit:
+            self.rate_limited += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            headers["Via"] = "1.1 google"
+            return self.json(
+                {"message": "You are being rate limited.", "retry_after": reset - now, "global": False},
+                status=429,
+                headers=headers,
+            )
+        used += 1
+        self.buckets[channel_id] = (reset, used)
+        headers["X-RateLimit-Remaining"] = str(self.limit - used)
+        return self.json([], headers=headers)
+
+    async def start(self):
+        app = web.Application()
+        for method, path in ROUTES:
+            app.router.add_route(method, f"/api/v10{path}", self.handle)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+
+async def burst(http, channels, requests):
+    async def one(n):
+        method, path = ROUTES[n % len(ROUTES)]
+        route = Route(method, path, channel_id=10**17 + n % channels, message_id=10**18 + n)
+        await http.request(route)
+
+    return await asyncio.gather(*(one(n) for n in range(requests)), return_exceptions=True)
+
+
+async def run(args):
+    server = StandIn(args.limit, args.per, args.latency)
+    port = await server.start()
+    Route.base = f"http://127.0.0.1:{port}/api/v10"
+    # unsync_clock=False waits on X-RateLimit-Reset, like the stand-in's clock
+    http = HTTPClient(unsync_clock=False)
+    # what static_login does, without fetching the user
+    http._HTTPClient__session = aiohttp.ClientSession()
+    failures = []
+    try:
+        start = time.perf_counter()
+        results = []
+        for _ in range(args.bursts):
+            results.extend(await burst(http, args.channels, args.requests))
+        elapsed = time.perf_counter() - start
+    finally:
+        await http.close()
+        await server.runner.cleanup()
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if server.rate_limited:
+        failures.append(f"{server.rate_limited} requests were answered with a 429")
+    if errors:
+        failures.append(f"{len(errors)} requests failed, the first with {errors[0]!r}")
+    return failures, {
+        "requests": len(results),
+        "sent": server.requests,
+        "rate_limited": server.rate_limited,
+        "requests_per_sec": len(results) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--requests", type=int, default=60, help="concurrent requests per burst")
+    parser.add_argument("--bursts", type=int, default=2)
+    parser.add_argument("--limit", type=int, default=5, help="requests per bucket and window")
+    parser.add_argument("--per", type=float, default=1.0, help="seconds per window")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the stand-in takes per request")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    failures, results = asyncio.run(run(args))
+    print(f"{'requests':>10}{'sent':>8}{'429s':>8}{'requests/sec':>14}")
+    print(f"{results['requests']:>10}{results['sent']:>8}{results['rate_limited']:>8}{results['requests_per_sec']:>14.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results, "failures": failures}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Measures the application command sync of a bot start against a local stand-in for the Discord API.
+
+The stand-in server answers the command endpoints after a fixed latency and
+keeps the commands registered to every scope, like Discord does between
+restarts. A bot with global commands, commands in a number of guilds and a
+few check_guilds without commands logs in and syncs its commands:
+
+- without a command sync cache, first start against an empty application
+- without a command sync cache, restart with nothing changed
+- with command_sync_cache, first start
+- with command_sync_cache, restart with nothing changed
+
+    python startupbench.py
+    python startupbench.py --guilds 100 --latency 0.1
+    python startupbench.py --history startup_history.jsonl
+
+Results per start: seconds to log in and sync, and the number of requests sent.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+from aiohttp import web
+
+import discord
+from discord.http import Route
+
+APPLICATION_ID = 10**17
+
+
+class StandIn:
+    def __init__(self, latency):
+        self.latency = latency
+        self.scopes = {}
+        self.requests = 0
+        self.next_id = APPLICATION_ID + 1
+
+    def json(self, data):
+        # plain application/json, the way Discord sends it
+        return web.Response(body=json.dumps(data).encode(), content_type="application/json")
+
+    async def me(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return self.json({"id": str(APPLICATION_ID), "username": "Raid", "discriminator": "0000", "avatar": None,
+                          "bot": True})
+
+    async def get_commands(self, request):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return self.json(self.scopes.get(request.match_info.get("guild_id"), []))
+
+    async def put_commands(self, request):
+        self.requests += 1
+        guild_id = request.match_info.get("guild_id")
+        payload = await request.json()
+        await asyncio.sleep(self.latency)
+        commands = []
+        for command in payload:
+            self.next_id += 1
+            command = dict(command, id=str(self.next_id), application_id=str(APPLICATION_ID), version="1")
+            command.setdefault("type", 1)
+            if guild_id is not None:
+                command["guild_id"] = guild_id
+            commands.append(command)
+        self.scopes[guild_id] = commands
+        return self.json(commands)
+
+    async def start(self):
+        app = web.Application()
+        base = "/api/v10/applications/{application_id}"
+        app.router.add_get("/api/v10/users/@me", self.me)
+        app.router.add_get(f"{base}/commands", self.get_commands)
+        app.router.add_put(f"{base}/commands", self.put_commands)
+        app.router.add_get(f"{base}/guilds/{{guild_id}}/commands", self.get_commands)
+        app.router.add_put(f"{base}/guilds/{{guild_id}}/commands", self.put_commands)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+
+def make_bot(args, cache):
+    bot = discord.Bot(command_sync_cache=cache)
+    guild_ids = [10**18 + n for n in range(args.guilds)]
+
+    async def callback(ctx):
+        pass
+
+    for n in range(args.commands):
+        bot.slash_command(name=f"global{n}", description="A global command")(callback)
+    for n in range(args.guild_commands):
+        bot.slash_command(name=f"guild{n}", description="A guild command", guild_ids=guild_ids)(callback)
+    return bot
+
+
+async def start(args, cache):
+    bot = make_bot(args, cache)
+    check_guilds = [2 * 10**18 + n for n in range(args.check_guilds)]
+    try:
+        started = time.perf_counter()
+        await bot.login("bench")
+        await bot.sync_commands(check_guilds=check_guilds)
+        return time.perf_counter() - started
+    finally:
+        await bot.close()
+
+
+async def run(args, directory):
+    results = {}
+    for cached in (False, True):
+        server = StandIn(args.latency)
+        port = await server.start()
+        Route.base = f"http://127.0.0.1:{port}/api/v10"
+        cache = os.path.join(directory, "commands.json") if cached else None
+        try:
+            for when in ("first start", "restart"):
+                sent = server.requests
+                seconds = await start(args, cache)
+                name = f"{'cache' if cached else 'no cache'}, {when}"
+                results[name] = {"seconds": seconds, "requests": server.requests - sent}
+        finally:
+            await server.runner.cleanup()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=20, help="global commands")
+    parser.add_argument("--guilds", type=int, default=50, help="guilds with guild commands")
+    parser.add_argument("--guild-commands", type=int, default=5, help="commands in every one of these guilds")
+    parser.add_argument("--check-guilds", type=int, default=5, help="check_guilds without commands")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the stand-in takes per request")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = asyncio.run(run(args, directory))
+
+    print(f"{'start':<24}{'seconds':>10}{'requests':>10}")
+    for name, r in results.items():
+        print(f"{name:<24}{r['seconds']:>10.2f}{r['requests']:>10}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
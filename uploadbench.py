@@ -0,0 +1,153 @@
+"""Measures large file uploads against a local stand-in for the Discord API.
+
+A temporary file is uploaded as a webhook attachment two ways:
+
+- a FormData holding the open file, rebuilt for every attempt like the upload
+  path used to be
+- discord.File through Webhook.send, which builds the form once and streams
+  the file in large chunks
+
+The stand-in drains the body without keeping it and can fail the first attempt
+of every upload with a 500, so the retry path is measured too.
+
+    python uploadbench.py
+    python uploadbench.py --size 500 --fail-first
+    python uploadbench.py --history upload_history.jsonl
+
+Results per path: seconds, MiB/sec and the peak memory traced during the upload.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import aiohttp
+from aiohttp import web
+
+import discord
+from discord.http import Route
+
+MIB = 1024 * 1024
+WEBHOOK_ID = 10**17
+TOKEN = "t" * 68
+
+
+class StandIn:
+    def __init__(self, fail_first):
+        self.fail_first = fail_first
+        self.requests = 0
+        self.received = 0
+
+    async def execute(self, request):
+        self.requests += 1
+        async for chunk in request.content.iter_chunked(MIB):
+            self.received += len(chunk)
+        if self.fail_first and self.requests % 2:
+            return web.Response(status=500, text="Internal Server Error")
+        return web.Response(status=204)
+
+    async def start(self):
+        app = web.Application(client_max_size=0)
+        app.router.add_post("/api/v10/webhooks/{webhook_id}/{token}", self.execute)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+
+def make_file(directory, size):
+    path = os.path.join(directory, "recording.bin")
+    block = os.urandom(MIB)
+    with open(path, "wb") as fp:
+        for _ in range(size):
+            fp.write(block)
+    return path
+
+
+async def formdata_per_attempt(url, path):
+    async with aiohttp.ClientSession() as session:
+        with open(path, "rb") as fp:
+            # aiohttp closes the file after sending it, discord.File guards against that the same way
+            close, fp.close = fp.close, lambda: None
+            for _ in range(5):
+                fp.seek(0)
+                form = aiohttp.FormData(quote_fields=False)
+                form.add_field("payload_json", json.dumps({"content": "raid log"}))
+                form.add_field("files[0]", fp, filename="recording.bin", content_type="application/octet-stream")
+                async with session.post(url, data=form) as response:
+                    if response.status < 500:
+                        break
+            fp.close = close
+
+
+async def webhook_send(url, path):
+    async with aiohttp.ClientSession() as session:
+        webhook = discord.Webhook.partial(WEBHOOK_ID, TOKEN, session=session)
+        await webhook.send("raid log", file=discord.File(path))
+
+
+async def measure(scenario, path, fail_first):
+    server = StandIn(fail_first)
+    port = await server.start()
+    Route.base = f"http://127.0.0.1:{port}/api/v10"
+    url = f"{Route.base}/webhooks/{WEBHOOK_ID}/{TOKEN}"
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        await scenario(url, path)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        await server.runner.cleanup()
+    return {
+        "seconds": elapsed,
+        "mib_per_sec": server.received / MIB / elapsed,
+        "requests": server.requests,
+        "peak_mib": peak / MIB,
+    }
+
+
+async def run(args, path):
+    return {
+        name: await measure(scenario, path, args.fail_first)
+        for name, scenario in (
+            ("formdata per attempt", formdata_per_attempt),
+            ("webhook send", webhook_send),
+        )
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500, help="MiB to upload")
+    parser.add_argument("--fail-first", action="store_true", help="answer the first attempt of every upload with a 500")
+    parser.add_argument("--directory", help="where to create the temporary file")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        path = make_file(directory, args.size)
+        results = asyncio.run(run(args, path))
+
+    print(f"{'path':<24}{'seconds':>10}{'MiB/sec':>10}{'requests':>10}{'peak MiB':>10}")
+    for name, r in results.items():
+        print(f"{name:<24}{r['seconds']:>10.2f}{r['mib_per_sec']:>10.1f}{r['requests']:>10}{r['peak_mib']:>10.2f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Measures component interaction dispatch with a large number of registered views.
+
+Roll views with three buttons each are added to a ViewStore until it holds the
+requested number of entries, like a raid night of rolls does, and button
+clicks on random messages are dispatched to it. Compared are:
+
+- the integrity sweep over every entry the store used to do per dispatch
+- the indexed store
+
+A few more views are added to and removed from the full store to time those.
+
+    python viewbench.py
+    python viewbench.py --entries 300000 --dispatches 1000
+    python viewbench.py --history view_history.jsonl
+
+Results per store: microseconds per dispatch, per add_view and per remove_view.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord.ui.view import ViewStore
+
+BUTTON = discord.ComponentType.button.value
+
+
+class RollView(discord.ui.View):
+    def __init__(self, roll):
+        super().__init__(timeout=None)
+        for choice in ("Need", "Greed", "Pass"):
+            self.add_item(discord.ui.Button(label=choice, custom_id=f"roll:{roll}:{choice}"))
+        self.dispatched = 0
+
+    def _dispatch_item(self, item, interaction):
+        # the callback task is the same for both stores, only the lookup is measured
+        self.dispatched += 1
+
+
+class SweepingViewStore(ViewStore):
+    def dispatch(self, component_type, custom_id, interaction):
+        # what dispatch and add_view did before the store was indexed
+        self.sweep()
+        super().dispatch(component_type, custom_id, interaction)
+
+    def add_view(self, view, message_id=None):
+        self.sweep()
+        super().add_view(view, message_id)
+
+    def sweep(self):
+        to_remove = [k for k, (view, _) in self._views.items() if view.is_finished()]
+        for k in to_remove:
+            del self._views[k]
+
+
+def measure(store_class, args):
+    rng = random.Random(0)
+    store = store_class(None)
+    views = [RollView(roll) for roll in range(-(-args.entries // 3) + args.operations)]
+    message_ids = [10**18 + roll for roll in range(len(views))]
+
+    # filled without timing, the sweeping add_view is quadratic
+    for view, message_id in zip(views[:-args.operations], message_ids):
+        ViewStore.add_view(store, view, message_id)
+    start = time.perf_counter()
+    for view, message_id in zip(views[-args.operations:], message_ids[-args.operations:]):
+        store.add_view(view, message_id)
+    added = time.perf_counter() - start
+
+    clicks = []
+    for _ in range(args.dispatches):
+        roll = rng.randrange(len(views))
+        clicks.append((f"roll:{roll}:{rng.choice(('Need', 'Greed', 'Pass'))}",
+                       types.SimpleNamespace(message_id=message_ids[roll])))
+    start = time.perf_counter()
+    for custom_id, interaction in clicks:
+        store.dispatch(BUTTON, custom_id, interaction)
+    dispatched = time.perf_counter() - start
+    assert sum(view.dispatched for view in views) == args.dispatches
+
+    start = time.perf_counter()
+    for view in rng.sample(views, args.operations):
+        store.remove_view(view)
+    removed = time.perf_counter() - start
+
+    return {
+        "usec_per_dispatch": dispatched / args.dispatches * 1e6,
+        "usec_per_add": added / args.operations * 1e6,
+        "usec_per_remove": removed / args.operations * 1e6,
+    }
+
+
+async def run(args):
+    # views need a running loop
+    return {
+        name: measure(store_class, args)
+        for name, store_class in (("integrity sweep", SweepingViewStore), ("indexed", ViewStore))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100000, help="registered buttons")
+    parser.add_argument("--dispatches", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=100, help="views added and removed on the full store")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{'store':<18}{'usec/dispatch':>15}{'usec/add':>10}{'usec/remove':>13}")
+    for name, r in results.items():
+        print(f"{name:<18}{r['usec_per_dispatch']:>15.1f}{r['usec_per_add']:>10.1f}{r['usec_per_remove']:>13.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
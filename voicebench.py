@@ -0,0 +1,119 @@
+"""Measures how fast received voice packets are parsed and decrypted.
+
+Encrypted RTP packets are generated for a number of speakers and fed through
+VoiceClient.unpack_audio, which builds the RawData (header parsing and
+decryption) for every packet. Opus decoding is left out, the decoder only
+counts the frames it receives. Requires PyNaCl.
+
+    python voicebench.py
+    python voicebench.py --speakers 25 --seconds 60 --mode xsalsa20_poly1305_lite
+    python voicebench.py --history voice_history.jsonl
+
+Results per mode: packets/sec and allocated blocks still alive per packet.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+from discord.voice_client import VoiceClient
+
+try:
+    import nacl.secret
+    import nacl.utils
+except ImportError:
+    sys.exit("PyNaCl is required to run the voice benchmark.")
+
+MODES = ("xsalsa20_poly1305", "xsalsa20_poly1305_suffix", "xsalsa20_poly1305_lite")
+# a 20ms opus frame at 64kbps and the one-byte header extension discord adds
+PAYLOAD = os.urandom(160)
+EXTENSION = b"\xbe\xde\x00\x01" + os.urandom(4)
+
+
+class CountingDecoder:
+    def __init__(self):
+        self.frames = 0
+
+    def decode(self, data):
+        self.frames += 1
+
+
+def make_client(mode):
+    client = VoiceClient(discord.Client(), None)
+    client.mode = mode
+    client.secret_key = list(os.urandom(32))
+    client.decoder = CountingDecoder()
+    return client
+
+
+def generate_packets(client, speakers, frames):
+    packets = []
+    for seq in range(frames):
+        for speaker in range(speakers):
+            client.sequence = seq & 0xFFFF
+            client.timestamp = seq * 960 & 0xFFFFFFFF
+            client.ssrc = 1000 + speaker
+            packets.append(client._get_voice_packet(EXTENSION + PAYLOAD))
+    return packets
+
+
+def measure(mode, speakers, frames, rounds):
+    client = make_client(mode)
+    packets = generate_packets(client, speakers, frames)
+    # received into a reused buffer like VoiceClient.recv_audio does
+    buffer = bytearray(4096)
+    view = memoryview(buffer)
+    sizes = [len(packet) for packet in packets]
+
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for packet, size in zip(packets, sizes):
+            buffer[:size] = packet
+            client.unpack_audio(view[:size])
+        best = min(best, time.perf_counter() - start)
+
+    blocks = sys.getallocatedblocks()
+    for packet, size in zip(packets, sizes):
+        buffer[:size] = packet
+        client.unpack_audio(view[:size])
+    blocks = sys.getallocatedblocks() - blocks
+
+    assert client.decoder.frames == len(packets) * (rounds + 1)
+    return {
+        "packets": len(packets),
+        "packets_per_sec": len(packets) / best,
+        "blocks_per_packet": blocks / len(packets),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speakers", type=int, default=25)
+    parser.add_argument("--seconds", type=int, default=20, help="seconds of audio per speaker")
+    parser.add_argument("--mode", choices=MODES, action="append", help="modes to measure, defaults to all")
+    parser.add_argument("--rounds", type=int, default=3, help="timing rounds, the best one is reported")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    frames = args.seconds * 50
+    results = {mode: measure(mode, args.speakers, frames, args.rounds) for mode in args.mode or MODES}
+
+    print(f"{'mode':<28}{'packets':>10}{'packets/sec':>14}{'blocks/packet':>15}")
+    for mode, r in results.items():
+        print(f"{mode:<28}{r['packets']:>10}{r['packets_per_sec']:>14.0f}{r['blocks_per_packet']:>15.2f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measures Client.dispatch with many pending wait_for waiters.
+
+Every waiter waits for a click on its own roll button, like a bot waiting on
+thousands of roll messages at once, and interaction events for random buttons
+are dispatched. Compared are:
+
+- waiters with a check predicate, which dispatch evaluates one by one
+- waiters indexed by custom_id
+
+A few unrelated events are dispatched too, to show what the waiters cost
+events nobody waits for.
+
+    python waitbench.py
+    python waitbench.py --waiters 10000 --dispatches 2000
+    python waitbench.py --history wait_history.jsonl
+
+Results per waiter kind: microseconds per matching interaction dispatch and
+per unrelated dispatch.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import discord
+
+
+def click(custom_id):
+    # only what the interaction keys and the checks read
+    return types.SimpleNamespace(channel_id=1, message_id=2, custom_id=custom_id)
+
+
+async def measure(keyed, args):
+    client = discord.Client()
+    rng = random.Random(0)
+    custom_ids = [f"roll:{n}" for n in range(args.waiters)]
+    waiters = []
+    for custom_id in custom_ids:
+        if keyed:
+            coro = client.wait_for("interaction", custom_id=custom_id)
+        else:
+            coro = client.wait_for("interaction", check=lambda i, c=custom_id: i.custom_id == c)
+        # wait_for registers the waiter right away, the task only awaits it
+        waiters.append(asyncio.ensure_future(coro))
+
+    clicks = [click(custom_id) for custom_id in rng.sample(custom_ids, args.dispatches)]
+    start = time.perf_counter()
+    for interaction in clicks:
+        client.dispatch("interaction", interaction)
+    matching = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for n in range(args.dispatches):
+        client.dispatch("interaction", click(f"other:{n}"))
+    unrelated = time.perf_counter() - start
+
+    await asyncio.sleep(0)
+    resolved = sum(waiter.done() for waiter in waiters)
+    assert resolved == args.dispatches, resolved
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await client.close()
+    return {
+        "usec_per_matching_dispatch": matching / args.dispatches * 1e6,
+        "usec_per_unrelated_dispatch": unrelated / args.dispatches * 1e6,
+    }
+
+
+async def run(args):
+    return {
+        name: await measure(keyed, args)
+        for name, keyed in (("check predicate", False), ("custom_id", True))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--waiters", type=int, default=10000)
+    parser.add_argument("--dispatches", type=int, default=1000)
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"{'waiters':<18}{'usec/matching':>15}{'usec/unrelated':>16}")
+    for name, r in results.items():
+        print(f"{name:<18}{r['usec_per_matching_dispatch']:>15.1f}{r['usec_per_unrelated_dispatch']:>16.1f}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
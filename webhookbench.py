@@ -0,0 +1,174 @@
+"""Measures webhook throughput against a local stand-in for the Discord API.
+
+The stand-in server answers webhook executions after a fixed latency and
+enforces a per-webhook rate limit with the usual X-RateLimit headers and 429
+responses. The same messages are sent to every webhook three ways:
+
+- one session per send, one webhook after the other, as is common in bots
+- one shared session, one webhook after the other
+- WebhookBroadcaster, all webhooks concurrently over one pooled session
+
+    python webhookbench.py
+    python webhookbench.py --webhooks 20 --messages 10 --latency 0.08
+    python webhookbench.py --history webhook_history.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Lib", "site-packages"))
+
+import aiohttp
+from aiohttp import web
+
+import discord
+from discord.http import Route
+
+
+class StandIn:
+    def __init__(self, latency, limit, per):
+        self.latency = latency
+        self.limit = limit
+        self.per = per
+        self.buckets = {}
+        self.requests = 0
+        self.rate_limited = 0
+
+    def json(self, data, status=200, headers=None):
+        # plain application/json, the way Discord sends it
+        return web.Response(
+            body=json.dumps(data).encode(), status=status, headers=headers, content_type="application/json"
+        )
+
+    def message(self, webhook_id):
+        return {
+            "id": str(10**18 + self.requests), "channel_id": "1", "webhook_id": webhook_id, "content": "",
+            "author": {"id": webhook_id, "username": "Raid", "discriminator": "0000", "avatar": None},
+            "timestamp": "2024-01-01T00:00:00.000000+00:00", "edited_timestamp": None, "tts": False,
+            "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [],
+            "embeds": [], "pinned": False, "type": 0,
+        }
+
+    async def execute(self, request):
+        self.requests += 1
+        webhook_id = request.match_info["webhook_id"]
+        await request.read()
+        await asyncio.sleep(self.latency)
+
+        now = time.monotonic()
+        reset, used = self.buckets.get(webhook_id, (now + self.per, 0))
+        if now >= reset:
+            reset, used = now + self.per, 0
+        if used >= self.limit:
+            self.rate_limited += 1
+            retry_after = reset - now
+            return self.json(
+                {"message": "You are being rate limited.", "retry_after": retry_after, "global": False},
+                status=429,
+                headers={"Via": "1.1 google", "Retry-After": str(retry_after)},
+            )
+        used += 1
+        self.buckets[webhook_id] = (reset, used)
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.limit - used),
+            "X-RateLimit-Reset-After": f"{reset - now:.3f}",
+        }
+        if request.query.get("wait") in ("1", "true"):
+            return self.json(self.message(webhook_id), headers=headers)
+        return web.Response(status=204, headers=headers)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/api/v10/webhooks/{webhook_id}/{token}", self.execute)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+
+def webhook_ids(count):
+    return [(1000 + n, f"token{n}") for n in range(count)]
+
+
+async def session_per_send(ids, messages):
+    for message in range(messages):
+        for webhook_id, token in ids:
+            async with aiohttp.ClientSession() as session:
+                await discord.Webhook.partial(webhook_id, token, session=session).send(f"summary {message}")
+
+
+async def shared_session(ids, messages):
+    async with aiohttp.ClientSession() as session:
+        webhooks = [discord.Webhook.partial(webhook_id, token, session=session) for webhook_id, token in ids]
+        for message in range(messages):
+            for webhook in webhooks:
+                await webhook.send(f"summary {message}")
+
+
+async def broadcaster(ids, messages):
+    async with discord.WebhookBroadcaster(max_concurrency=len(ids)) as broadcast:
+        for webhook_id, token in ids:
+            broadcast.add(discord.Webhook.partial(webhook_id, token, session=None))
+        for message in range(messages):
+            for result in await broadcast.send(f"summary {message}"):
+                if isinstance(result, BaseException):
+                    raise result
+
+
+async def run(args):
+    results = {}
+    for name, scenario in (
+        ("session per send", session_per_send),
+        ("shared session", shared_session),
+        ("broadcaster", broadcaster),
+    ):
+        server = StandIn(args.latency, args.limit, args.per)
+        port = await server.start()
+        Route.base = f"http://127.0.0.1:{port}/api/v10"
+        try:
+            start = time.perf_counter()
+            await scenario(webhook_ids(args.webhooks), args.messages)
+            elapsed = time.perf_counter() - start
+        finally:
+            await server.runner.cleanup()
+        sent = args.webhooks * args.messages
+        results[name] = {
+            "seconds": elapsed,
+            "messages_per_sec": sent / elapsed,
+            "requests": server.requests,
+            "rate_limited": server.rate_limited,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--webhooks", type=int, default=10)
+    parser.add_argument("--messages", type=int, default=8, help="messages sent to every webhook")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the stand-in takes per request")
+    parser.add_argument("--limit", type=int, default=5, help="requests per webhook per rate limit window")
+    parser.add_argument("--per", type=float, default=2.0, help="seconds of a rate limit window")
+    parser.add_argument("--history", help="append the results as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"{'scenario':<20}{'seconds':>10}{'messages/sec':>14}{'requests':>10}{'429s':>7}")
+    for name, r in results.items():
+        print(f"{name:<20}{r['seconds']:>10.2f}{r['messages_per_sec']:>14.1f}{r['requests']:>10}{r['rate_limited']:>7}")
+
+    if args.history:
+        record = {"time": time.time(), "python": sys.version.split()[0], "discord": discord.__version__,
+                  "settings": vars(args), "results": results}
+        with open(args.history, "a", encoding="utf-8") as fp:
+            fp.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()